@@ -4,6 +4,7 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.user import User
+from app.services.data_loader import DataLoader
 from app.utils.security import decode_token
 
 security = HTTPBearer()
@@ -36,4 +37,12 @@ def get_current_user(
             detail="Usuario no encontrado"
         )
 
-    return user
\ No newline at end of file
+    return user
+
+
+def get_loader(
+        current_user: User = Depends(get_current_user),
+        db: Session = Depends(get_db)
+) -> DataLoader:
+    """Un DataLoader por petición (FastAPI reutiliza la dependencia dentro de la misma petición)"""
+    return DataLoader(db, current_user.id)
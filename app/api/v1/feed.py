@@ -1,10 +1,13 @@
+from typing import Optional
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from app.database import get_db
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, get_loader
 from app.models.user import User
-from app.schemas.feed import FeedResponse
+from app.schemas.feed import FeedResponse, NewActivityCount
 from app.services.feed_service import FeedService
+from app.services.data_loader import DataLoader
+from app.services.timeline_service import TimelineService
 
 router = APIRouter()
 
@@ -13,13 +16,60 @@ router = APIRouter()
 async def get_global_feed(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=50),
+    cursor: Optional[str] = Query(None, description="next_cursor de la página anterior"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    loader: DataLoader = Depends(get_loader)
+):
+    """
+    Obtener feed global con toda la actividad de la comunidad.
+    Para seguir scrolleando pasar el `next_cursor` de la respuesta anterior.
+    """
+    return await FeedService.get_global_feed(db, page, limit, current_user.id, cursor, loader)
+
+
+@router.get("/new-count", response_model=NewActivityCount)
+def get_new_activity_count(
+    since: Optional[str] = Query(None, description="latest_cursor de la primera página"),
+    scope: str = Query("global", pattern="^(global|home)$"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Obtener feed global con toda la actividad de la comunidad
+    Cuántas actividades nuevas hay desde `since`, sin descargar el feed.
+    Sirve para mostrar "N nuevas" y recargar solo cuando hace falta.
+    """
+    if scope == "home":
+        return TimelineService.count_new(db, current_user.id, since)
+    return FeedService.count_new(db, since)
+
+
+@router.get("/hot", response_model=FeedResponse)
+async def get_hot_feed(
+    limit: int = Query(20, ge=1, le=50),
+    cursor: Optional[str] = Query(None, description="next_cursor de la página anterior"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    loader: DataLoader = Depends(get_loader)
+):
+    """
+    Obtener el feed "hot": actividad con más likes y comentarios recientes primero
     """
-    return await FeedService.get_global_feed(db, page, limit, current_user.id)
+    return await FeedService.get_hot_feed(db, limit, current_user.id, cursor, loader)
+
+
+@router.get("/home", response_model=FeedResponse)
+async def get_home_feed(
+    limit: int = Query(20, ge=1, le=50),
+    cursor: Optional[str] = Query(None, description="next_cursor de la página anterior"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+    loader: DataLoader = Depends(get_loader)
+):
+    """
+    Obtener el timeline home: actividad de los usuarios que sigo y la mía
+    """
+    return await TimelineService.get_home_feed(db, current_user.id, limit, cursor, loader)
 
 
 @router.get("/user/{user_id}", response_model=FeedResponse)
@@ -27,23 +77,27 @@ async def get_user_feed(
     user_id: int,
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=50),
+    cursor: Optional[str] = Query(None, description="next_cursor de la página anterior"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user),
+    loader: DataLoader = Depends(get_loader)
 ):
     """
     Obtener feed de actividad de un usuario específico
     """
-    return await FeedService.get_user_feed(db, current_user.id, page, limit, current_user.id)
+    return await FeedService.get_user_feed(db, user_id, page, limit, current_user.id, cursor, loader)
 
 
 @router.get("/me", response_model=FeedResponse)
 async def get_my_feed(
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=50),
+    cursor: Optional[str] = Query(None, description="next_cursor de la página anterior"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    loader: DataLoader = Depends(get_loader)
 ):
     """
     Obtener mi feed personal
     """
-    return await FeedService.get_user_feed(db, current_user.id, page, limit)
\ No newline at end of file
+    return await FeedService.get_user_feed(db, current_user.id, page, limit, cursor=cursor, loader=loader)
\ No newline at end of file
@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
 from typing import List
 from app.database import get_db
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, get_loader
 from app.models.user import User
 from app.schemas.interaction import (
     LikeCreate,
@@ -12,6 +12,7 @@ from app.schemas.interaction import (
     InteractionStats
 )
 from app.services.interaction_service import InteractionService
+from app.services.data_loader import DataLoader
 from app.services.notification_helpers import notify_on_like
 
 router = APIRouter()
@@ -90,7 +91,8 @@ def get_comments(
         skip: int = Query(0, ge=0),
         limit: int = Query(50, ge=1, le=100),
         current_user: User = Depends(get_current_user),
-        db: Session = Depends(get_db)
+        db: Session = Depends(get_db),
+        loader: DataLoader = Depends(get_loader)
 ):
     """Obtener comentarios de un objeto"""
     return InteractionService.get_comments(
@@ -99,7 +101,8 @@ def get_comments(
         target_id,
         current_user.id,
         skip,
-        limit
+        limit,
+        loader
     )
 
 
@@ -109,7 +112,8 @@ def get_comment_replies(
         skip: int = Query(0, ge=0),
         limit: int = Query(20, ge=1, le=50),
         current_user: User = Depends(get_current_user),
-        db: Session = Depends(get_db)
+        db: Session = Depends(get_db),
+        loader: DataLoader = Depends(get_loader)
 ):
     """Obtener respuestas de un comentario"""
     return InteractionService.get_comment_replies(
@@ -117,7 +121,8 @@ def get_comment_replies(
         comment_id,
         current_user.id,
         skip,
-        limit
+        limit,
+        loader
     )
 
 
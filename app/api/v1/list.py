@@ -1,31 +1,37 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from sqlalchemy.orm import Session
 from typing import List
 from app.database import get_db
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, get_loader
 from app.models.user import User
 from app.schemas.list import ListCreate, ListUpdate, ListResponse, ListDetailResponse
 from app.services.list_service import ListService
+from app.services.movie_catalog_service import MovieCatalogService
+from app.services.timeline_service import TimelineService
+from app.services.data_loader import DataLoader
 
 router = APIRouter()
 
 @router.post("/", response_model=ListResponse)
 def create_list(
     list_data: ListCreate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Crear nueva lista"""
     new_list = ListService.create_list(db, current_user.id, list_data)
+    background_tasks.add_task(TimelineService.fan_out, "list_created", new_list.id)
     return {**new_list.__dict__, "movies_count": 0}
 
 @router.get("/", response_model=List[ListResponse])
 def get_my_lists(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    loader: DataLoader = Depends(get_loader)
 ):
     """Obtener mis listas"""
-    return ListService.get_user_lists(db, current_user.id)
+    return ListService.get_user_lists(db, current_user.id, loader)
 
 @router.get("/{list_id}", response_model=ListDetailResponse)
 def get_list_detail(
@@ -61,11 +67,13 @@ def delete_list(
 def add_movie_to_list(
     list_id: int,
     movie_tmdb_id: int,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Agregar película a lista"""
     ListService.add_movie_to_list(db, list_id, current_user.id, movie_tmdb_id)
+    background_tasks.add_task(MovieCatalogService.hydrate_movies, [movie_tmdb_id])
     return {"message": "Película agregada a la lista"}
 
 @router.delete("/{list_id}/movies/{movie_tmdb_id}")
@@ -1,44 +1,86 @@
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Request, Response
 from typing import Optional
-from app.services.tmdb_service import TMDBService
+from app.services.tmdb_service import TMDBService, CachedResponse
+from app.services.cache_warmer_service import CacheWarmerService
+from app.services.movie_search_service import MovieSearchService
+from app.services.feed_service import FeedService
+from app.utils.http_cache import conditional_response, json_response
 
 router = APIRouter()
 
+# Cache-Control por tipo de contenido (más corto que el TTL de la caché del servidor)
+CACHE_DETAILS = "public, max-age=3600, stale-while-revalidate=86400"
+CACHE_LISTS = "public, max-age=600, stale-while-revalidate=1800"
+CACHE_SEARCH = "public, max-age=120"
+
+
+def _passthrough(request: Request, cached: CachedResponse, cache_control: str) -> Response:
+    """Reenviar el JSON de TMDB tal cual (sin parsear ni re-serializar), o 304 si no cambió"""
+    return conditional_response(
+        request,
+        cached.body,
+        cache_control,
+        etag=cached.etag if cached.is_success else None,
+        last_modified=cached.stored_at,
+        status_code=cached.status_code
+    )
+
 @router.get("/search")
 async def search_movies(
+    request: Request,
     query: str = Query(..., min_length=1),
     page: int = Query(1, ge=1)
 ):
     """Buscar películas"""
-    results = await TMDBService.search_movies(query, page)
-    return results
+    cached = await TMDBService.get_response("search", query=query, page=page)
+    return _passthrough(request, cached, CACHE_SEARCH)
+
+@router.get("/autocomplete")
+async def autocomplete_movies(
+    request: Request,
+    query: str = Query(..., min_length=1),
+    limit: int = Query(10, ge=1, le=20)
+):
+    """Sugerencias de películas mientras se escribe"""
+    results = await MovieSearchService.autocomplete(query, limit)
+    return json_response(request, results, CACHE_SEARCH)
+
+@router.get("/cache/stats")
+def get_cache_stats():
+    """Estadísticas de la caché de TMDB de este worker"""
+    return {
+        **TMDBService.cache_stats(),
+        "warmer": CacheWarmerService.last_run,
+        "search": MovieSearchService.stats(),
+        "feed": FeedService.cache_stats()
+    }
 
 @router.get("/details/{movie_id}")
-async def get_movie_details(movie_id: int):
+async def get_movie_details(request: Request, movie_id: int):
     """Obtener detalles de una película"""
-    movie = await TMDBService.get_movie_details(movie_id)
-    return movie
+    cached = await TMDBService.get_movie_response(movie_id)
+    return _passthrough(request, cached, CACHE_DETAILS)
 
 @router.get("/popular")
-async def get_popular_movies(page: int = Query(1, ge=1)):
+async def get_popular_movies(request: Request, page: int = Query(1, ge=1)):
     """Obtener películas populares"""
-    results = await TMDBService.get_popular_movies(page)
-    return results
+    cached = await TMDBService.get_response("popular", page=page)
+    return _passthrough(request, cached, CACHE_LISTS)
 
 @router.get("/trending")
-async def get_trending_movies(time_window: str = Query("week", regex="^(day|week)$")):
+async def get_trending_movies(request: Request, time_window: str = Query("week", regex="^(day|week)$")):
     """Obtener películas en tendencia"""
-    results = await TMDBService.get_trending_movies(time_window)
-    return results
+    cached = await TMDBService.get_response("trending", time_window=time_window)
+    return _passthrough(request, cached, CACHE_LISTS)
 
 @router.get("/top-rated")
-async def get_top_rated_movies(page: int = Query(1, ge=1)):
+async def get_top_rated_movies(request: Request, page: int = Query(1, ge=1)):
     """Obtener películas mejor calificadas"""
-    results = await TMDBService.get_top_rated_movies(page)
-    return results
+    cached = await TMDBService.get_response("top_rated", page=page)
+    return _passthrough(request, cached, CACHE_LISTS)
 
 @router.get("/now-playing")
-async def get_now_playing(page: int = Query(1, ge=1)):
+async def get_now_playing(request: Request, page: int = Query(1, ge=1)):
     """Obtener películas en cartelera"""
-    results = await TMDBService.get_now_playing(page)
-    return results
\ No newline at end of file
+    cached = await TMDBService.get_response("now_playing", page=page)
+    return _passthrough(request, cached, CACHE_LISTS)
@@ -3,10 +3,11 @@ from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List
 from app.database import get_db
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, get_loader
 from app.models.user import User
 from app.schemas.notification import NotificationResponse, NotificationUpdate, NotificationStats
 from app.services.notification_service import NotificationService
+from app.services.data_loader import DataLoader
 from app.utils.security import decode_token
 from app.models.user import User
 from fastapi import Query
@@ -24,7 +25,8 @@ def get_notifications(
         limit: int = 20,
         unread_only: bool = False,
         current_user: User = Depends(get_current_user),
-        db: Session = Depends(get_db)
+        db: Session = Depends(get_db),
+        loader: DataLoader = Depends(get_loader)
 ):
     """Obtener notificaciones del usuario"""
     notifications = NotificationService.get_user_notifications(
@@ -35,9 +37,13 @@ def get_notifications(
         unread_only=unread_only
     )
 
-    # Formatear respuesta con datos del actor
+    # Formatear respuesta con datos del actor (todos los actores en una consulta)
+    loader.want_users(notif.actor_id for notif in notifications)
+    loader.load()
+
     result = []
     for notif in notifications:
+        actor = loader.user(notif.actor_id)
         notif_dict = {
             "id": notif.id,
             "user_id": notif.user_id,
@@ -51,10 +57,10 @@ def get_notifications(
             "is_read": notif.is_read,
             "created_at": notif.created_at.isoformat(),
             "actor": {
-                "id": notif.actor.id,
-                "username": notif.actor.username,
-                "full_name": notif.actor.full_name,
-                "email": notif.actor.email
+                "id": actor.id,
+                "username": actor.username,
+                "full_name": actor.full_name,
+                "email": actor.email
             }
         }
         result.append(notif_dict)
@@ -121,6 +127,7 @@ async def notification_stream(
 ):
     """
     Endpoint SSE para notificaciones en tiempo real.
+    También emite eventos `feed_update` cuando hay actividad nueva en el feed.
 
     NOTA: EventSource no soporta headers personalizados, por eso el token
     se envía como query parameter.
@@ -150,7 +157,11 @@ async def notification_stream(
 
                 try:
                     notification = await asyncio.wait_for(queue.get(), timeout=30.0)
-                    yield f"data: {json.dumps(notification)}\n\n"
+                    if "event" in notification:
+                        # Eventos con nombre (p. ej. feed_update): addEventListener en el cliente
+                        yield f"event: {notification['event']}\ndata: {json.dumps(notification)}\n\n"
+                    else:
+                        yield f"data: {json.dumps(notification)}\n\n"
                 except asyncio.TimeoutError:
                     yield f": heartbeat\n\n"
 
@@ -1,25 +1,40 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.orm import Session
 from typing import Optional
 from app.database import get_db
 from app.services.ranking_service import RankingService
+from app.services.tmdb_service import TMDBService
+from app.utils.http_cache import json_response, make_etag, is_not_modified, not_modified_response
 
 router = APIRouter()
 
+# Cache-Control por ranking: los de TMDB cambian poco, los de usuarios con cada calificación
+CACHE_TMDB = "public, max-age=600, stale-while-revalidate=1800"
+CACHE_USERS = "public, max-age=60"
+
 
 @router.get("/tmdb/top-rated")
 async def get_tmdb_top_rated(
+    request: Request,
     page: int = Query(1, ge=1, le=500),
     limit: int = Query(20, ge=1, le=100)
 ):
     """
     Ranking de películas mejor calificadas según TMDB
     """
-    return await RankingService.get_tmdb_top_rated(page, limit)
+    # El ranking se deriva de la respuesta de TMDB en caché: si esa no cambió, tampoco el ranking
+    source = await TMDBService.get_response("top_rated", page=page)
+    etag = make_etag("tmdb/top-rated", source.etag, page, limit)
+    if is_not_modified(request, etag, source.stored_at):
+        return not_modified_response(etag, CACHE_TMDB, source.stored_at)
+
+    data = await RankingService.get_tmdb_top_rated(page, limit)
+    return json_response(request, data, CACHE_TMDB, etag=etag, last_modified=source.stored_at)
 
 
 @router.get("/users/top-rated")
 def get_users_top_rated(
+    request: Request,
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
     min_ratings: int = Query(5, ge=1, description="Mínimo de calificaciones requeridas"),
@@ -28,11 +43,13 @@ def get_users_top_rated(
     """
     Ranking de películas mejor calificadas por usuarios de Cineminha
     """
-    return RankingService.get_users_top_rated(db, page, limit, min_ratings)
+    data = RankingService.get_users_top_rated(db, page, limit, min_ratings)
+    return json_response(request, data, CACHE_USERS)
 
 
 @router.get("/combined")
 async def get_combined_ranking(
+    request: Request,
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
     min_ratings: int = Query(3, ge=1),
@@ -41,21 +58,30 @@ async def get_combined_ranking(
     """
     Ranking combinado: muestra datos de TMDB y usuarios
     """
-    return await RankingService.get_combined_ranking(db, page, limit, min_ratings)
+    data = await RankingService.get_combined_ranking(db, page, limit, min_ratings)
+    return json_response(request, data, CACHE_USERS)
 
 
 @router.get("/trending")
 async def get_trending_this_week(
+    request: Request,
     page: int = Query(1, ge=1)
 ):
     """
     Películas en tendencia esta semana según TMDB
     """
-    return await RankingService.get_trending_this_week(page)
+    source = await TMDBService.get_response("trending", time_window="week")
+    etag = make_etag("trending", source.etag, page)
+    if is_not_modified(request, etag, source.stored_at):
+        return not_modified_response(etag, CACHE_TMDB, source.stored_at)
+
+    data = await RankingService.get_trending_this_week(page)
+    return json_response(request, data, CACHE_TMDB, etag=etag, last_modified=source.stored_at)
 
 
 @router.get("/users-stats")
 def get_user_stats_ranking(
+    request: Request,
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
     db: Session = Depends(get_db)
@@ -63,4 +89,5 @@ def get_user_stats_ranking(
     """
     Ranking de usuarios más activos
     """
-    return RankingService.get_user_stats_ranking(db, page, limit)
\ No newline at end of file
+    data = RankingService.get_user_stats_ranking(db, page, limit)
+    return json_response(request, data, CACHE_USERS)
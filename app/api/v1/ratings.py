@@ -1,21 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.api.deps import get_current_user
 from app.models.user import User
 from app.schemas.rating import RatingCreate, RatingResponse, MovieRatingStats
 from app.services.rating_service import RatingService
+from app.services.movie_catalog_service import MovieCatalogService
+from app.services.timeline_service import TimelineService
 
 router = APIRouter()
 
 @router.post("/", response_model=RatingResponse)
 def create_or_update_rating(
     rating_data: RatingCreate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Crear o actualizar calificación"""
     rating = RatingService.create_or_update_rating(db, current_user.id, rating_data)
+    background_tasks.add_task(MovieCatalogService.hydrate_movies, [rating_data.movie_tmdb_id])
+    background_tasks.add_task(TimelineService.fan_out, "rating", rating.id)
     return rating
 
 @router.get("/movie/{movie_tmdb_id}/user", response_model=RatingResponse | None)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, BackgroundTasks
 from sqlalchemy.orm import Session
 from typing import List
 from app.database import get_db
@@ -11,6 +11,8 @@ from app.schemas.review import (
     MovieReviewsStats
 )
 from app.services.review_service import ReviewService
+from app.services.movie_catalog_service import MovieCatalogService
+from app.services.timeline_service import TimelineService
 
 router = APIRouter()
 
@@ -18,11 +20,14 @@ router = APIRouter()
 @router.post("/", response_model=ReviewResponse)
 def create_review(
     review_data: ReviewCreate,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """Crear una reseña"""
     review = ReviewService.create_review(db, current_user.id, review_data)
+    background_tasks.add_task(MovieCatalogService.hydrate_movies, [review_data.movie_tmdb_id])
+    background_tasks.add_task(TimelineService.fan_out, "review", review.id)
     return review
 
 
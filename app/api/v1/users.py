@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
+from typing import List
 from app.database import get_db
 from app.api.deps import get_current_user
 from app.models.user import User
+from app.schemas.user import UserPublic
 from app.schemas.user_stats import UserProfileResponse, UserStats, RecentActivity
 from app.services.user_stats_service import UserStatsService
+from app.services.follow_service import FollowService
 
 router = APIRouter()
 
@@ -72,4 +75,50 @@ def get_user_stats(
         db: Session = Depends(get_db)
 ):
     """Obtener estadísticas públicas de cualquier usuario"""
-    return UserStatsService.get_user_stats(db, user_id)
\ No newline at end of file
+    return UserStatsService.get_user_stats(db, user_id)
+
+
+@router.post("/{user_id}/follow")
+def follow_user(
+        user_id: int,
+        current_user: User = Depends(get_current_user),
+        db: Session = Depends(get_db)
+):
+    """Seguir a un usuario"""
+    FollowService.follow(db, current_user.id, user_id)
+    return {"message": "Ahora sigues a este usuario", "following": True}
+
+
+@router.delete("/{user_id}/follow")
+def unfollow_user(
+        user_id: int,
+        current_user: User = Depends(get_current_user),
+        db: Session = Depends(get_db)
+):
+    """Dejar de seguir a un usuario"""
+    FollowService.unfollow(db, current_user.id, user_id)
+    return {"message": "Dejaste de seguir a este usuario", "following": False}
+
+
+@router.get("/{user_id}/followers", response_model=List[UserPublic])
+def get_followers(
+        user_id: int,
+        skip: int = Query(0, ge=0),
+        limit: int = Query(50, ge=1, le=100),
+        current_user: User = Depends(get_current_user),
+        db: Session = Depends(get_db)
+):
+    """Obtener seguidores de un usuario"""
+    return FollowService.get_followers(db, user_id, skip, limit)
+
+
+@router.get("/{user_id}/following", response_model=List[UserPublic])
+def get_following(
+        user_id: int,
+        skip: int = Query(0, ge=0),
+        limit: int = Query(50, ge=1, le=100),
+        current_user: User = Depends(get_current_user),
+        db: Session = Depends(get_db)
+):
+    """Obtener usuarios que sigue un usuario"""
+    return FollowService.get_following(db, user_id, skip, limit)
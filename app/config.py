@@ -2,6 +2,7 @@ from pydantic_settings import BaseSettings
 from typing import Optional
 from pathlib import Path
 import os
+import tempfile
 
 # Obtener la ruta del directorio raíz del proyecto
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -37,8 +38,81 @@ class Settings(BaseSettings):
 
     # TMDB API
     TMDB_API_KEY: Optional[str] = None
+    # Para pruebas de carga sin red: TMDB falso local (python -m app.fake_tmdb serve),
+    # p. ej. http://127.0.0.1:8001/3, con TMDB_DISK_CACHE_PATH propio o vacío
     TMDB_BASE_URL: str = "https://api.themoviedb.org/3"
 
+    # TMDB - Idiomas (el de la petición sale de Accept-Language o ?language=)
+    TMDB_DEFAULT_LANGUAGE: str = "es-MX"
+    TMDB_LANGUAGES: list = ["es-MX", "es-ES", "en-US", "pt-BR"]
+
+    # TMDB - Cliente HTTP compartido
+    TMDB_HTTP2: bool = True
+    TMDB_TIMEOUT: float = 10.0  # Segundos (lectura/escritura/pool)
+    TMDB_CONNECT_TIMEOUT: float = 5.0
+    TMDB_MAX_CONNECTIONS: int = 50
+    TMDB_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    TMDB_KEEPALIVE_EXPIRY: float = 30.0
+
+    # TMDB - Caché en memoria (TTL en segundos)
+    TMDB_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+    TMDB_CACHE_TTL_DETAILS: int = 24 * 3600
+    TMDB_CACHE_TTL_LISTS: int = 30 * 60
+    TMDB_CACHE_TTL_SEARCH: int = 10 * 60
+    TMDB_CACHE_STALE_TTL: int = 6 * 3600  # Ventana para servir datos vencidos mientras se refrescan
+    TMDB_BULK_CONCURRENCY: int = 8  # Peticiones simultáneas en consultas masivas
+
+    # TMDB - Caché en disco compartida por los workers ("" para deshabilitar)
+    TMDB_DISK_CACHE_PATH: str = str(Path(tempfile.gettempdir()) / "cineminha_tmdb_cache.sqlite3")
+    TMDB_DISK_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+
+    # TMDB - Resiliencia
+    TMDB_RATE_LIMIT_PER_SECOND: float = 40.0  # Cupo de TMDB (~50 req/s por IP)
+    TMDB_RATE_LIMIT_BURST: int = 40
+    TMDB_MAX_RETRIES: int = 3  # Reintentos ante errores de red, 429 y 5xx
+    TMDB_RETRY_BASE_DELAY: float = 0.25
+    TMDB_RETRY_MAX_DELAY: float = 5.0
+    TMDB_CIRCUIT_FAILURE_THRESHOLD: int = 5  # Fallos consecutivos para abrir el circuito
+    TMDB_CIRCUIT_RESET_TIMEOUT: float = 30.0  # Segundos con el circuito abierto
+
+    # Catálogo local de películas
+    MOVIE_CATALOG_REFRESH_INTERVAL: int = 3600  # Segundos entre ejecuciones del job
+    MOVIE_CATALOG_MAX_AGE: int = 24 * 3600  # Refrescar películas sincronizadas hace más de esto
+    MOVIE_CATALOG_REFRESH_BATCH: int = 100
+
+    # Géneros: cada cuánto se recargan los arrays de máscaras del catálogo (segundos)
+    GENRE_ARRAYS_TTL: int = 300
+
+    # Búsqueda local sobre el catálogo (autocompletado)
+    MOVIE_SEARCH_SYNC_INTERVAL: int = 300  # Segundos entre sincronizaciones del índice con la BD
+
+    # Precalentado de listados de TMDB (el intervalo debe ser menor que TMDB_CACHE_TTL_LISTS)
+    TMDB_WARM_ENABLED: bool = True
+    TMDB_WARM_INTERVAL: int = 20 * 60
+    TMDB_WARM_PAGES: int = 2  # Primeras páginas de cada listado
+
+    # Feed: películas que faltan en el catálogo se piden a TMDB en paralelo con este
+    # límite de peticiones y de espera total (las que no llegan salen sin datos)
+    FEED_TMDB_CONCURRENCY: int = 20
+    FEED_TMDB_DEADLINE: float = 3.0
+
+    # Feed global: páginas compartidas entre usuarios (los datos de cada usuario se agregan aparte)
+    FEED_CACHE_TTL: int = 60  # Segundos; acota cuánto tarda en verse una edición o un borrado de otro worker
+    FEED_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+
+    # Feed "hot": el engagement (likes + peso * comentarios) vale la mitad cada tantos segundos
+    FEED_HOT_HALF_LIFE: int = 12 * 3600
+    FEED_HOT_COMMENT_WEIGHT: float = 2.0
+
+    # Timeline de seguidos: se reparte a los seguidores al escribir, salvo para cuentas
+    # con más seguidores que esto (se leen al pedir el timeline)
+    FEED_FANOUT_MAX_FOLLOWERS: int = 1000
+    FEED_TIMELINE_MAX_LENGTH: int = 800  # Actividades guardadas por usuario
+    FEED_NEW_COUNT_MAX: int = 99  # Tope de /feed/new-count ("99+")
+
+    # Contadores de likes/comentarios: cada cuánto se comparan con las tablas (segundos)
+    INTERACTION_COUNTERS_RECONCILE_INTERVAL: int = 6 * 3600
+
     # CORS
     ALLOWED_ORIGINS: list = [
         "http://localhost:4200",
@@ -0,0 +1,4 @@
+from app.fake_tmdb.fixtures import FixtureStore, synthetic_movie, record
+from app.fake_tmdb.server import FakeTMDBConfig, create_app
+
+__all__ = ["FixtureStore", "FakeTMDBConfig", "create_app", "synthetic_movie", "record"]
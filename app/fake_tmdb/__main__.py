@@ -0,0 +1,50 @@
+"""
+TMDB falso para pruebas de carga.
+
+    python -m app.fake_tmdb serve --port 8001 --latency-ms 80 --error-rate 0.02 --rate-limit 40
+    python -m app.fake_tmdb record          # graba fixtures desde TMDB real (usa TMDB_API_KEY)
+
+Luego apuntar la app con TMDB_BASE_URL=http://127.0.0.1:8001/3
+"""
+import argparse
+from pathlib import Path
+
+from app.fake_tmdb.fixtures import DEFAULT_FIXTURES_DIR, FixtureStore, record
+from app.fake_tmdb.server import FakeTMDBConfig, create_app
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m app.fake_tmdb")
+    parser.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES_DIR)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="Levantar el servidor falso")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8001)
+    serve.add_argument("--latency-ms", type=float, default=0)
+    serve.add_argument("--jitter-ms", type=float, default=0)
+    serve.add_argument("--error-rate", type=float, default=0)
+    serve.add_argument("--rate-limit", type=int, default=None, help="Peticiones por segundo (429 al superarlo)")
+
+    rec = commands.add_parser("record", help="Grabar fixtures desde TMDB real")
+    rec.add_argument("--details", type=int, default=20, help="Películas populares con detalle completo")
+    rec.add_argument("--base-url", default="https://api.themoviedb.org/3")
+
+    args = parser.parse_args()
+    store = FixtureStore(args.fixtures)
+
+    if args.command == "serve":
+        import uvicorn
+
+        config = FakeTMDBConfig(args.latency_ms, args.jitter_ms, args.error_rate, args.rate_limit)
+        uvicorn.run(create_app(store, config), host=args.host, port=args.port, log_level="warning")
+
+    elif args.command == "record":
+        from app.config import settings
+
+        saved = record(store, settings.TMDB_API_KEY, args.base_url, args.details)
+        print(f"🎬 {saved} fixtures grabadas en {args.fixtures}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+import json
+import random
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+DEFAULT_FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Géneros de TMDB (ids reales) para los datos sintéticos
+GENRES = [
+    {"id": 28, "name": "Acción"}, {"id": 12, "name": "Aventura"}, {"id": 16, "name": "Animación"},
+    {"id": 35, "name": "Comedia"}, {"id": 80, "name": "Crimen"}, {"id": 99, "name": "Documental"},
+    {"id": 18, "name": "Drama"}, {"id": 10751, "name": "Familia"}, {"id": 14, "name": "Fantasía"},
+    {"id": 36, "name": "Historia"}, {"id": 27, "name": "Terror"}, {"id": 10402, "name": "Música"},
+    {"id": 9648, "name": "Misterio"}, {"id": 10749, "name": "Romance"}, {"id": 878, "name": "Ciencia ficción"},
+    {"id": 10770, "name": "Película de TV"}, {"id": 53, "name": "Suspense"}, {"id": 10752, "name": "Bélica"},
+    {"id": 37, "name": "Western"}
+]
+
+# Bloques de append_to_response
+APPENDABLE = ("credits", "videos", "similar", "translations")
+
+# (iso_639_1, iso_3166_1, título) de las traducciones sintéticas
+TRANSLATIONS = [
+    ("es", "MX", "Película"), ("es", "ES", "Película"),
+    ("en", "US", "Movie"), ("pt", "BR", "Filme"), ("fr", "FR", "Film")
+]
+
+PAGE_SIZE = 20
+TOTAL_PAGES = 500
+
+NOT_FOUND = {"success": False, "status_code": 34, "status_message": "The resource you requested could not be found."}
+
+
+class FixtureStore:
+    """
+    Respuestas de TMDB grabadas en disco, una por path:
+    fixtures/movie/550.json, fixtures/movie/popular.json, fixtures/trending/movie/week.json...
+
+    Lo que no esté grabado se genera de forma determinista (mismo id, mismos
+    datos), así el servidor falso responde cualquier película o página.
+    """
+
+    def __init__(self, directory: Path = DEFAULT_FIXTURES_DIR):
+        self.directory = Path(directory)
+        self._loaded: Dict[str, Optional[Dict]] = {}
+
+    def _file(self, path: str) -> Path:
+        return self.directory / f"{path.strip('/')}.json"
+
+    def recorded(self, path: str) -> Optional[Dict]:
+        if path not in self._loaded:
+            file = self._file(path)
+            self._loaded[path] = json.loads(file.read_text()) if file.is_file() else None
+        return self._loaded[path]
+
+    def save(self, path: str, data: Dict) -> Path:
+        file = self._file(path)
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(json.dumps(data, ensure_ascii=False, indent=1))
+        self._loaded[path] = data
+        return file
+
+    # ==================== RESPUESTAS ====================
+
+    def resolve(self, path: str, params: Dict[str, str]) -> Optional[Dict]:
+        """Respuesta para `path` (sin el prefijo /3) o None si TMDB daría 404"""
+        parts = path.strip("/").split("/")
+        page = max(1, int(params.get("page") or 1))
+
+        if parts == ["genre", "movie", "list"]:
+            return self.recorded(path) or {"genres": GENRES}
+
+        if parts[:1] == ["movie"] and len(parts) >= 2 and parts[1].isdigit():
+            movie_id = int(parts[1])
+            if len(parts) == 2:
+                return self._movie(path, movie_id, params.get("append_to_response", ""))
+            if parts[2:] == ["translations"]:
+                return {"id": movie_id, **self._translations(movie_id)}
+            if parts[2:] in (["similar"], ["recommendations"]):
+                return self._page(path, page, seed=movie_id)
+            return None
+
+        if parts in (["movie", "popular"], ["movie", "top_rated"], ["movie", "now_playing"],
+                     ["movie", "upcoming"], ["trending", "movie", "day"], ["trending", "movie", "week"]):
+            return self._page(path, page)
+
+        if parts == ["search", "movie"]:
+            return self._search(params.get("query", ""), page)
+
+        return None
+
+    def _movie(self, path: str, movie_id: int, append: str) -> Dict:
+        data = self.recorded(path)
+        if data is None:
+            data = synthetic_movie(movie_id, detail=True)
+
+        # Solo se agregan los bloques pedidos, como hace TMDB
+        appended = {block for block in append.split(",") if block}
+        data = {k: v for k, v in data.items() if k not in APPENDABLE or k in appended}
+        if "credits" in appended and "credits" not in data:
+            data["credits"] = {"cast": [], "crew": []}
+        if "videos" in appended and "videos" not in data:
+            data["videos"] = {"results": []}
+        if "similar" in appended and "similar" not in data:
+            data["similar"] = self._page(f"/movie/{movie_id}/similar", 1, seed=movie_id)
+        if "translations" in appended and "translations" not in data:
+            data["translations"] = self._translations(movie_id)
+        return data
+
+    def _translations(self, movie_id: int) -> Dict:
+        recorded = self.recorded(f"/movie/{movie_id}/translations")
+        if recorded is not None:
+            return {"translations": recorded.get("translations", [])}
+        return {"translations": synthetic_translations(movie_id)}
+
+    def _page(self, path: str, page: int, seed: int = 0) -> Dict:
+        recorded = self.recorded(path)
+        if recorded is not None:
+            # Una sola página grabada sirve para todas (solo cambia el número)
+            return {**recorded, "page": page}
+
+        rng = random.Random(f"{path}:{seed}:{page}")
+        results = [synthetic_movie(rng.randint(1, 1_200_000)) for _ in range(PAGE_SIZE)]
+        return {"page": page, "results": results, "total_pages": TOTAL_PAGES, "total_results": TOTAL_PAGES * PAGE_SIZE}
+
+    def _search(self, query: str, page: int) -> Dict:
+        rng = random.Random(f"search:{query.lower()}")
+        total = rng.randint(0, 60)
+        start = (page - 1) * PAGE_SIZE
+        results = []
+        for index in range(start, min(total, start + PAGE_SIZE)):
+            movie = synthetic_movie(random.Random(f"search:{query.lower()}:{index}").randint(1, 1_200_000))
+            movie["title"] = f"{query.title()} {index + 1}"
+            results.append(movie)
+        return {
+            "page": page,
+            "results": results,
+            "total_pages": (total + PAGE_SIZE - 1) // PAGE_SIZE,
+            "total_results": total
+        }
+
+
+def synthetic_movie(movie_id: int, detail: bool = False) -> Dict:
+    """Película ficticia pero estable para un id"""
+    rng = random.Random(movie_id)
+    genres = rng.sample(GENRES, rng.randint(1, 3))
+    movie = {
+        "id": movie_id,
+        "title": f"Película {movie_id}",
+        "original_title": f"Movie {movie_id}",
+        "overview": f"Sinopsis de la película {movie_id}.",
+        "poster_path": f"/poster{movie_id}.jpg",
+        "backdrop_path": f"/backdrop{movie_id}.jpg",
+        "vote_average": round(rng.uniform(3, 9), 1),
+        "vote_count": rng.randint(0, 30000),
+        "popularity": round(rng.uniform(1, 500), 3),
+        "release_date": f"{rng.randint(1950, 2025)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+        "original_language": "en",
+        "adult": False,
+        "video": False
+    }
+
+    if detail:
+        movie["genres"] = genres
+        movie["runtime"] = rng.randint(80, 180)
+        movie["status"] = "Released"
+        movie["tagline"] = ""
+    else:
+        movie["genre_ids"] = [genre["id"] for genre in genres]
+
+    return movie
+
+
+def synthetic_translations(movie_id: int) -> List[Dict]:
+    """Bloque 'translations' con el mismo formato que TMDB"""
+    return [
+        {
+            "iso_639_1": language,
+            "iso_3166_1": country,
+            "data": {"title": f"{word} {movie_id}", "overview": f"{word} {movie_id} ({language}-{country}).", "tagline": ""}
+        }
+        for language, country, word in TRANSLATIONS
+    ]
+
+
+def record(store: FixtureStore, api_key: str, base_url: str, details: int = 20) -> int:
+    """
+    Grabar respuestas reales de TMDB como fixtures: listados, géneros y el
+    detalle completo de las primeras `details` películas populares.
+    """
+    params = {"api_key": api_key, "language": "es-MX"}
+    paths = [
+        "/movie/popular", "/movie/top_rated", "/movie/now_playing",
+        "/trending/movie/week", "/trending/movie/day", "/genre/movie/list"
+    ]
+    saved = 0
+
+    with httpx.Client(base_url=base_url.rstrip("/"), timeout=15) as client:
+        for path in paths:
+            response = client.get(path, params=params)
+            response.raise_for_status()
+            store.save(path, response.json())
+            saved += 1
+
+        popular = store.recorded("/movie/popular") or {"results": []}
+        for movie in popular["results"][:details]:
+            path = f"/movie/{movie['id']}"
+            response = client.get(path, params={**params, "append_to_response": "credits,videos,similar,translations"})
+            if response.is_success:
+                store.save(path, response.json())
+                saved += 1
+
+    return saved
@@ -0,0 +1,95 @@
+import asyncio
+import random
+import time
+from typing import Dict, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from app.fake_tmdb.fixtures import FixtureStore, NOT_FOUND
+
+
+class FakeTMDBConfig:
+    """Fallas inyectadas por el servidor falso (modificables en caliente vía /__config)"""
+
+    def __init__(self, latency_ms: float = 0, jitter_ms: float = 0,
+                 error_rate: float = 0, rate_limit: Optional[int] = None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate  # Fracción de respuestas 500/503
+        self.rate_limit = rate_limit  # Peticiones por segundo antes de responder 429
+
+    def as_dict(self) -> Dict:
+        return {
+            "latency_ms": self.latency_ms,
+            "jitter_ms": self.jitter_ms,
+            "error_rate": self.error_rate,
+            "rate_limit": self.rate_limit
+        }
+
+
+def create_app(store: Optional[FixtureStore] = None, config: Optional[FakeTMDBConfig] = None) -> FastAPI:
+    """
+    TMDB falso para pruebas de carga sin red. Sirve los mismos paths que la
+    API v3 (con o sin el prefijo /3) a partir de fixtures grabadas.
+    """
+    store = store or FixtureStore()
+    config = config or FakeTMDBConfig()
+    stats = {"requests": 0, "errors": 0, "rate_limited": 0, "not_found": 0}
+    window = {"second": 0, "count": 0}
+
+    app = FastAPI(title="Fake TMDB", docs_url=None, redoc_url=None, openapi_url=None)
+    app.state.store = store
+    app.state.config = config
+    app.state.stats = stats
+
+    @app.get("/__stats")
+    def get_stats():
+        return {**stats, "config": config.as_dict()}
+
+    @app.post("/__config")
+    async def update_config(request: Request):
+        for key, value in (await request.json()).items():
+            if hasattr(config, key):
+                setattr(config, key, value)
+        return config.as_dict()
+
+    @app.get("/{path:path}")
+    async def tmdb(path: str, request: Request):
+        stats["requests"] += 1
+
+        if config.rate_limit:
+            second = int(time.monotonic())
+            if window["second"] != second:
+                window["second"], window["count"] = second, 0
+            window["count"] += 1
+            if window["count"] > config.rate_limit:
+                stats["rate_limited"] += 1
+                return JSONResponse(
+                    status_code=429,
+                    content={"success": False, "status_code": 25, "status_message": "Your request count is over the allowed limit."},
+                    headers={"Retry-After": "1"}
+                )
+
+        delay = config.latency_ms + random.uniform(0, config.jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+
+        if config.error_rate and random.random() < config.error_rate:
+            stats["errors"] += 1
+            return JSONResponse(
+                status_code=random.choice((500, 503)),
+                content={"success": False, "status_code": 11, "status_message": "Internal error: Something went wrong."}
+            )
+
+        if path.startswith("3/"):
+            path = path[2:]
+
+        data = store.resolve(f"/{path}", dict(request.query_params))
+        if data is None:
+            stats["not_found"] += 1
+            return JSONResponse(status_code=404, content=NOT_FOUND)
+
+        return data
+
+    return app
@@ -1,18 +1,57 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from app.config import settings
 from app.database import engine, Base
 from app.api.v1 import auth, movies, ratings, list, rankings, reviews, users, feed, interactions, notifications
 from app.routers import recommendations
+from app.services.tmdb_service import TMDBService, TMDBUnavailableError
+from app.services.movie_catalog_service import MovieCatalogService
+from app.services.cache_warmer_service import CacheWarmerService
+from app.services.movie_search_service import MovieSearchService
+from app.services.activity_service import ActivityService
+from app.services.counter_service import CounterService
+from app.utils.locale import LocaleMiddleware
 
 
 # Crear tablas
 Base.metadata.create_all(bind=engine)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Un cliente HTTP por worker para reutilizar conexiones con TMDB
+    await TMDBService.startup()
+
+    # Actividades del feed de datos anteriores a la tabla `activities` (una sola vez)
+    backfilled = await asyncio.to_thread(ActivityService.backfill)
+    if backfilled:
+        print(f"📰 Feed: {backfilled} actividades creadas a partir de datos existentes")
+
+    # Jobs en segundo plano
+    background_jobs = [
+        asyncio.create_task(MovieCatalogService.run_refresh_loop()),
+        asyncio.create_task(MovieSearchService.run_sync_loop()),
+        asyncio.create_task(CounterService.run_reconcile_loop())
+    ]
+    if settings.TMDB_WARM_ENABLED:
+        background_jobs.append(asyncio.create_task(CacheWarmerService.run_warm_loop()))
+
+    yield
+
+    for job in background_jobs:
+        job.cancel()
+    await asyncio.gather(*background_jobs, return_exceptions=True)
+    await TMDBService.shutdown()
+
+
 app = FastAPI(
     title="Cineminha API",
     description="API para la red social de películas Cineminha",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS
@@ -26,6 +65,19 @@ app.add_middleware(
     max_age=3600
 )
 
+# Idioma de TMDB por petición (Accept-Language o ?language=)
+app.add_middleware(LocaleMiddleware)
+
+@app.exception_handler(TMDBUnavailableError)
+async def tmdb_unavailable_handler(request: Request, exc: TMDBUnavailableError):
+    # TMDB caído y sin datos en caché: responder rápido en lugar de esperar timeouts
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "El servicio de películas no está disponible temporalmente"},
+        headers={"Retry-After": str(int(settings.TMDB_CIRCUIT_RESET_TIMEOUT))}
+    )
+
+
 # Routers
 app.include_router(rankings.router, prefix="/api/v1/rankings", tags=["rankings"])
 app.include_router(list.router, prefix="/api/v1/lists", tags=["lists"])
@@ -3,4 +3,10 @@ from app.models.rating import Rating
 from app.models.list import List, list_movies, list_collaborators
 from app.models.review import Review
 from app.models.like import Like
-from app.models.comment import Comment
\ No newline at end of file
+from app.models.comment import Comment
+from app.models.movie import Movie
+from app.models.genre import Genre
+from app.models.activity import Activity
+from app.models.interaction_counter import InteractionCounter
+from app.models.follow import Follow, HomeTimeline
+from app.models.data_migration import DataMigration
@@ -0,0 +1,35 @@
+from sqlalchemy import Column, Integer, String, DateTime, Double, ForeignKey, Index, UniqueConstraint
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class Activity(Base):
+    """
+    Una fila por cada actividad que aparece en el feed (rating, reseña o lista).
+    Se escribe en la misma transacción que el objeto y el feed se lee de aquí
+    con un solo recorrido por índice.
+    """
+    __tablename__ = "activities"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    activity_type = Column(String(50), nullable=False)  # 'rating', 'review', 'list_created'
+    target_id = Column(Integer, nullable=False)  # rating.id, review.id o list.id
+    movie_tmdb_id = Column(Integer, nullable=True)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+    # Puntaje del feed "hot": log del engagement + edad (ver ActivityService.hot_score)
+    hot_score = Column(Double, nullable=False, default=0, server_default="0")
+
+    user = relationship("User")
+
+    __table_args__ = (
+        UniqueConstraint('activity_type', 'target_id', name='unique_activity_target'),
+        Index('idx_activities_created', 'created_at', 'id'),
+        Index('idx_activities_user_created', 'user_id', 'created_at', 'id'),
+        Index('idx_activities_hot', 'hot_score', 'id'),
+        {'mysql_charset': 'utf8mb4', 'mysql_collate': 'utf8mb4_unicode_ci'}
+    )
+
+    def __repr__(self):
+        return f"<Activity {self.activity_type} {self.target_id}>"
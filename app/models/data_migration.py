@@ -0,0 +1,22 @@
+from sqlalchemy import Column, String, DateTime
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class DataMigration(Base):
+    """
+    Migraciones de datos ya aplicadas (p. ej. el backfill de actividades).
+    La clave primaria hace que solo un worker pueda registrarla: se inserta en
+    la misma transacción que los datos, así los demás esperan y la saltean.
+    """
+    __tablename__ = "data_migrations"
+
+    name = Column(String(100), primary_key=True)
+    applied_at = Column(DateTime, server_default=func.now())
+
+    __table_args__ = (
+        {'mysql_charset': 'utf8mb4', 'mysql_collate': 'utf8mb4_unicode_ci'}
+    )
+
+    def __repr__(self):
+        return f"<DataMigration {self.name}>"
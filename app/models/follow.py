@@ -0,0 +1,34 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index, UniqueConstraint, LargeBinary
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class Follow(Base):
+    __tablename__ = "follows"
+
+    id = Column(Integer, primary_key=True)
+    follower_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)  # Quien sigue
+    followed_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)  # A quien sigue
+    created_at = Column(DateTime, server_default=func.now())
+
+    __table_args__ = (
+        UniqueConstraint('follower_id', 'followed_id', name='unique_follow'),
+        Index('idx_follows_followed', 'followed_id', 'follower_id'),
+        {'mysql_charset': 'utf8mb4', 'mysql_collate': 'utf8mb4_unicode_ci'}
+    )
+
+
+class HomeTimeline(Base):
+    """
+    Timeline precalculado de cada usuario: ids de actividades (las más nuevas
+    primero) empaquetados como enteros de 4 bytes, con largo acotado.
+    """
+    __tablename__ = "home_timelines"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True, autoincrement=False)
+    activity_ids = Column(LargeBinary, nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        {'mysql_charset': 'utf8mb4', 'mysql_collate': 'utf8mb4_unicode_ci'}
+    )
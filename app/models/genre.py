@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class Genre(Base):
+    """Géneros de TMDB; cada uno ocupa un bit de Movie.genre_mask"""
+    __tablename__ = "genres"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)  # ID de TMDB
+    name = Column(String(100), nullable=True)
+    bit = Column(Integer, nullable=False, unique=True)  # 0..62 (la máscara es un BIGINT con signo)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        {'mysql_charset': 'utf8mb4', 'mysql_collate': 'utf8mb4_unicode_ci'}
+    )
+
+    def __repr__(self):
+        return f"<Genre {self.id} - {self.name}>"
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class InteractionCounter(Base):
+    """
+    Likes y comentarios de cada objeto, actualizados en la misma transacción
+    que el like/comentario. Las lecturas son por clave primaria en lugar de
+    COUNT(*) sobre likes/comments.
+    """
+    __tablename__ = "interaction_counters"
+
+    target_type = Column(String(50), primary_key=True)  # 'rating', 'review', 'list', 'comment'
+    target_id = Column(Integer, primary_key=True, autoincrement=False)
+    likes_count = Column(Integer, nullable=False, default=0, server_default="0")
+    comments_count = Column(Integer, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        {'mysql_charset': 'utf8mb4', 'mysql_collate': 'utf8mb4_unicode_ci'}
+    )
+
+    def __repr__(self):
+        return f"<InteractionCounter {self.target_type} {self.target_id}>"
@@ -0,0 +1,33 @@
+from sqlalchemy import Column, Integer, BigInteger, String, Float, Text, DateTime, JSON
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class Movie(Base):
+    """Catálogo local de películas (campos de tarjeta copiados de TMDB)"""
+    __tablename__ = "movies"
+
+    tmdb_id = Column(Integer, primary_key=True, autoincrement=False)  # ID de TMDB
+    title = Column(String(255), nullable=True)
+    original_title = Column(String(255), nullable=True)
+    overview = Column(Text, nullable=True)
+    poster_path = Column(String(255), nullable=True)
+    backdrop_path = Column(String(255), nullable=True)
+    vote_average = Column(Float, default=0)
+    vote_count = Column(Integer, default=0)
+    release_date = Column(String(10), nullable=True)  # 'YYYY-MM-DD' tal como lo envía TMDB
+    genre_ids = Column(JSON, nullable=True)  # [28, 12, ...]
+    genre_mask = Column(BigInteger, nullable=False, default=0, server_default="0")  # Un bit por género (ver Genre.bit)
+    runtime = Column(Integer, nullable=True)  # Minutos
+
+    # NULL = registrada pero aún sin datos de TMDB (la hidrata el job de refresco)
+    synced_at = Column(DateTime, nullable=True, index=True)
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        {'mysql_charset': 'utf8mb4', 'mysql_collate': 'utf8mb4_unicode_ci'}
+    )
+
+    def __repr__(self):
+        return f"<Movie {self.tmdb_id} - {self.title}>"
@@ -5,9 +5,11 @@ from typing import List, Dict
 import numpy as np
 
 from ..database import get_db
-from ..models import User, Rating
+from ..models import User, Rating, Movie
 from app.api.deps import get_current_user
 from ..services.tmdb_service import TMDBService
+from ..services.movie_catalog_service import MovieCatalogService
+from ..services.genre_service import GenreService
 
 router = APIRouter(prefix="/recommendations", tags=["recommendations"])
 
@@ -166,6 +168,71 @@ class RecommendationEngine:
 
         return recommendations[:limit]
 
+    def get_genre_recommendations(
+            self,
+            user_id: int,
+            limit: int = 20,
+            top_genres: int = 3
+    ) -> List[dict]:
+        """
+        Recomendaciones por géneros favoritos: todo el catálogo se filtra y
+        puntúa con operaciones de bits vectorizadas sobre las máscaras de género
+        """
+        rows = (
+            self.db.query(Rating.movie_tmdb_id, Rating.rating, Movie.genre_mask)
+            .outerjoin(Movie, Movie.tmdb_id == Rating.movie_tmdb_id)
+            .filter(Rating.user_id == user_id)
+            .all()
+        )
+
+        if not rows:
+            return []
+
+        seen = np.array([movie_id for movie_id, _, _ in rows], dtype=np.int64)
+        ratings = np.array([rating for _, rating, _ in rows], dtype=np.float64)
+        masks = np.array([mask or 0 for _, _, mask in rows], dtype=np.uint64)
+
+        # Preferencia por género: calificaciones centradas (lo que no gustó resta)
+        preference = GenreService.bit_totals(masks, ratings - 2.5)
+        favorite_bits = [int(bit) for bit in np.argsort(preference)[::-1][:top_genres] if preference[bit] > 0]
+
+        if not favorite_bits:
+            print("⚠️ Sin géneros favoritos (faltan calificaciones o géneros en el catálogo)")
+            return []
+
+        favorite_mask = np.uint64(sum(1 << bit for bit in favorite_bits))
+        weights = np.zeros_like(preference)
+        weights[favorite_bits] = preference[favorite_bits] / preference[favorite_bits].sum()
+
+        # Candidatas: al menos un género favorito y no vistas
+        ids, catalog_masks, vote_average, vote_count = GenreService.catalog_arrays(self.db)
+        candidates = ((catalog_masks & favorite_mask) != 0) & ~np.isin(ids, seen)
+
+        if not candidates.any():
+            return []
+
+        bits = GenreService.unpack(catalog_masks[candidates])
+        affinity = bits @ weights  # 0..1
+        # Calidad: promedio de TMDB atenuado cuando hay pocos votos
+        confidence = np.minimum(1.0, np.log1p(vote_count[candidates]) / np.log1p(1000))
+        quality = vote_average[candidates] / 10 * confidence
+        scores = 0.7 * affinity + 0.3 * quality
+
+        top = np.argsort(-scores)[:limit]
+        main_bits = np.argmax(bits[top] * weights, axis=1)
+        genre_by_bit = GenreService._bit_genres()
+
+        print(f"🎭 {int(candidates.sum())} candidatas para los géneros {[int(genre_by_bit[b]) for b in favorite_bits]}")
+
+        return [
+            {
+                'movie_tmdb_id': int(movie_id),
+                'score': round(float(score) * 100, 1),
+                'genre_id': int(genre_by_bit[bit])
+            }
+            for movie_id, score, bit in zip(ids[candidates][top], scores[top], main_bits)
+        ]
+
 
 @router.get("/personalized")
 async def get_personalized_recommendations(
@@ -201,11 +268,15 @@ async def get_personalized_recommendations(
         print(f"⚠️ No se generaron recomendaciones colaborativas, usando trending")
         return await get_trending_for_user(limit, db, current_user)
 
-    # Obtener detalles de TMDB (ASYNC)
+    # Tarjetas desde el catálogo local (una consulta; TMDB solo para las que falten)
+    movie_cards = await MovieCatalogService.get_cards(
+        db, [rec['movie_tmdb_id'] for rec in recommendations]
+    )
+
     results = []
     for rec in recommendations:
         try:
-            movie_data = await TMDBService.get_movie_details(rec['movie_tmdb_id'])
+            movie_data = movie_cards.get(rec['movie_tmdb_id'])
             if movie_data and 'id' in movie_data:
                 results.append({
                     'movie_tmdb_id': rec['movie_tmdb_id'],
@@ -277,10 +348,38 @@ async def get_by_favorite_genre(
         current_user: User = Depends(get_current_user)
 ):
     """
-    Recomendaciones basadas en películas top rated que el usuario no ha visto
+    Recomendaciones de los géneros favoritos del usuario; si aún no hay datos
+    suficientes, películas top rated que el usuario no ha visto
     """
     print(f"🎭 Obteniendo por género para usuario {current_user.id}")
 
+    engine = RecommendationEngine(db)
+    recommendations = engine.get_genre_recommendations(current_user.id, limit)
+
+    if recommendations:
+        movie_cards = await MovieCatalogService.get_cards(
+            db, [rec['movie_tmdb_id'] for rec in recommendations]
+        )
+
+        results = []
+        for rec in recommendations:
+            movie_data = movie_cards.get(rec['movie_tmdb_id'])
+            if movie_data:
+                results.append({
+                    'movie_tmdb_id': rec['movie_tmdb_id'],
+                    'title': movie_data.get('title', ''),
+                    'poster_path': movie_data.get('poster_path'),
+                    'backdrop_path': movie_data.get('backdrop_path'),
+                    'overview': movie_data.get('overview', ''),
+                    'release_date': movie_data.get('release_date', ''),
+                    'vote_average': movie_data.get('vote_average', 0),
+                    'score': rec['score'],
+                    'reason': f"Porque te gusta {GenreService.name(rec['genre_id']) or 'este género'}"
+                })
+
+        print(f"✅ Retornando {len(results)} películas por género")
+        return results
+
     # Películas que el usuario ya vio
     user_seen_movies = set(
         m[0] for m in db.query(Rating.movie_tmdb_id)
@@ -322,11 +421,9 @@ async def get_similar_movies(
     """
     print(f"🎬 Obteniendo similares a película {movie_id}")
 
-    # Obtener detalles de la película para sacar las similares
-    movie_details = await TMDBService.get_movie_details(movie_id)
-
-    # Las similares vienen en el append_to_response="similar"
-    similar_movies = movie_details.get('similar', {}).get('results', [])
+    # Perfil 'similar': se deriva de la ficha completa si ya está en caché
+    similar_data = await TMDBService.get_similar_movies(movie_id)
+    similar_movies = similar_data.get('results', [])
 
     # Películas que el usuario ya vio
     user_seen_movies = set(
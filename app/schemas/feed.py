@@ -47,5 +47,13 @@ class FeedItem(BaseModel):
 class FeedResponse(BaseModel):
     items: list[FeedItem]
     page: int
-    total_pages: int
-    total_items: int
\ No newline at end of file
+    total_pages: Optional[int] = None  # Solo sin cursor
+    total_items: Optional[int] = None
+    next_cursor: Optional[str] = None  # None cuando no hay más actividades
+    latest_cursor: Optional[str] = None  # Primera página: para /feed/new-count
+
+
+class NewActivityCount(BaseModel):
+    count: int  # Acotado a FEED_NEW_COUNT_MAX
+    has_more: bool  # Hay más de `count`
+    latest_cursor: Optional[str] = None
\ No newline at end of file
@@ -30,5 +30,16 @@ class UserResponse(BaseModel):
         from_attributes = True
 
 
+class UserPublic(BaseModel):
+    """Datos visibles para otros usuarios (sin email)"""
+    id: int
+    username: str
+    full_name: Optional[str] = None
+    avatar_url: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
 class User(UserResponse):
     pass
\ No newline at end of file
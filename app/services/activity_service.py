@@ -0,0 +1,189 @@
+import math
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import insert, select, and_, exists, func, literal, null
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.database import SessionLocal
+from app.models.activity import Activity
+from app.models.data_migration import DataMigration
+from app.models.rating import Rating
+from app.models.review import Review
+from app.models.list import List as MovieList
+from app.services.counter_service import CounterService
+
+
+class ActivityService:
+    """
+    Registro de actividades del feed.
+
+    Cada rating, reseña o lista nueva agrega su fila en `activities` dentro de
+    la misma transacción (sin commit aquí), así el feed es una lectura por
+    índice (created_at, id) en lugar de combinar tres tablas en Python.
+    """
+
+    # Cambia con cada actividad creada, editada o borrada en este worker (versión de la caché del feed)
+    generation = 0
+
+    # target_type de likes/comentarios -> tipo de actividad
+    ACTIVITY_TYPES = {"rating": "rating", "review": "review", "list": "list_created"}
+    HOT_EPOCH = datetime(2024, 1, 1)
+    BACKFILL_MIGRATION = "activities_backfill"
+
+    # ==================== PUNTAJE HOT ====================
+
+    @staticmethod
+    def hot_score(created_at: datetime, likes: int = 0, comments: int = 0) -> float:
+        """
+        log(1 + engagement) + edad / vida media * log(2).
+
+        Ordenar por esto equivale a ordenar por el engagement con decaimiento
+        exponencial en el tiempo, pero el puntaje de una actividad solo cambia
+        cuando cambian sus likes o comentarios: no hay que recalcular los demás.
+        """
+        engagement = likes + settings.FEED_HOT_COMMENT_WEIGHT * comments
+        age = (created_at - ActivityService.HOT_EPOCH).total_seconds()
+        return math.log1p(max(engagement, 0)) + age / settings.FEED_HOT_HALF_LIFE * math.log(2)
+
+    @staticmethod
+    def update_hot_score(db: Session, target_type: str, target_id: int) -> None:
+        """
+        Recalcular el puntaje de la actividad de un objeto tras un like o
+        comentario (sin commit; después de actualizar los contadores).
+        """
+        activity_type = ActivityService.ACTIVITY_TYPES.get(target_type)
+        if activity_type is None:
+            return  # Likes a comentarios, etc.
+
+        activity = db.query(Activity).filter(
+            Activity.activity_type == activity_type,
+            Activity.target_id == target_id
+        ).first()
+        if activity is None:
+            return
+
+        likes, comments = CounterService.get_counts(db, target_type, target_id)
+        activity.hot_score = ActivityService.hot_score(activity.created_at, likes, comments)
+
+    @staticmethod
+    def recompute_hot_scores(db: Session) -> int:
+        """Calcular el puntaje de las actividades que no lo tienen (p. ej. las del backfill). Sin commit."""
+        activities = db.query(Activity).filter(Activity.hot_score == 0).all()
+        if not activities:
+            return 0
+
+        target_types = {activity_type: target_type for target_type, activity_type in ActivityService.ACTIVITY_TYPES.items()}
+        by_type = {}
+        for activity in activities:
+            by_type.setdefault(target_types[activity.activity_type], []).append(activity.target_id)
+        counts = CounterService.get_counts_bulk(db, by_type)
+
+        for activity in activities:
+            likes, comments = counts.get((target_types[activity.activity_type], activity.target_id), (0, 0))
+            activity.hot_score = ActivityService.hot_score(activity.created_at or datetime.utcnow(), likes, comments)
+
+        return len(activities)
+
+    # ==================== REGISTRO ====================
+
+    @staticmethod
+    def touch() -> None:
+        """
+        Invalidar las páginas del feed en caché de este worker. Llamar después
+        del commit de toda escritura que cambie un item (crear, editar o borrar):
+        antes del commit, un lector concurrente podría guardar la página vieja
+        bajo la versión nueva.
+        """
+        ActivityService.generation += 1
+
+    @staticmethod
+    def record(
+            db: Session,
+            user_id: int,
+            activity_type: str,
+            target_id: int,
+            created_at: datetime,
+            movie_tmdb_id: Optional[int] = None
+    ) -> Activity:
+        """
+        Agregar la actividad de un objeto recién creado (requiere su id: hacer
+        flush antes). `created_at` es el del objeto, leído de la BD tras el
+        flush: el mismo reloj que el backfill y que la fecha que muestra el feed,
+        y del que update_hot_score recalcula el puntaje.
+        """
+        activity = Activity(
+            user_id=user_id,
+            activity_type=activity_type,
+            target_id=target_id,
+            movie_tmdb_id=movie_tmdb_id,
+            created_at=created_at,
+            hot_score=ActivityService.hot_score(created_at)
+        )
+        db.add(activity)
+        return activity
+
+    @staticmethod
+    def remove(db: Session, activity_type: str, target_id: int) -> None:
+        """Quitar la actividad de un objeto eliminado (sin commit)"""
+        db.query(Activity).filter(
+            Activity.activity_type == activity_type,
+            Activity.target_id == target_id
+        ).delete(synchronize_session=False)
+
+    @staticmethod
+    def backfill() -> int:
+        """
+        Crear las actividades de ratings, reseñas y listas anteriores a la tabla.
+
+        Se aplica una sola vez: la marca en `data_migrations` se inserta en la
+        misma transacción, así con varios workers uno solo la hace (los demás
+        esperan su commit y la saltean) y en los reinicios siguientes cuesta
+        una lectura por clave primaria.
+        """
+        sources = [
+            ("rating", Rating.id, Rating.user_id, Rating.movie_tmdb_id, Rating.created_at),
+            ("review", Review.id, Review.user_id, Review.movie_tmdb_id, Review.created_at),
+            ("list_created", MovieList.id, MovieList.user_id, None, MovieList.created_at)
+        ]
+
+        db = SessionLocal()
+        try:
+            if db.get(DataMigration, ActivityService.BACKFILL_MIGRATION):
+                return 0
+
+            db.add(DataMigration(name=ActivityService.BACKFILL_MIGRATION))
+            db.flush()
+
+            created = 0
+            for activity_type, target_id, user_id, movie_tmdb_id, created_at in sources:
+                rows = select(
+                    user_id,
+                    literal(activity_type),
+                    target_id,
+                    movie_tmdb_id if movie_tmdb_id is not None else null(),
+                    func.coalesce(created_at, func.now())
+                ).where(~exists().where(and_(
+                    Activity.activity_type == activity_type,
+                    Activity.target_id == target_id
+                )))
+
+                created += db.execute(
+                    insert(Activity).from_select(
+                        ["user_id", "activity_type", "target_id", "movie_tmdb_id", "created_at"], rows
+                    )
+                ).rowcount or 0
+
+            db.flush()
+            ActivityService.recompute_hot_scores(db)
+            db.commit()
+            return created
+        except IntegrityError:
+            db.rollback()  # Otro worker ya lo aplicó
+            return 0
+        except Exception as e:
+            print(f"Error backfilling activities: {e}")
+            db.rollback()
+            return 0
+        finally:
+            db.close()
@@ -0,0 +1,86 @@
+import asyncio
+import time
+from typing import Dict, List, Tuple
+from app.config import settings
+from app.database import SessionLocal
+from app.services.tmdb_service import TMDBService
+from app.services.movie_catalog_service import MovieCatalogService
+
+
+class CacheWarmerService:
+    """
+    Precalentado de los listados de TMDB que ven todos los usuarios
+    (populares, tendencias, mejor calificadas y en cartelera).
+
+    Los vuelve a pedir antes de que venzan para que ningún usuario pague la
+    latencia de TMDB, y guarda sus películas en el catálogo local para que
+    las tarjetas ya estén disponibles.
+    """
+
+    last_run: Dict = {}
+
+    @staticmethod
+    def _targets(pages: int) -> List[Tuple[str, Dict]]:
+        """Listados (nombre, parámetros) a precalentar"""
+        targets = [
+            ("trending", {"time_window": "week"}),
+            ("trending", {"time_window": "day"})
+        ]
+        for name in ("popular", "top_rated", "now_playing"):
+            targets.extend((name, {"page": page}) for page in range(1, pages + 1))
+        return targets
+
+    @staticmethod
+    async def warm_lists(pages: int = None) -> Dict:
+        """Refrescar los listados y guardar sus películas en el catálogo"""
+        started = time.monotonic()
+        targets = CacheWarmerService._targets(pages or settings.TMDB_WARM_PAGES)
+
+        responses = await asyncio.gather(
+            *(TMDBService.refresh_response(name, **params) for name, params in targets),
+            return_exceptions=True
+        )
+
+        movies = []
+        failed = 0
+        for (name, params), response in zip(targets, responses):
+            if isinstance(response, Exception) or not response.is_success:
+                failed += 1
+                print(f"Error warming TMDB {name} {params}: {response if isinstance(response, Exception) else response.status_code}")
+                continue
+            movies.extend(response.data.get("results", []))
+
+        stored = 0
+        if movies:
+            db = SessionLocal()
+            try:
+                stored = MovieCatalogService.upsert_listing(db, movies)
+                db.commit()
+            except Exception as e:
+                print(f"Error saving warmed movies to catalog: {e}")
+                db.rollback()
+            finally:
+                db.close()
+
+        CacheWarmerService.last_run = {
+            "lists": len(targets) - failed,
+            "failed": failed,
+            "movies_stored": stored,
+            "seconds": round(time.monotonic() - started, 3),
+            "finished_at": time.time()
+        }
+        return CacheWarmerService.last_run
+
+    @staticmethod
+    async def run_warm_loop() -> None:
+        """Job periódico de precalentado (se inicia con la app)"""
+        while True:
+            try:
+                result = await CacheWarmerService.warm_lists()
+                print(f"🔥 Caché de TMDB precalentada: {result['lists']} listados, {result['movies_stored']} películas al catálogo")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Error warming TMDB cache: {e}")
+
+            await asyncio.sleep(settings.TMDB_WARM_INTERVAL)
@@ -0,0 +1,171 @@
+import asyncio
+from typing import Dict, Iterable, List, Tuple
+from sqlalchemy import and_, func, or_, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.database import SessionLocal
+from app.models.comment import Comment
+from app.models.interaction_counter import InteractionCounter
+from app.models.like import Like
+
+
+class CounterService:
+    """
+    Contadores de likes y comentarios por (target_type, target_id).
+
+    Se actualizan con un upsert atómico (sin leer antes) dentro de la
+    transacción del like o comentario, así ambos se confirman o se revierten
+    juntos. Un job compara periódicamente con las tablas y corrige diferencias.
+    """
+
+    # ==================== ESCRITURA ====================
+
+    @staticmethod
+    def increment(db: Session, target_type: str, target_id: int, likes: int = 0, comments: int = 0) -> None:
+        """Sumar (o restar) a los contadores del objeto. No hace commit."""
+        values = {
+            "target_type": target_type,
+            "target_id": target_id,
+            "likes_count": max(likes, 0),
+            "comments_count": max(comments, 0)
+        }
+        updates = {
+            "likes_count": InteractionCounter.likes_count + likes,
+            "comments_count": InteractionCounter.comments_count + comments
+        }
+
+        dialect = db.get_bind().dialect.name
+        if dialect == "mysql":
+            db.execute(mysql_insert(InteractionCounter).values(**values).on_duplicate_key_update(**updates))
+        elif dialect == "sqlite":
+            db.execute(
+                sqlite_insert(InteractionCounter).values(**values).on_conflict_do_update(
+                    index_elements=["target_type", "target_id"],
+                    set_=updates
+                )
+            )
+        else:
+            updated = db.query(InteractionCounter).filter(
+                InteractionCounter.target_type == target_type,
+                InteractionCounter.target_id == target_id
+            ).update(updates, synchronize_session=False)
+            if not updated:
+                db.add(InteractionCounter(**values))
+                db.flush()
+
+    # ==================== LECTURA ====================
+
+    @staticmethod
+    def get_counts(db: Session, target_type: str, target_id: int) -> Tuple[int, int]:
+        """(likes, comentarios) del objeto"""
+        row = db.query(InteractionCounter.likes_count, InteractionCounter.comments_count).filter(
+            InteractionCounter.target_type == target_type,
+            InteractionCounter.target_id == target_id
+        ).first()
+        return (row[0], row[1]) if row else (0, 0)
+
+    @staticmethod
+    def get_counts_bulk(db: Session, targets: Dict[str, List[int]]) -> Dict[Tuple[str, int], Tuple[int, int]]:
+        """{(target_type, target_id): (likes, comentarios)} de los objetos agrupados por tipo"""
+        if not targets:
+            return {}
+
+        rows = db.query(
+            InteractionCounter.target_type,
+            InteractionCounter.target_id,
+            InteractionCounter.likes_count,
+            InteractionCounter.comments_count
+        ).filter(or_(*[
+            and_(InteractionCounter.target_type == target_type, InteractionCounter.target_id.in_(ids))
+            for target_type, ids in targets.items()
+        ])).all()
+
+        return {(row[0], row[1]): (row[2], row[3]) for row in rows}
+
+    # ==================== RECONCILIACIÓN ====================
+
+    @staticmethod
+    def _recount(db: Session, target_type: str, target_id: int) -> None:
+        """Recalcular los contadores de un objeto con subconsultas en el mismo UPDATE"""
+        CounterService.increment(db, target_type, target_id)
+
+        db.query(InteractionCounter).filter(
+            InteractionCounter.target_type == target_type,
+            InteractionCounter.target_id == target_id
+        ).update({
+            "likes_count": select(func.count(Like.id)).where(
+                Like.target_type == target_type,
+                Like.target_id == target_id
+            ).scalar_subquery(),
+            "comments_count": select(func.count(Comment.id)).where(
+                Comment.target_type == target_type,
+                Comment.target_id == target_id
+            ).scalar_subquery()
+        }, synchronize_session=False)
+
+    @staticmethod
+    def reconcile() -> int:
+        """
+        Comparar los contadores con COUNT(*) de likes y comments y corregir los
+        que no coinciden (incluye los objetos anteriores a la tabla). Retorna
+        cuántos se corrigieron.
+        """
+        db = SessionLocal()
+        try:
+            actual: Dict[Tuple[str, int], List[int]] = {}
+
+            likes = db.query(Like.target_type, Like.target_id, func.count(Like.id)) \
+                .group_by(Like.target_type, Like.target_id) \
+                .all()
+            for target_type, target_id, count in likes:
+                actual.setdefault((target_type, target_id), [0, 0])[0] = count
+
+            comments = db.query(Comment.target_type, Comment.target_id, func.count(Comment.id)) \
+                .group_by(Comment.target_type, Comment.target_id) \
+                .all()
+            for target_type, target_id, count in comments:
+                actual.setdefault((target_type, target_id), [0, 0])[1] = count
+
+            stored = {
+                (row[0], row[1]): [row[2], row[3]]
+                for row in db.query(
+                    InteractionCounter.target_type,
+                    InteractionCounter.target_id,
+                    InteractionCounter.likes_count,
+                    InteractionCounter.comments_count
+                ).all()
+            }
+
+            # Lo que no coincide se recalcula en el UPDATE (no con los conteos de
+            # arriba) para no pisar likes o comentarios que llegaron entretanto
+            drifted = [key for key, counts in actual.items() if stored.get(key) != counts]
+            drifted += [key for key, counts in stored.items() if key not in actual and counts != [0, 0]]
+
+            for target_type, target_id in drifted:
+                CounterService._recount(db, target_type, target_id)
+
+            db.commit()
+            return len(drifted)
+        except Exception as e:
+            print(f"Error reconciling interaction counters: {e}")
+            db.rollback()
+            return 0
+        finally:
+            db.close()
+
+    @staticmethod
+    async def run_reconcile_loop() -> None:
+        """Job periódico de reconciliación (se inicia con la app)"""
+        while True:
+            try:
+                repaired = await asyncio.to_thread(CounterService.reconcile)
+                if repaired:
+                    print(f"🔢 Contadores: {repaired} corregidos")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Error reconciling interaction counters: {e}")
+
+            await asyncio.sleep(settings.INTERACTION_COUNTERS_RECONCILE_INTERVAL)
@@ -0,0 +1,103 @@
+from typing import Dict, Iterable, Optional, Set, Tuple
+from sqlalchemy.orm import Session
+from app.models.movie import Movie
+from app.models.user import User
+from app.services.movie_catalog_service import MovieCatalogService
+
+
+class DataLoader:
+    """
+    Carga por lotes de usuarios, tarjetas de películas y estadísticas de
+    interacción durante una petición.
+
+    Los servicios registran los ids que van a necesitar (`want_*`) y luego
+    llaman a `load()` (o `aload()` si pueden ir a TMDB): se resuelve una
+    consulta por tipo de entidad con todo lo pendiente. Lo ya cargado queda
+    memorizado hasta el fin de la petición (ver `get_loader` en api/deps.py).
+    """
+
+    def __init__(self, db: Session, viewer_id: Optional[int] = None):
+        self.db = db
+        self.viewer_id = viewer_id  # Para user_has_liked / user_has_commented
+
+        self._users: Dict[int, Optional[User]] = {}
+        self._cards: Dict[int, Optional[Dict]] = {}
+        self._stats: Dict[Tuple[str, int], Dict] = {}
+
+        self._pending_users: Set[int] = set()
+        self._pending_movies: Set[int] = set()
+        self._pending_stats: Set[Tuple[str, int]] = set()
+
+    # ==================== REGISTRO ====================
+
+    def want_users(self, user_ids: Iterable[int]) -> None:
+        self._pending_users.update(i for i in user_ids if i is not None and i not in self._users)
+
+    def want_movies(self, movie_ids: Iterable[int]) -> None:
+        self._pending_movies.update(i for i in movie_ids if i is not None and i not in self._cards)
+
+    def want_stats(self, targets: Iterable[Tuple[str, int]]) -> None:
+        self._pending_stats.update(t for t in targets if t not in self._stats)
+
+    # ==================== CARGA ====================
+
+    def load(self) -> None:
+        """Resolver lo pendiente; las películas solo desde el catálogo (sin TMDB)"""
+        self._load_users()
+        self._load_stats()
+
+        if self._pending_movies:
+            movies = self.db.query(Movie).filter(Movie.tmdb_id.in_(self._pending_movies)).all()
+            cards = {movie.tmdb_id: MovieCatalogService.to_card(movie) for movie in movies}
+            for movie_id in self._pending_movies:
+                self._cards[movie_id] = cards.get(movie_id)
+            self._pending_movies.clear()
+
+    async def aload(self, concurrency: Optional[int] = None, deadline: Optional[float] = None) -> None:
+        """
+        Como `load`, pero las películas que faltan en el catálogo se piden a TMDB
+        en paralelo (`concurrency` y `deadline` como en MovieCatalogService.get_cards)
+        """
+        self._load_users()
+        self._load_stats()
+
+        if self._pending_movies:
+            pending = list(self._pending_movies)
+            self._pending_movies.clear()
+            cards = await MovieCatalogService.get_cards(
+                self.db, pending, concurrency=concurrency, deadline=deadline
+            )
+            for movie_id in pending:
+                self._cards[movie_id] = cards.get(movie_id)
+
+    def _load_users(self) -> None:
+        if not self._pending_users:
+            return
+
+        users = {user.id: user for user in self.db.query(User).filter(User.id.in_(self._pending_users)).all()}
+        for user_id in self._pending_users:
+            self._users[user_id] = users.get(user_id)
+        self._pending_users.clear()
+
+    def _load_stats(self) -> None:
+        if not self._pending_stats:
+            return
+
+        # Import diferido: InteractionService usa el loader para los comentarios
+        from app.services.interaction_service import InteractionService
+
+        self._stats.update(
+            InteractionService.get_interaction_stats_bulk(self.db, self.viewer_id, self._pending_stats)
+        )
+        self._pending_stats.clear()
+
+    # ==================== LECTURA ====================
+
+    def user(self, user_id: int) -> Optional[User]:
+        return self._users.get(user_id)
+
+    def card(self, movie_id: int) -> Optional[Dict]:
+        return self._cards.get(movie_id)
+
+    def stats(self, target_type: str, target_id: int) -> Dict:
+        return self._stats[(target_type, target_id)]
@@ -1,168 +1,160 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, union_all, select
-from typing import Dict
-from datetime import datetime
+from sqlalchemy import desc, and_, or_, func
+from typing import Dict, List, Optional, Tuple
+from app.config import settings
+from app.models.activity import Activity
 from app.models.rating import Rating
 from app.models.review import Review
 from app.models.list import List as MovieList
-from app.services.tmdb_service import TMDBService
-from app.services.interaction_service import InteractionService  # ⬅️ AGREGAR IMPORT
+from app.schemas.feed import FeedItem
+from app.services.movie_catalog_service import MovieCatalogService
+from app.services.data_loader import DataLoader
+from app.services.activity_service import ActivityService
+from app.utils.pagination import (
+    encode_cursor, decode_cursor, encode_score_cursor, decode_score_cursor, encode_id_cursor, decode_id_cursor
+)
+from app.utils.cache import TTLCache, FRESH
 
 
 class FeedService:
 
+    # Tipo de actividad -> target_type de likes y comentarios
+    TARGET_TYPES = {"rating": "rating", "review": "review", "list_created": "list"}
+
+    # Páginas del feed global sin estadísticas (iguales para todos los usuarios)
+    _page_cache = TTLCache(max_bytes=settings.FEED_CACHE_MAX_BYTES)
+    ITEM_SIZE = 1024  # Bytes aproximados por item para la contabilidad de la caché
+
     @staticmethod
     async def get_global_feed(
             db: Session,
             page: int = 1,
             limit: int = 20,
-            current_user_id: int = None  # ⬅️ AGREGAR PARÁMETRO
+            current_user_id: int = None,
+            cursor: Optional[str] = None,
+            loader: Optional[DataLoader] = None
     ) -> Dict:
         """
         Obtener feed global con todas las actividades
         Combina ratings, reviews y listas
+
+        La página (sin likes ni comentarios) se comparte entre usuarios desde
+        caché; encima se agregan las estadísticas y lo que hizo el usuario con
+        una consulta por lote.
         """
+        loader = loader or DataLoader(db, current_user_id)
+        key = FeedService._page_key(db, page, limit, cursor)
+
+        shared, state = FeedService._page_cache.get(key)
+        if state != FRESH:
+            shared = await FeedService._get_page(db, db.query(Activity), page, limit, DataLoader(db), cursor,
+                                                 with_stats=False)
+            # Solo datos planos: los objetos ORM no sobreviven a la sesión
+            shared["items"] = [FeedItem.model_validate(item).model_dump() for item in shared["items"]]
+            FeedService._page_cache.set(
+                key, shared, settings.FEED_CACHE_TTL, size=FeedService.ITEM_SIZE * (len(shared["items"]) + 1)
+            )
 
-        all_activities = []
+        loader.want_stats(FeedService._stats_key(item) for item in shared["items"])
+        loader.load()
 
-        # 1. Obtener ratings recientes
-        ratings = db.query(Rating) \
-            .order_by(desc(Rating.created_at)) \
-            .limit(limit * 3) \
-            .all()
+        # Sin cursor la clave ya trae la última actividad
+        latest = key[3] if key[0] == "page" else None
 
-        for rating in ratings:
-            try:
-                movie_data = await TMDBService.get_movie_details(rating.movie_tmdb_id)
-
-                # ⬇️ AGREGAR ESTADÍSTICAS DE INTERACCIÓN
-                stats = InteractionService.get_interaction_stats(
-                    db, current_user_id, 'rating', rating.id
-                ) if current_user_id else {
-                    "likes_count": InteractionService.get_likes_count(db, 'rating', rating.id),
-                    "comments_count": InteractionService.get_comments_count(db, 'rating', rating.id),
-                    "user_has_liked": False,
-                    "user_has_commented": False
-                }
-
-                all_activities.append({
-                    "id": f"rating_{rating.id}",
-                    "user_id": rating.user_id,
-                    "user": rating.user,
-                    "activity_type": "rating",
-                    "target_id": rating.id,  # ⬅️ AGREGAR
-                    "movie_tmdb_id": rating.movie_tmdb_id,
-                    "movie_title": movie_data.get("title"),
-                    "movie_poster": movie_data.get("poster_path"),
-                    "movie_backdrop": movie_data.get("backdrop_path"),
-                    "movie_rating_tmdb": movie_data.get("vote_average", 0) / 2,
-                    "rating": rating.rating,
-                    "created_at": rating.created_at,
-                    # ⬇️ AGREGAR ESTADÍSTICAS
-                    "likes_count": stats["likes_count"],
-                    "comments_count": stats["comments_count"],
-                    "user_has_liked": stats["user_has_liked"],
-                    "user_has_commented": stats["user_has_commented"]
-                })
-            except Exception as e:
-                print(f"Error fetching movie for rating {rating.id}: {e}")
-                continue
+        return {
+            **shared,
+            "latest_cursor": encode_id_cursor(latest) if latest else None,
+            "items": [{**item, **loader.stats(*FeedService._stats_key(item))} for item in shared["items"]]
+        }
 
-        # 2. Obtener reviews recientes
-        reviews = db.query(Review) \
-            .order_by(desc(Review.created_at)) \
-            .limit(limit * 3) \
+    @staticmethod
+    def count_new(db: Session, since: Optional[str], query=None) -> Dict:
+        """
+        Cuántas actividades hay después de `since` (latest_cursor de una
+        respuesta). Es un rango sobre la clave primaria y se corta en
+        FEED_NEW_COUNT_MAX, así que cuesta poco aunque el cliente consulte seguido.
+        """
+        since_id = decode_id_cursor(since) or 0
+        query = query if query is not None else db.query(Activity)
+
+        ids = [
+            row[0] for row in query.with_entities(Activity.id)
+            .filter(Activity.id > since_id)
+            .order_by(desc(Activity.id))
+            .limit(settings.FEED_NEW_COUNT_MAX + 1)
             .all()
+        ]
 
-        for review in reviews:
-            try:
-                movie_data = await TMDBService.get_movie_details(review.movie_tmdb_id)
-
-                # ⬇️ AGREGAR ESTADÍSTICAS DE INTERACCIÓN
-                stats = InteractionService.get_interaction_stats(
-                    db, current_user_id, 'review', review.id
-                ) if current_user_id else {
-                    "likes_count": InteractionService.get_likes_count(db, 'review', review.id),
-                    "comments_count": InteractionService.get_comments_count(db, 'review', review.id),
-                    "user_has_liked": False,
-                    "user_has_commented": False
-                }
-
-                all_activities.append({
-                    "id": f"review_{review.id}",
-                    "user_id": review.user_id,
-                    "user": review.user,
-                    "activity_type": "review",
-                    "target_id": review.id,  # ⬅️ AGREGAR
-                    "movie_tmdb_id": review.movie_tmdb_id,
-                    "movie_title": movie_data.get("title"),
-                    "movie_poster": movie_data.get("poster_path"),
-                    "movie_backdrop": movie_data.get("backdrop_path"),
-                    "movie_rating_tmdb": movie_data.get("vote_average", 0) / 2,
-                    "review_title": review.title,
-                    "review_content": review.content[:200] + "..." if len(review.content) > 200 else review.content,
-                    "review_contains_spoilers": review.contains_spoilers,
-                    "created_at": review.created_at,
-                    # ⬇️ AGREGAR ESTADÍSTICAS
-                    "likes_count": stats["likes_count"],
-                    "comments_count": stats["comments_count"],
-                    "user_has_liked": stats["user_has_liked"],
-                    "user_has_commented": stats["user_has_commented"]
-                })
-            except Exception as e:
-                print(f"Error fetching movie for review {review.id}: {e}")
-                continue
+        return {
+            "count": min(len(ids), settings.FEED_NEW_COUNT_MAX),
+            "has_more": len(ids) > settings.FEED_NEW_COUNT_MAX,
+            "latest_cursor": encode_id_cursor(ids[0]) if ids else since
+        }
 
-        # 3. Obtener listas creadas recientemente
-        lists = db.query(MovieList) \
-            .order_by(desc(MovieList.created_at)) \
-            .limit(limit * 2) \
-            .all()
+    @staticmethod
+    def _page_key(db: Session, page: int, limit: int, cursor: Optional[str]) -> Tuple:
+        """
+        Clave de caché de una página del feed global.
 
-        for lst in lists:
-            # ⬇️ AGREGAR ESTADÍSTICAS DE INTERACCIÓN
-            stats = InteractionService.get_interaction_stats(
-                db, current_user_id, 'list', lst.id
-            ) if current_user_id else {
-                "likes_count": InteractionService.get_likes_count(db, 'list', lst.id),
-                "comments_count": InteractionService.get_comments_count(db, 'list', lst.id),
-                "user_has_liked": False,
-                "user_has_commented": False
-            }
+        Una página con cursor no cambia cuando llegan actividades nuevas (quedan
+        antes del cursor). Sin cursor la página depende de la última actividad,
+        que se consulta por índice. `generation` cubre las ediciones y los borrados
+        de este worker (ver ActivityService.touch).
+        """
+        if cursor:
+            return "cursor", cursor, limit, ActivityService.generation
 
-            all_activities.append({
-                "id": f"list_{lst.id}",
-                "user_id": lst.user_id,
-                "user": lst.user,
-                "activity_type": "list_created",
-                "target_id": lst.id,  # ⬅️ AGREGAR
-                "list_id": lst.id,
-                "list_name": lst.name,
-                "list_description": lst.description,
-                "created_at": lst.created_at,
-                # ⬇️ AGREGAR ESTADÍSTICAS
-                "likes_count": stats["likes_count"],
-                "comments_count": stats["comments_count"],
-                "user_has_liked": stats["user_has_liked"],
-                "user_has_commented": stats["user_has_commented"]
-            })
-
-        # Ordenar todas las actividades por fecha
-        all_activities.sort(key=lambda x: x["created_at"], reverse=True)
-
-        # Paginación
-        start = (page - 1) * limit
-        end = start + limit
-        paginated_items = all_activities[start:end]
-
-        total_items = len(all_activities)
-        total_pages = (total_items + limit - 1) // limit
+        latest = db.query(func.max(Activity.id)).scalar()
+        return "page", page, limit, latest, ActivityService.generation
+
+    @staticmethod
+    def _stats_key(item: Dict) -> Tuple[str, int]:
+        return FeedService.TARGET_TYPES[item["activity_type"]], item["target_id"]
+
+    @staticmethod
+    def cache_stats() -> Dict:
+        return FeedService._page_cache.stats()
+
+    @staticmethod
+    async def get_hot_feed(
+            db: Session,
+            limit: int = 20,
+            current_user_id: int = None,
+            cursor: Optional[str] = None,
+            loader: Optional[DataLoader] = None
+    ) -> Dict:
+        """
+        Feed ordenado por engagement con decaimiento en el tiempo.
+        El puntaje se mantiene al escribir (ver ActivityService.hot_score), así
+        que una página es un recorrido por el índice (hot_score, id).
+        """
+        loader = loader or DataLoader(db, current_user_id)
+        query = db.query(Activity)
+
+        position = decode_score_cursor(cursor)
+        if position is not None:
+            score, activity_id = position
+            query = query.filter(or_(
+                Activity.hot_score < score,
+                and_(Activity.hot_score == score, Activity.id < activity_id)
+            ))
+
+        activities = query \
+            .order_by(desc(Activity.hot_score), desc(Activity.id)) \
+            .limit(limit + 1) \
+            .all()
+
+        next_cursor = None
+        if len(activities) > limit:
+            activities = activities[:limit]
+            next_cursor = encode_score_cursor(activities[-1].hot_score, activities[-1].id)
 
         return {
-            "items": paginated_items,
-            "page": page,
-            "total_pages": total_pages,
-            "total_items": total_items
+            "items": await FeedService._build_items(db, activities, loader),
+            "page": 1,
+            "total_pages": None,
+            "total_items": None,
+            "next_cursor": next_cursor
         }
 
     @staticmethod
@@ -171,133 +163,164 @@ class FeedService:
             user_id: int,
             page: int = 1,
             limit: int = 20,
-            current_user_id: int = None  # ⬅️ AGREGAR PARÁMETRO
+            current_user_id: int = None,
+            cursor: Optional[str] = None,
+            loader: Optional[DataLoader] = None
     ) -> Dict:
         """
         Obtener feed de un usuario específico
         """
+        query = db.query(Activity).filter(Activity.user_id == user_id)
+        loader = loader or DataLoader(db, current_user_id or user_id)
+        return await FeedService._get_page(db, query, page, limit, loader, cursor)
 
-        all_activities = []
+    @staticmethod
+    async def _get_page(
+            db: Session,
+            query,
+            page: int,
+            limit: int,
+            loader: DataLoader,
+            cursor: Optional[str] = None,
+            with_stats: bool = True
+    ) -> Dict:
+        """
+        Una página de actividades en orden (created_at, id) descendente.
 
-        # Ratings del usuario
-        ratings = db.query(Rating) \
-            .filter(Rating.user_id == user_id) \
-            .order_by(desc(Rating.created_at)) \
-            .limit(limit * 2) \
-            .all()
+        Con `cursor` se sigue desde la última actividad de la página anterior
+        (keyset): cuesta lo mismo a cualquier profundidad y no repite ni salta
+        items cuando llegan actividades nuevas. Sin cursor se usa `page`
+        (offset) y se calculan los totales; con cursor se omiten (quedan en None).
+        """
+        position = decode_cursor(cursor)
+        total_items = None
+
+        if position is not None:
+            created_at, activity_id = position
+            query = query.filter(or_(
+                Activity.created_at < created_at,
+                and_(Activity.created_at == created_at, Activity.id < activity_id)
+            ))
+        else:
+            total_items = query.count()
+
+        query = query.order_by(desc(Activity.created_at), desc(Activity.id))
+        if position is None:
+            query = query.offset((page - 1) * limit)
+
+        # Una fila extra para saber si hay página siguiente
+        activities = query.limit(limit + 1).all()
+
+        next_cursor = None
+        if len(activities) > limit:
+            activities = activities[:limit]
+            next_cursor = encode_cursor(activities[-1].created_at, activities[-1].id)
 
-        for rating in ratings:
-            try:
-                movie_data = await TMDBService.get_movie_details(rating.movie_tmdb_id)
-
-                # ⬇️ AGREGAR ESTADÍSTICAS DE INTERACCIÓN
-                stats = InteractionService.get_interaction_stats(
-                    db, current_user_id or user_id, 'rating', rating.id
-                )
-
-                all_activities.append({
-                    "id": f"rating_{rating.id}",
-                    "user_id": rating.user_id,
-                    "user": rating.user,
-                    "activity_type": "rating",
-                    "target_id": rating.id,
-                    "movie_tmdb_id": rating.movie_tmdb_id,
-                    "movie_title": movie_data.get("title"),
-                    "movie_poster": movie_data.get("poster_path"),
-                    "movie_backdrop": movie_data.get("backdrop_path"),
-                    "movie_rating_tmdb": movie_data.get("vote_average", 0) / 2,
-                    "rating": rating.rating,
-                    "created_at": rating.created_at,
-                    "likes_count": stats["likes_count"],
-                    "comments_count": stats["comments_count"],
-                    "user_has_liked": stats["user_has_liked"],
-                    "user_has_commented": stats["user_has_commented"]
-                })
-            except:
-                continue
+        return {
+            "items": await FeedService._build_items(db, activities, loader, with_stats),
+            "page": page,
+            "total_pages": (total_items + limit - 1) // limit if total_items is not None else None,
+            "total_items": total_items,
+            "next_cursor": next_cursor
+        }
 
-        # Reviews del usuario
-        reviews = db.query(Review) \
-            .filter(Review.user_id == user_id) \
-            .order_by(desc(Review.created_at)) \
-            .limit(limit * 2) \
-            .all()
+    @staticmethod
+    async def _build_items(
+            db: Session,
+            activities: List[Activity],
+            loader: DataLoader,
+            with_stats: bool = True
+    ) -> List[Dict]:
+        """
+        Armar los items en etapas:
+        1. Filas: los objetos de cada actividad (una consulta por tipo).
+        2. Enriquecimiento: autores, estadísticas y tarjetas de todas las
+           actividades a la vez; las películas que faltan en el catálogo se piden
+           a TMDB en paralelo con un límite, así la página cuesta más o menos una
+           latencia de TMDB (y nunca más que FEED_TMDB_DEADLINE).
+        3. Armado de los items en el orden de las actividades.
+        """
+        ids_by_type: Dict[str, List[int]] = {}
+        for activity in activities:
+            ids_by_type.setdefault(activity.activity_type, []).append(activity.target_id)
+
+        ratings = db.query(Rating).filter(Rating.id.in_(ids_by_type["rating"])).all() \
+            if "rating" in ids_by_type else []
+        reviews = db.query(Review).filter(Review.id.in_(ids_by_type["review"])).all() \
+            if "review" in ids_by_type else []
+        lists = db.query(MovieList).filter(MovieList.id.in_(ids_by_type["list_created"])).all() \
+            if "list_created" in ids_by_type else []
+
+        targets = {
+            **{("rating", r.id): r for r in ratings},
+            **{("review", r.id): r for r in reviews},
+            **{("list_created", lst.id): lst for lst in lists}
+        }
+
+        # La actividad ya trae autor y película: se piden todos juntos
+        loader.want_users(activity.user_id for activity in activities)
+        loader.want_movies(activity.movie_tmdb_id for activity in activities)
+        if with_stats:
+            loader.want_stats(
+                (FeedService.TARGET_TYPES[activity.activity_type], activity.target_id) for activity in activities
+            )
+        await loader.aload(concurrency=settings.FEED_TMDB_CONCURRENCY, deadline=settings.FEED_TMDB_DEADLINE)
+
+        items = []
+        for activity in activities:
+            target = targets.get((activity.activity_type, activity.target_id))
+            if target is None:
+                continue
 
-        for review in reviews:
             try:
-                movie_data = await TMDBService.get_movie_details(review.movie_tmdb_id)
-
-                # ⬇️ AGREGAR ESTADÍSTICAS DE INTERACCIÓN
-                stats = InteractionService.get_interaction_stats(
-                    db, current_user_id or user_id, 'review', review.id
-                )
-
-                all_activities.append({
-                    "id": f"review_{review.id}",
-                    "user_id": review.user_id,
-                    "user": review.user,
-                    "activity_type": "review",
-                    "target_id": review.id,
-                    "movie_tmdb_id": review.movie_tmdb_id,
-                    "movie_title": movie_data.get("title"),
-                    "movie_poster": movie_data.get("poster_path"),
-                    "movie_backdrop": movie_data.get("backdrop_path"),
-                    "movie_rating_tmdb": movie_data.get("vote_average", 0) / 2,
-                    "review_title": review.title,
-                    "review_content": review.content[:200] + "..." if len(review.content) > 200 else review.content,
-                    "review_contains_spoilers": review.contains_spoilers,
-                    "created_at": review.created_at,
-                    "likes_count": stats["likes_count"],
-                    "comments_count": stats["comments_count"],
-                    "user_has_liked": stats["user_has_liked"],
-                    "user_has_commented": stats["user_has_commented"]
-                })
-            except:
+                item = FeedService._to_item(activity.activity_type, target, loader)
+                if with_stats:
+                    item.update(loader.stats(FeedService.TARGET_TYPES[activity.activity_type], target.id))
+                items.append(item)
+            except Exception as e:
+                print(f"Error building feed item {activity.activity_type} {activity.target_id}: {e}")
                 continue
 
-        # Listas del usuario
-        lists = db.query(MovieList) \
-            .filter(MovieList.user_id == user_id) \
-            .order_by(desc(MovieList.created_at)) \
-            .limit(limit) \
-            .all()
+        return items
 
-        for lst in lists:
-            # ⬇️ AGREGAR ESTADÍSTICAS DE INTERACCIÓN
-            stats = InteractionService.get_interaction_stats(
-                db, current_user_id or user_id, 'list', lst.id
-            )
-
-            all_activities.append({
-                "id": f"list_{lst.id}",
-                "user_id": lst.user_id,
-                "user": lst.user,
+    @staticmethod
+    def _to_item(activity_type: str, target, loader: DataLoader) -> Dict:
+        """Campos del item según el tipo de actividad"""
+        if activity_type == "list_created":
+            return {
+                "id": f"list_{target.id}",
+                "user_id": target.user_id,
+                "user": loader.user(target.user_id),
                 "activity_type": "list_created",
-                "target_id": lst.id,
-                "list_id": lst.id,
-                "list_name": lst.name,
-                "list_description": lst.description,
-                "created_at": lst.created_at,
-                "likes_count": stats["likes_count"],
-                "comments_count": stats["comments_count"],
-                "user_has_liked": stats["user_has_liked"],
-                "user_has_commented": stats["user_has_commented"]
-            })
-
-        # Ordenar por fecha
-        all_activities.sort(key=lambda x: x["created_at"], reverse=True)
-
-        # Paginación
-        start = (page - 1) * limit
-        end = start + limit
-        paginated_items = all_activities[start:end]
-
-        total_items = len(all_activities)
-        total_pages = (total_items + limit - 1) // limit
+                "target_id": target.id,
+                "list_id": target.id,
+                "list_name": target.name,
+                "list_description": target.description,
+                "created_at": target.created_at
+            }
 
-        return {
-            "items": paginated_items,
-            "page": page,
-            "total_pages": total_pages,
-            "total_items": total_items
-        }
\ No newline at end of file
+        movie_data = loader.card(target.movie_tmdb_id) \
+            or MovieCatalogService.degraded_card(target.movie_tmdb_id)
+
+        item = {
+            "id": f"{activity_type}_{target.id}",
+            "user_id": target.user_id,
+            "user": loader.user(target.user_id),
+            "activity_type": activity_type,
+            "target_id": target.id,
+            "movie_tmdb_id": target.movie_tmdb_id,
+            "movie_title": movie_data.get("title"),
+            "movie_poster": movie_data.get("poster_path"),
+            "movie_backdrop": movie_data.get("backdrop_path"),
+            "movie_rating_tmdb": movie_data.get("vote_average", 0) / 2,
+            "created_at": target.created_at
+        }
+
+        if activity_type == "rating":
+            item["rating"] = target.rating
+        else:
+            item["review_title"] = target.title
+            item["review_content"] = target.content[:200] + "..." if len(target.content) > 200 else target.content
+            item["review_contains_spoilers"] = target.contains_spoilers
+
+        return item
@@ -0,0 +1,92 @@
+from typing import List
+from sqlalchemy import desc
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from app.config import settings
+from app.models.activity import Activity
+from app.models.follow import Follow
+from app.models.user import User
+from app.services.timeline_service import TimelineService
+
+
+class FollowService:
+
+    @staticmethod
+    def follow(db: Session, follower_id: int, followed_id: int) -> Follow:
+        """Seguir a un usuario y traer su actividad reciente al timeline"""
+        if follower_id == followed_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No puedes seguirte a ti mismo"
+            )
+
+        if not db.query(User.id).filter(User.id == followed_id).first():
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Usuario no encontrado"
+            )
+
+        existing = db.query(Follow).filter(
+            Follow.follower_id == follower_id,
+            Follow.followed_id == followed_id
+        ).first()
+        if existing:
+            return existing
+
+        follow = Follow(follower_id=follower_id, followed_id=followed_id)
+        db.add(follow)
+        db.flush()
+
+        # Las cuentas grandes se leen al pedir el timeline
+        if not TimelineService.is_pulled(db, followed_id):
+            recent = db.query(Activity.id) \
+                .filter(Activity.user_id == followed_id) \
+                .order_by(desc(Activity.id)) \
+                .limit(settings.FEED_TIMELINE_MAX_LENGTH) \
+                .all()
+            TimelineService.push(db, [follower_id], [row[0] for row in recent])
+
+        db.commit()
+        db.refresh(follow)
+        return follow
+
+    @staticmethod
+    def unfollow(db: Session, follower_id: int, followed_id: int) -> bool:
+        """Dejar de seguir a un usuario y quitar su actividad del timeline"""
+        follow = db.query(Follow).filter(
+            Follow.follower_id == follower_id,
+            Follow.followed_id == followed_id
+        ).first()
+
+        if not follow:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="No sigues a este usuario"
+            )
+
+        db.delete(follow)
+        TimelineService.drop_author(db, follower_id, followed_id)
+        db.commit()
+        return True
+
+    @staticmethod
+    def get_followers(db: Session, user_id: int, skip: int = 0, limit: int = 50) -> List[User]:
+        """Usuarios que siguen a user_id"""
+        return db.query(User) \
+            .join(Follow, Follow.follower_id == User.id) \
+            .filter(Follow.followed_id == user_id) \
+            .order_by(desc(Follow.created_at), desc(Follow.id)) \
+            .offset(skip) \
+            .limit(limit) \
+            .all()
+
+    @staticmethod
+    def get_following(db: Session, user_id: int, skip: int = 0, limit: int = 50) -> List[User]:
+        """Usuarios a los que sigue user_id"""
+        return db.query(User) \
+            .join(Follow, Follow.followed_id == User.id) \
+            .filter(Follow.follower_id == user_id) \
+            .order_by(desc(Follow.created_at), desc(Follow.id)) \
+            .offset(skip) \
+            .limit(limit) \
+            .all()
@@ -0,0 +1,198 @@
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.database import SessionLocal
+from app.models.genre import Genre
+from app.models.movie import Movie
+from app.services.tmdb_service import TMDBService
+from app.utils.locale import use_language
+
+
+class GenreService:
+    """
+    Catálogo de géneros de TMDB y máscaras de bits por película.
+
+    Cada género tiene un bit fijo (Genre.bit) y cada película del catálogo
+    guarda en `genre_mask` el OR de los bits de sus géneros. Los filtros y
+    conteos por género se hacen con operaciones de bits sobre arrays de NumPy
+    en lugar de recorrer películas una por una.
+    """
+
+    MAX_BITS = 63  # BIGINT con signo
+
+    # Caché por worker: {genre_id: (nombre, bit)}
+    _genres: Dict[int, Tuple[Optional[str], int]] = {}
+
+    # Arrays del catálogo (ids, máscaras, promedio, votos) y cuándo se cargaron
+    _arrays: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = None
+    _arrays_loaded_at = 0.0
+
+    # ==================== CATÁLOGO DE GÉNEROS ====================
+
+    @staticmethod
+    def load(db: Session) -> None:
+        """Cargar los géneros de la BD en memoria"""
+        GenreService._genres = {genre.id: (genre.name, genre.bit) for genre in db.query(Genre).all()}
+
+    @staticmethod
+    async def sync_genres() -> int:
+        """
+        Traer la lista de géneros de TMDB y registrar los nuevos con el próximo
+        bit libre. Luego recalcula las máscaras de las películas que quedaron sin ella.
+        """
+        db = SessionLocal()
+        try:
+            # Aunque TMDB falle, los géneros ya guardados sirven
+            GenreService.load(db)
+
+            with use_language(None):
+                data = await TMDBService.get_response("genres")
+            if not data.is_success:
+                return 0
+
+            genres = {genre.id: genre for genre in db.query(Genre).all()}
+            used_bits = {genre.bit for genre in genres.values()}
+            added = 0
+
+            for item in data.data.get("genres", []):
+                genre = genres.get(item["id"])
+                if genre is not None:
+                    genre.name = item.get("name")
+                    continue
+
+                bit = next((b for b in range(GenreService.MAX_BITS) if b not in used_bits), None)
+                if bit is None:
+                    print(f"⚠️ Sin bits libres para el género {item['id']}")
+                    continue
+
+                used_bits.add(bit)
+                db.add(Genre(id=item["id"], name=item.get("name"), bit=bit))
+                added += 1
+
+            db.commit()
+            GenreService.load(db)
+
+            # Con géneros nuevos cambian todas las máscaras; si no, solo faltan las
+            # de películas guardadas antes de cargar los géneros
+            GenreService.recompute_masks(db, only_missing=not added)
+            return added
+        except Exception as e:
+            print(f"Error syncing genres: {e}")
+            db.rollback()
+            return 0
+        finally:
+            db.close()
+
+    @staticmethod
+    def recompute_masks(db: Session, only_missing: bool = False) -> int:
+        """Recalcular `genre_mask` a partir de `genre_ids` donde no coincidan"""
+        query = db.query(Movie).filter(Movie.genre_ids.isnot(None))
+        if only_missing:
+            query = query.filter(Movie.genre_mask == 0)
+
+        updated = 0
+        for movie in query.all():
+            mask = GenreService.mask_for(movie.genre_ids)
+            if mask != (movie.genre_mask or 0):
+                movie.genre_mask = mask
+                updated += 1
+
+        if updated:
+            db.commit()
+            GenreService._arrays = None
+        return updated
+
+    @staticmethod
+    def mask_for(genre_ids: Optional[Iterable[int]]) -> int:
+        """Máscara de bits de una lista de géneros (los desconocidos se ignoran)"""
+        mask = 0
+        for genre_id in genre_ids or []:
+            genre = GenreService._genres.get(genre_id)
+            if genre is not None:
+                mask |= 1 << genre[1]
+        return mask
+
+    @staticmethod
+    def name(genre_id: int) -> Optional[str]:
+        genre = GenreService._genres.get(genre_id)
+        return genre[0] if genre else None
+
+    @staticmethod
+    def describe(genre_ids: Optional[Iterable[int]]) -> List[Dict]:
+        """[{id, name}] como los devuelve TMDB en el detalle"""
+        return [{"id": genre_id, "name": GenreService.name(genre_id)} for genre_id in genre_ids or []]
+
+    @staticmethod
+    def bit(genre_id: int) -> Optional[int]:
+        genre = GenreService._genres.get(genre_id)
+        return genre[1] if genre else None
+
+    @staticmethod
+    def _bit_genres() -> np.ndarray:
+        """genre_id de cada bit (0 donde no hay género)"""
+        by_bit = np.zeros(GenreService.MAX_BITS + 1, dtype=np.int64)
+        for genre_id, (_, bit) in GenreService._genres.items():
+            by_bit[bit] = genre_id
+        return by_bit
+
+    # ==================== OPERACIONES VECTORIZADAS ====================
+
+    @staticmethod
+    def unpack(masks: np.ndarray) -> np.ndarray:
+        """Máscaras (n,) -> matriz de bits (n, 64) con el bit 0 en la columna 0"""
+        as_bytes = masks.astype("<u8").view(np.uint8).reshape(-1, 8)
+        return np.unpackbits(as_bytes, axis=1, bitorder="little")
+
+    @staticmethod
+    def bit_totals(masks: np.ndarray, weights: Optional[np.ndarray] = None) -> np.ndarray:
+        """Suma de `weights` (o conteo) por bit: vector de 64 posiciones"""
+        if masks.size == 0:
+            return np.zeros(GenreService.MAX_BITS + 1)
+
+        bits = GenreService.unpack(masks)
+        return (weights.astype(np.float64) @ bits) if weights is not None else bits.sum(axis=0)
+
+    @staticmethod
+    def genre_weights(masks: np.ndarray, weights: Optional[np.ndarray] = None) -> Dict[int, float]:
+        """Suma de `weights` (o conteo) por género sobre un conjunto de películas"""
+        totals = GenreService.bit_totals(masks, weights)
+        by_bit = GenreService._bit_genres()
+
+        return {
+            int(by_bit[bit]): float(totals[bit])
+            for bit in np.nonzero(totals)[0]
+            if by_bit[bit]
+        }
+
+    @staticmethod
+    def catalog_arrays(db: Session) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        (ids, máscaras, vote_average, vote_count) de las películas sincronizadas.
+        Se recargan como mucho cada GENRE_ARRAYS_TTL segundos.
+        """
+        if GenreService._arrays is not None and \
+                time.monotonic() - GenreService._arrays_loaded_at < settings.GENRE_ARRAYS_TTL:
+            return GenreService._arrays
+
+        rows = db.query(Movie.tmdb_id, Movie.genre_mask, Movie.vote_average, Movie.vote_count) \
+            .filter(Movie.synced_at.isnot(None), Movie.genre_mask != 0) \
+            .all()
+
+        GenreService._arrays = (
+            np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows)),
+            np.fromiter((r[1] for r in rows), dtype=np.uint64, count=len(rows)),
+            np.fromiter((r[2] or 0 for r in rows), dtype=np.float64, count=len(rows)),
+            np.fromiter((r[3] or 0 for r in rows), dtype=np.int64, count=len(rows))
+        )
+        GenreService._arrays_loaded_at = time.monotonic()
+        return GenreService._arrays
+
+    @staticmethod
+    def movie_masks(db: Session, movie_ids: List[int]) -> Dict[int, int]:
+        """{movie_tmdb_id: genre_mask} de las películas indicadas"""
+        if not movie_ids:
+            return {}
+        rows = db.query(Movie.tmdb_id, Movie.genre_mask).filter(Movie.tmdb_id.in_(movie_ids)).all()
+        return {movie_id: mask or 0 for movie_id, mask in rows}
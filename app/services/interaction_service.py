@@ -1,11 +1,14 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import func, and_, or_, literal, select, union_all
 from fastapi import HTTPException, status
-from typing import List, Dict
+from typing import Dict, Iterable, List, Optional, Tuple
 from app.models.like import Like
 from app.models.comment import Comment
 from app.schemas.interaction import CommentCreate, CommentUpdate
 from app.services.notification_helpers import notify_on_comment
+from app.services.counter_service import CounterService
+from app.services.activity_service import ActivityService
+from app.services.data_loader import DataLoader
 
 
 class InteractionService:
@@ -24,6 +27,8 @@ class InteractionService:
 
         if existing_like:
             db.delete(existing_like)
+            CounterService.increment(db, target_type, target_id, likes=-1)
+            ActivityService.update_hot_score(db, target_type, target_id)
             db.commit()
             return {"liked": False, "message": "Like eliminado"}
         else:
@@ -33,16 +38,15 @@ class InteractionService:
                 target_id=target_id
             )
             db.add(new_like)
+            CounterService.increment(db, target_type, target_id, likes=1)
+            ActivityService.update_hot_score(db, target_type, target_id)
             db.commit()
             return {"liked": True, "message": "Like agregado"}
 
     @staticmethod
     def get_likes_count(db: Session, target_type: str, target_id: int) -> int:
         """Obtener cantidad de likes"""
-        return db.query(Like).filter(
-            Like.target_type == target_type,
-            Like.target_id == target_id
-        ).count()
+        return CounterService.get_counts(db, target_type, target_id)[0]
 
     @staticmethod
     def user_has_liked(db: Session, user_id: int, target_type: str, target_id: int) -> bool:
@@ -84,6 +88,8 @@ class InteractionService:
         )
 
         db.add(new_comment)
+        CounterService.increment(db, comment_data.target_type, comment_data.target_id, comments=1)
+        ActivityService.update_hot_score(db, comment_data.target_type, comment_data.target_id)
         db.commit()
         db.refresh(new_comment)
 
@@ -104,7 +110,8 @@ class InteractionService:
             target_id: int,
             current_user_id: int,
             skip: int = 0,
-            limit: int = 50
+            limit: int = 50,
+            loader: Optional[DataLoader] = None
     ) -> List[Dict]:
         """Obtener comentarios con estadísticas"""
 
@@ -115,35 +122,10 @@ class InteractionService:
             Comment.parent_id == None
         ).order_by(Comment.created_at.desc()).offset(skip).limit(limit).all()
 
-        result = []
-        for comment in comments:
-            # Contar respuestas
-            replies_count = db.query(Comment).filter(
-                Comment.parent_id == comment.id
-            ).count()
-
-            # Contar likes del comentario
-            likes_count = InteractionService.get_likes_count(db, 'comment', comment.id)
-
-            # Verificar si el usuario actual dio like
-            user_has_liked = InteractionService.user_has_liked(db, current_user_id, 'comment', comment.id)
-
-            result.append({
-                "id": comment.id,
-                "user_id": comment.user_id,
-                "user": comment.user,
-                "target_type": comment.target_type,
-                "target_id": comment.target_id,
-                "content": comment.content,
-                "parent_id": comment.parent_id,
-                "created_at": comment.created_at,
-                "updated_at": comment.updated_at,
-                "replies_count": replies_count,
-                "likes_count": likes_count,
-                "user_has_liked": user_has_liked
-            })
-
-        return result
+        replies_counts = InteractionService.get_replies_counts(db, [comment.id for comment in comments])
+        return InteractionService._comments_to_dicts(
+            comments, loader or DataLoader(db, current_user_id), replies_counts
+        )
 
     @staticmethod
     def get_comment_replies(
@@ -151,7 +133,8 @@ class InteractionService:
             comment_id: int,
             current_user_id: int,
             skip: int = 0,
-            limit: int = 20
+            limit: int = 20,
+            loader: Optional[DataLoader] = None
     ) -> List[Dict]:
         """Obtener respuestas de un comentario"""
 
@@ -159,24 +142,36 @@ class InteractionService:
             Comment.parent_id == comment_id
         ).order_by(Comment.created_at.asc()).offset(skip).limit(limit).all()
 
+        return InteractionService._comments_to_dicts(replies, loader or DataLoader(db, current_user_id))
+
+    @staticmethod
+    def _comments_to_dicts(
+            comments: List[Comment],
+            loader: DataLoader,
+            replies_counts: Optional[Dict[int, int]] = None
+    ) -> List[Dict]:
+        """Comentarios con autor y estadísticas (una consulta por tipo de dato para todos)"""
+        loader.want_users(comment.user_id for comment in comments)
+        loader.want_stats(('comment', comment.id) for comment in comments)
+        loader.load()
+
         result = []
-        for reply in replies:
-            likes_count = InteractionService.get_likes_count(db, 'comment', reply.id)
-            user_has_liked = InteractionService.user_has_liked(db, current_user_id, 'comment', reply.id)
+        for comment in comments:
+            comment_stats = loader.stats('comment', comment.id)
 
             result.append({
-                "id": reply.id,
-                "user_id": reply.user_id,
-                "user": reply.user,
-                "target_type": reply.target_type,
-                "target_id": reply.target_id,
-                "content": reply.content,
-                "parent_id": reply.parent_id,
-                "created_at": reply.created_at,
-                "updated_at": reply.updated_at,
-                "replies_count": 0,
-                "likes_count": likes_count,
-                "user_has_liked": user_has_liked
+                "id": comment.id,
+                "user_id": comment.user_id,
+                "user": loader.user(comment.user_id),
+                "target_type": comment.target_type,
+                "target_id": comment.target_id,
+                "content": comment.content,
+                "parent_id": comment.parent_id,
+                "created_at": comment.created_at,
+                "updated_at": comment.updated_at,
+                "replies_count": (replies_counts or {}).get(comment.id, 0),
+                "likes_count": comment_stats["likes_count"],
+                "user_has_liked": comment_stats["user_has_liked"]
             })
 
         return result
@@ -217,16 +212,28 @@ class InteractionService:
             )
 
         db.delete(comment)
+
+        # Descontar también lo que se borra en cascada (relación con el padre y
+        # respuestas por FK): todo es del mismo objeto
+        removed = {obj.id for obj in db.deleted if isinstance(obj, Comment)}
+        parent_ids = list(removed)
+        with db.no_autoflush:
+            while parent_ids:
+                parent_ids = [
+                    row[0] for row in db.query(Comment.id).filter(Comment.parent_id.in_(parent_ids)).all()
+                    if row[0] not in removed
+                ]
+                removed.update(parent_ids)
+
+        CounterService.increment(db, comment.target_type, comment.target_id, comments=-len(removed))
+        ActivityService.update_hot_score(db, comment.target_type, comment.target_id)
         db.commit()
         return True
 
     @staticmethod
     def get_comments_count(db: Session, target_type: str, target_id: int) -> int:
         """Obtener cantidad total de comentarios"""
-        return db.query(Comment).filter(
-            Comment.target_type == target_type,
-            Comment.target_id == target_id
-        ).count()
+        return CounterService.get_counts(db, target_type, target_id)[1]
 
     # ==================== STATS ====================
 
@@ -254,4 +261,86 @@ class InteractionService:
             "comments_count": comments_count,
             "user_has_liked": user_has_liked,
             "user_has_commented": user_has_commented
-        }
\ No newline at end of file
+        }
+
+    @staticmethod
+    def _targets_filter(model, targets: Dict[str, List[int]]):
+        """(target_type = t AND target_id IN (...)) OR ... para varios tipos a la vez"""
+        return or_(*[
+            and_(model.target_type == target_type, model.target_id.in_(ids))
+            for target_type, ids in targets.items()
+        ])
+
+    @staticmethod
+    def get_interaction_stats_bulk(
+            db: Session,
+            user_id: Optional[int],
+            targets: Iterable[Tuple[str, int]]
+    ) -> Dict[Tuple[str, int], Dict]:
+        """
+        Estadísticas de muchos objetos con una consulta por campo (en lugar de
+        cuatro consultas por objeto). Retorna
+        {(target_type, target_id): stats} con los mismos campos que get_interaction_stats.
+        Sin `user_id` los campos user_has_* quedan en False.
+        """
+        by_type: Dict[str, List[int]] = {}
+        for target_type, target_id in dict.fromkeys(targets):
+            by_type.setdefault(target_type, []).append(target_id)
+
+        stats = {
+            (target_type, target_id): {
+                "likes_count": 0,
+                "comments_count": 0,
+                "user_has_liked": False,
+                "user_has_commented": False
+            }
+            for target_type, ids in by_type.items() for target_id in ids
+        }
+        if not stats:
+            return stats
+
+        for key, (likes_count, comments_count) in CounterService.get_counts_bulk(db, by_type).items():
+            stats[key]["likes_count"] = likes_count
+            stats[key]["comments_count"] = comments_count
+
+        if user_id:
+            for key, flags in InteractionService.get_user_flags(db, user_id, by_type).items():
+                stats[key].update(flags)
+
+        return stats
+
+    @staticmethod
+    def get_user_flags(db: Session, user_id: int, targets: Dict[str, List[int]]) -> Dict[Tuple[str, int], Dict]:
+        """
+        user_has_liked / user_has_commented del usuario sobre los objetos
+        (agrupados por tipo) con una sola consulta. Solo incluye los que tienen alguno.
+        """
+        if not targets:
+            return {}
+
+        liked = select(Like.target_type, Like.target_id, literal("like").label("kind")) \
+            .where(Like.user_id == user_id, InteractionService._targets_filter(Like, targets))
+        commented = select(Comment.target_type, Comment.target_id, literal("comment").label("kind")) \
+            .where(Comment.user_id == user_id, InteractionService._targets_filter(Comment, targets))
+
+        flags: Dict[Tuple[str, int], Dict] = {}
+        for target_type, target_id, kind in db.execute(union_all(liked, commented)).all():
+            target_flags = flags.setdefault((target_type, target_id), {
+                "user_has_liked": False,
+                "user_has_commented": False
+            })
+            target_flags["user_has_liked" if kind == "like" else "user_has_commented"] = True
+
+        return flags
+
+    @staticmethod
+    def get_replies_counts(db: Session, comment_ids: List[int]) -> Dict[int, int]:
+        """{comment_id: respuestas} con una sola consulta"""
+        if not comment_ids:
+            return {}
+
+        rows = db.query(Comment.parent_id, func.count(Comment.id)) \
+            .filter(Comment.parent_id.in_(comment_ids)) \
+            .group_by(Comment.parent_id) \
+            .all()
+        return dict(rows)
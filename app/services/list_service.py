@@ -1,8 +1,12 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import text
+from typing import Optional
+from sqlalchemy import text, func
 from fastapi import HTTPException, status
 from app.models.list import List, list_movies
 from app.schemas.list import ListCreate, ListUpdate
+from app.services.movie_catalog_service import MovieCatalogService
+from app.services.activity_service import ActivityService
+from app.services.data_loader import DataLoader
 
 
 class ListService:
@@ -19,23 +23,33 @@ class ListService:
         )
 
         db.add(new_list)
+        db.flush()
+        db.refresh(new_list, ["created_at"])
+        ActivityService.record(db, user_id, "list_created", new_list.id, new_list.created_at)
         db.commit()
+        ActivityService.touch()
         db.refresh(new_list)
         return new_list
 
     @staticmethod
-    def get_user_lists(db: Session, user_id: int):
+    def get_user_lists(db: Session, user_id: int, loader: Optional[DataLoader] = None):
         """Obtener listas del usuario"""
         lists = db.query(List).filter(List.user_id == user_id).all()
 
-        # Agregar conteo de películas
+        # Conteo de películas de todas las listas en una consulta
+        movies_counts = dict(
+            db.query(list_movies.c.list_id, func.count(list_movies.c.id))
+            .filter(list_movies.c.list_id.in_([lst.id for lst in lists]))
+            .group_by(list_movies.c.list_id)
+            .all()
+        ) if lists else {}
+
+        loader = loader or DataLoader(db)
+        loader.want_users(lst.user_id for lst in lists)
+        loader.load()
+
         result = []
         for lst in lists:
-            movies_count = db.execute(
-                text("SELECT COUNT(*) FROM list_movies WHERE list_id = :list_id"),
-                {"list_id": lst.id}
-            ).scalar()
-
             list_dict = {
                 "id": lst.id,
                 "user_id": lst.user_id,
@@ -45,8 +59,8 @@ class ListService:
                 "is_collaborative": lst.is_collaborative,
                 "created_at": lst.created_at,
                 "updated_at": lst.updated_at,
-                "movies_count": movies_count or 0,
-                "user": lst.user
+                "movies_count": movies_counts.get(lst.id, 0),
+                "user": loader.user(lst.user_id)
             }
             result.append(list_dict)
 
@@ -122,6 +136,7 @@ class ListService:
             lst.is_public = list_data.is_public
 
         db.commit()
+        ActivityService.touch()
         db.refresh(lst)
         return lst
 
@@ -136,8 +151,10 @@ class ListService:
                 detail="Lista no encontrada"
             )
 
+        ActivityService.remove(db, "list_created", lst.id)
         db.delete(lst)
         db.commit()
+        ActivityService.touch()
         return True
 
     @staticmethod
@@ -175,6 +192,7 @@ class ListService:
             text("INSERT INTO list_movies (list_id, movie_tmdb_id, position) VALUES (:list_id, :movie_id, 0)"),
             {"list_id": list_id, "movie_id": movie_tmdb_id}
         )
+        MovieCatalogService.register_movie(db, movie_tmdb_id)
         db.commit()
         return True
 
@@ -0,0 +1,321 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy.orm import Session
+from sqlalchemy import insert, select, union, or_
+from app.config import settings
+from app.database import SessionLocal
+from app.models.movie import Movie
+from app.models.rating import Rating
+from app.models.review import Review
+from app.models.list import list_movies
+from app.services.tmdb_service import TMDBService
+from app.services.movie_search_service import MovieSearchService
+from app.services.genre_service import GenreService
+from app.utils.locale import use_language
+
+
+class MovieCatalogService:
+    """
+    Catálogo local de películas.
+
+    Guarda los campos de tarjeta (título, póster, etc.) para que feed,
+    rankings, estadísticas y recomendaciones no necesiten una llamada a
+    TMDB por película. Las películas se registran al calificarlas, reseñarlas
+    o agregarlas a una lista y un job en segundo plano las sincroniza.
+    """
+
+    # ==================== ESCRITURA ====================
+
+    @staticmethod
+    def register_movies(db: Session, movie_ids: Iterable[int]) -> None:
+        """
+        Registrar películas sin datos (si no existen) dentro de la transacción actual.
+        No hace commit: se confirma junto con el rating/review/lista.
+        """
+        ids = {int(movie_id) for movie_id in movie_ids if movie_id}
+        if not ids:
+            return
+
+        dialect = db.get_bind().dialect.name
+        stmt = insert(Movie)
+        if dialect == "mysql":
+            stmt = stmt.prefix_with("IGNORE")
+        elif dialect == "sqlite":
+            stmt = stmt.prefix_with("OR IGNORE")
+        else:
+            existing = {row[0] for row in db.query(Movie.tmdb_id).filter(Movie.tmdb_id.in_(ids)).all()}
+            ids -= existing
+            if not ids:
+                return
+
+        db.execute(stmt, [{"tmdb_id": movie_id} for movie_id in sorted(ids)])
+
+    @staticmethod
+    def register_movie(db: Session, movie_tmdb_id: int) -> None:
+        """Registrar una película sin datos (ver register_movies)"""
+        MovieCatalogService.register_movies(db, [movie_tmdb_id])
+
+    @staticmethod
+    def upsert_from_tmdb(db: Session, data: Dict) -> Optional[Movie]:
+        """Crear o actualizar la película con la respuesta de TMDB (sin commit)"""
+        movie_id = data.get("id")
+        if not movie_id:
+            return None
+
+        MovieCatalogService.register_movie(db, movie_id)
+        movie = db.get(Movie, movie_id)
+
+        # Los listados traen 'genre_ids'; el detalle trae 'genres' [{id, name}]
+        genre_ids = data.get("genre_ids")
+        if genre_ids is None and data.get("genres") is not None:
+            genre_ids = [g["id"] for g in data["genres"]]
+
+        movie.title = data.get("title")
+        movie.original_title = data.get("original_title")
+        movie.overview = data.get("overview")
+        movie.poster_path = data.get("poster_path")
+        movie.backdrop_path = data.get("backdrop_path")
+        movie.vote_average = data.get("vote_average") or 0
+        movie.vote_count = data.get("vote_count") or 0
+        movie.release_date = data.get("release_date") or None
+        if genre_ids is not None:
+            movie.genre_ids = genre_ids
+            movie.genre_mask = GenreService.mask_for(genre_ids)
+        if data.get("runtime") is not None:
+            movie.runtime = data.get("runtime")
+        movie.synced_at = datetime.utcnow()
+        MovieSearchService.index_movie(movie)
+
+        return movie
+
+    @staticmethod
+    def upsert_listing(db: Session, results: Iterable[Dict]) -> int:
+        """
+        Guardar las películas de un listado de TMDB (sin commit).
+        Solo toca las que faltan o están vencidas: el listado trae todos los
+        campos de tarjeta menos la duración, que se conserva si ya existía.
+        """
+        results = {data["id"]: data for data in results if data.get("id")}
+        if not results:
+            return 0
+
+        max_age = datetime.utcnow() - timedelta(seconds=settings.MOVIE_CATALOG_MAX_AGE)
+        fresh = {
+            row[0] for row in db.query(Movie.tmdb_id).filter(
+                Movie.tmdb_id.in_(results.keys()),
+                Movie.synced_at >= max_age
+            ).all()
+        }
+
+        stored = 0
+        for movie_id, data in results.items():
+            if movie_id not in fresh:
+                MovieCatalogService.upsert_from_tmdb(db, data)
+                stored += 1
+
+        return stored
+
+    # ==================== LECTURA ====================
+
+    @staticmethod
+    def to_card(movie: Optional[Movie]) -> Optional[Dict]:
+        """Tarjeta con los mismos nombres de campo que usa TMDB (None si no está sincronizada)"""
+        if movie is None or movie.synced_at is None:
+            return None
+
+        return {
+            "id": movie.tmdb_id,
+            "title": movie.title,
+            "original_title": movie.original_title,
+            "overview": movie.overview,
+            "poster_path": movie.poster_path,
+            "backdrop_path": movie.backdrop_path,
+            "vote_average": movie.vote_average or 0,
+            "vote_count": movie.vote_count or 0,
+            "release_date": movie.release_date,
+            "genre_ids": movie.genre_ids or [],
+            "runtime": movie.runtime
+        }
+
+    @staticmethod
+    def degraded_card(movie_tmdb_id: int) -> Dict:
+        """Tarjeta mínima para no perder el item cuando TMDB no responde"""
+        return {
+            "id": movie_tmdb_id,
+            "title": None,
+            "original_title": None,
+            "overview": None,
+            "poster_path": None,
+            "backdrop_path": None,
+            "vote_average": 0,
+            "vote_count": 0,
+            "release_date": None,
+            "genre_ids": [],
+            "runtime": None,
+            "degraded": True
+        }
+
+    @staticmethod
+    async def get_cards(
+            db: Session,
+            movie_ids: Iterable[int],
+            movies: Optional[Iterable[Movie]] = None,
+            concurrency: Optional[int] = None,
+            deadline: Optional[float] = None
+    ) -> Dict[int, Dict]:
+        """
+        Obtener tarjetas {movie_tmdb_id: card} desde el catálogo.
+
+        `movies` permite pasar filas ya cargadas con un JOIN para evitar otra
+        consulta. Las películas que faltan (o aún sin sincronizar) se piden a
+        TMDB en paralelo (ver `get_movies_details_bulk` para `concurrency` y
+        `deadline`) y se guardan; las que fallan se omiten del resultado.
+        """
+        ids = list(dict.fromkeys(movie_ids))
+        cards: Dict[int, Dict] = {}
+
+        if movies is None:
+            movies = db.query(Movie).filter(Movie.tmdb_id.in_(ids)).all() if ids else []
+
+        for movie in movies:
+            card = MovieCatalogService.to_card(movie)
+            if card is not None:
+                cards[movie.tmdb_id] = card
+
+        missing = [movie_id for movie_id in ids if movie_id not in cards]
+        if missing:
+            cards.update(await MovieCatalogService._fetch_and_store(missing, concurrency, deadline))
+
+        return cards
+
+    @staticmethod
+    async def get_card(db: Session, movie_tmdb_id: int) -> Optional[Dict]:
+        """Tarjeta de una sola película"""
+        cards = await MovieCatalogService.get_cards(db, [movie_tmdb_id])
+        return cards.get(movie_tmdb_id)
+
+    @staticmethod
+    def get_title(db: Session, movie_tmdb_id: int) -> Optional[str]:
+        """Título guardado en el catálogo (sin llamar a TMDB)"""
+        movie = db.get(Movie, movie_tmdb_id)
+        return movie.title if movie else None
+
+    @staticmethod
+    async def _fetch_and_store(
+            movie_ids: List[int],
+            concurrency: Optional[int] = None,
+            deadline: Optional[float] = None
+    ) -> Dict[int, Dict]:
+        """
+        Pedir a TMDB las películas indicadas (en paralelo) y guardarlas en el catálogo.
+        Usa su propia sesión: un fallo al guardar no revierte la del que la llama.
+        """
+        cards = {}
+        # El catálogo se guarda siempre en el idioma por defecto
+        with use_language(None):
+            movies_data = await TMDBService.get_movies_details_bulk(
+                movie_ids, concurrency=concurrency, deadline=deadline
+            )
+
+        db = SessionLocal()
+        try:
+            for movie_id, data in movies_data.items():
+                if "error" in data:
+                    print(f"Error fetching movie {movie_id}: {data['error']}")
+                    continue
+
+                movie = MovieCatalogService.upsert_from_tmdb(db, data)
+                cards[movie_id] = MovieCatalogService.to_card(movie)
+
+            if cards:
+                db.commit()
+        except Exception as e:
+            print(f"Error saving movies to catalog: {e}")
+            db.rollback()
+        finally:
+            db.close()
+
+        return cards
+
+    # ==================== SINCRONIZACIÓN ====================
+
+    @staticmethod
+    async def hydrate_movies(movie_ids: List[int]) -> None:
+        """Sincronizar películas con TMDB en segundo plano (BackgroundTasks)"""
+        db = SessionLocal()
+        try:
+            pending = [
+                row[0] for row in db.query(Movie.tmdb_id).filter(
+                    Movie.tmdb_id.in_(movie_ids),
+                    Movie.synced_at.is_(None)
+                ).all()
+            ]
+            if pending:
+                await MovieCatalogService._fetch_and_store(pending)
+        finally:
+            db.close()
+
+    @staticmethod
+    def register_missing(db: Session) -> int:
+        """Registrar películas referenciadas por ratings/reviews/listas que no están en el catálogo"""
+        referenced = union(
+            select(Rating.movie_tmdb_id),
+            select(Review.movie_tmdb_id),
+            select(list_movies.c.movie_tmdb_id)
+        ).subquery()
+
+        missing = [
+            row[0] for row in db.execute(
+                select(referenced.c[0]).where(referenced.c[0].notin_(select(Movie.tmdb_id)))
+            ).all()
+        ]
+
+        if missing:
+            MovieCatalogService.register_movies(db, missing)
+            db.commit()
+
+        return len(missing)
+
+    @staticmethod
+    async def refresh_catalog(batch_size: int = None) -> int:
+        """Sincronizar películas nuevas y refrescar las más antiguas"""
+        batch_size = batch_size or settings.MOVIE_CATALOG_REFRESH_BATCH
+        max_age = datetime.utcnow() - timedelta(seconds=settings.MOVIE_CATALOG_MAX_AGE)
+
+        db = SessionLocal()
+        try:
+            MovieCatalogService.register_missing(db)
+
+            # Primero las no sincronizadas, luego las más viejas
+            movie_ids = [
+                row[0] for row in db.query(Movie.tmdb_id).filter(
+                    or_(Movie.synced_at.is_(None), Movie.synced_at < max_age)
+                ).order_by(
+                    Movie.synced_at.isnot(None),
+                    Movie.synced_at
+                ).limit(batch_size).all()
+            ]
+
+            if movie_ids:
+                await MovieCatalogService._fetch_and_store(movie_ids)
+
+            return len(movie_ids)
+        finally:
+            db.close()
+
+    @staticmethod
+    async def run_refresh_loop() -> None:
+        """Job periódico de sincronización (se inicia con la app)"""
+        while True:
+            try:
+                await GenreService.sync_genres()
+                refreshed = await MovieCatalogService.refresh_catalog()
+                if refreshed:
+                    print(f"🎬 Catálogo: {refreshed} películas sincronizadas con TMDB")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Error refreshing movie catalog: {e}")
+
+            await asyncio.sleep(settings.MOVIE_CATALOG_REFRESH_INTERVAL)
@@ -0,0 +1,140 @@
+import asyncio
+from datetime import datetime
+from typing import Dict, List, Optional
+from app.config import settings
+from app.database import SessionLocal
+from app.models.movie import Movie
+from app.services.tmdb_service import TMDBService
+from app.utils.locale import get_language
+from app.utils.search_index import SearchIndex
+
+
+class MovieSearchService:
+    """
+    Búsqueda y autocompletado sobre el catálogo local de películas.
+
+    Índice en memoria (por worker) de títulos, títulos originales y años.
+    Se carga al iniciar la app, se actualiza cuando una película entra o
+    cambia en el catálogo y se sincroniza periódicamente con la BD para ver
+    lo que guardaron otros workers. El autocompletado solo consulta a TMDB
+    cuando el índice no tiene resultados; la búsqueda completa (/movies/search)
+    sigue yendo a TMDB, porque el catálogo no tiene todas las películas.
+    """
+
+    _index = SearchIndex()
+    _synced_until: Optional[datetime] = None
+    local_hits = 0
+    tmdb_fallbacks = 0
+
+    INDEX_CHUNK = 1000
+
+    # ==================== ÍNDICE ====================
+
+    @staticmethod
+    def index_movie(movie: Movie) -> None:
+        """Agregar o actualizar una película del catálogo en el índice"""
+        from app.services.movie_catalog_service import MovieCatalogService
+
+        card = MovieCatalogService.to_card(movie)
+        if card is None:
+            return
+
+        year = (movie.release_date or "")[:4]
+        MovieSearchService._index.add(
+            movie.tmdb_id,
+            (movie.title, movie.original_title, year),
+            payload=card,
+            boost=movie.vote_count or 0
+        )
+
+    @staticmethod
+    def _load_changed(since: Optional[datetime]) -> List[Movie]:
+        """Películas sincronizadas desde `since` (corre en un hilo aparte)"""
+        db = SessionLocal()
+        try:
+            query = db.query(Movie).filter(Movie.synced_at.isnot(None))
+            if since is not None:
+                query = query.filter(Movie.synced_at >= since)
+            movies = query.all()
+            db.expunge_all()
+            return movies
+        finally:
+            db.close()
+
+    @staticmethod
+    async def sync() -> int:
+        """Indexar lo que cambió en el catálogo desde la última sincronización"""
+        started = datetime.utcnow()
+        movies = await asyncio.to_thread(MovieSearchService._load_changed, MovieSearchService._synced_until)
+
+        # En tandas para no bloquear el event loop con catálogos grandes
+        for start in range(0, len(movies), MovieSearchService.INDEX_CHUNK):
+            for movie in movies[start:start + MovieSearchService.INDEX_CHUNK]:
+                MovieSearchService.index_movie(movie)
+            await asyncio.sleep(0)
+
+        MovieSearchService._synced_until = started
+        return len(movies)
+
+    @staticmethod
+    async def run_sync_loop() -> None:
+        """Job periódico: carga inicial del índice y sincronización incremental"""
+        while True:
+            try:
+                indexed = await MovieSearchService.sync()
+                if indexed:
+                    print(f"🔎 Índice de búsqueda: {indexed} películas indexadas ({len(MovieSearchService._index)} en total)")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Error syncing movie search index: {e}")
+
+            await asyncio.sleep(settings.MOVIE_SEARCH_SYNC_INTERVAL)
+
+    # ==================== BÚSQUEDA ====================
+
+    @staticmethod
+    def search_local(query: str, limit: int = 20) -> List[Dict]:
+        """Tarjetas del catálogo que coinciden con la consulta (el último término como prefijo)"""
+        index = MovieSearchService._index
+        return [index.get(movie_id) for movie_id, _ in index.search(query, limit)]
+
+    @staticmethod
+    def _local_results(query: str, limit: int, min_results: int) -> Optional[List[Dict]]:
+        """Resultados locales si alcanzan para responder, o None para ir a TMDB"""
+        # El catálogo está en el idioma por defecto
+        if get_language() != settings.TMDB_DEFAULT_LANGUAGE:
+            return None
+
+        results = MovieSearchService.search_local(query, limit)
+        if len(results) < min(limit, min_results):
+            return None
+
+        MovieSearchService.local_hits += 1
+        return results
+
+    @staticmethod
+    async def autocomplete(query: str, limit: int = 10) -> Dict:
+        """
+        Sugerencias mientras se escribe. Basta una coincidencia local; TMDB solo
+        se consulta si el catálogo no tiene ninguna y la consulta ya es específica.
+        """
+        results = MovieSearchService._local_results(query, limit, min_results=1)
+        if results is not None:
+            return {"results": results, "source": "local"}
+
+        if len(query.strip()) < 3 and get_language() == settings.TMDB_DEFAULT_LANGUAGE:
+            return {"results": [], "source": "local"}
+
+        MovieSearchService.tmdb_fallbacks += 1
+        tmdb_results = await TMDBService.search_movies(query)
+        return {"results": tmdb_results.get("results", [])[:limit], "source": "tmdb"}
+
+    @staticmethod
+    def stats() -> Dict:
+        return {
+            **MovieSearchService._index.stats(),
+            "synced_until": MovieSearchService._synced_until,
+            "local_hits": MovieSearchService.local_hits,
+            "tmdb_fallbacks": MovieSearchService.tmdb_fallbacks
+        }
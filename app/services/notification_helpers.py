@@ -8,6 +8,7 @@ from app.models.rating import Rating
 from app.models.review import Review
 from app.models.list import List
 from app.models.comment import Comment
+from app.services.movie_catalog_service import MovieCatalogService
 
 
 def notify_on_like(
@@ -48,6 +49,9 @@ def notify_on_like(
             if comment:
                 owner_id = comment.user_id
 
+        if movie_tmdb_id:
+            movie_title = MovieCatalogService.get_title(db, movie_tmdb_id)
+
         if owner_id and owner_id != user_id:
             create_like_notification(
                 db=db,
@@ -110,6 +114,9 @@ def notify_on_comment(
                 if lst:
                     owner_id = lst.user_id
 
+            if movie_tmdb_id:
+                movie_title = MovieCatalogService.get_title(db, movie_tmdb_id)
+
             if owner_id and owner_id != user_id:
                 create_comment_notification(
                     db=db,
@@ -12,6 +12,7 @@ from collections import defaultdict
 class NotificationService:
     # Almacén de clientes SSE conectados
     _connections: dict[int, list] = defaultdict(list)
+    _loop: Optional[asyncio.AbstractEventLoop] = None  # Loop de las colas SSE
 
     @staticmethod
     def create_notification(
@@ -85,17 +86,7 @@ class NotificationService:
         if unread_only:
             query = query.filter(Notification.is_read == False)
 
-        notifications = query.order_by(desc(Notification.created_at)).offset(skip).limit(limit).all()
-
-        # Cargar datos del actor
-        for notification in notifications:
-            notification.actor_data = {
-                "id": notification.actor.id,
-                "username": notification.actor.username,
-                "full_name": notification.actor.full_name
-            }
-
-        return notifications
+        return query.order_by(desc(Notification.created_at)).offset(skip).limit(limit).all()
 
     @staticmethod
     def get_notification_stats(db: Session, user_id: int) -> NotificationStats:
@@ -173,6 +164,7 @@ class NotificationService:
     @staticmethod
     def add_sse_connection(user_id: int, queue: asyncio.Queue):
         """Agregar conexión SSE para un usuario"""
+        NotificationService._loop = asyncio.get_running_loop()
         NotificationService._connections[user_id].append(queue)
 
     @staticmethod
@@ -186,6 +178,38 @@ class NotificationService:
             except ValueError:
                 pass
 
+    @staticmethod
+    def connected_user_ids() -> List[int]:
+        """Usuarios con al menos una conexión SSE en este worker"""
+        return list(NotificationService._connections.keys())
+
+    @staticmethod
+    def publish(user_id: int, data: dict):
+        """
+        Enviar un evento a las conexiones SSE del usuario. Se puede llamar desde
+        otro hilo (tareas en segundo plano): las colas se tocan en su loop.
+        """
+        loop = NotificationService._loop
+        if loop is None or user_id not in NotificationService._connections:
+            return
+
+        def _put():
+            for queue in NotificationService._connections.get(user_id, []):
+                try:
+                    queue.put_nowait(data)
+                except asyncio.QueueFull:
+                    pass
+
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+
+        if running is loop:
+            _put()
+        else:
+            loop.call_soon_threadsafe(_put)
+
     @staticmethod
     def _send_realtime_notification(notification: Notification):
         """Enviar notificación en tiempo real a clientes conectados"""
@@ -3,6 +3,8 @@ from sqlalchemy import func, desc
 from typing import List, Dict, Optional
 from app.models.rating import Rating
 from app.services.tmdb_service import TMDBService
+from app.services.movie_catalog_service import MovieCatalogService
+from app.services.genre_service import GenreService
 
 
 class RankingService:
@@ -107,14 +109,14 @@ class RankingService:
         # Obtener IDs de películas
         movie_ids = [r['movie_tmdb_id'] for r in users_ranking['rankings']]
 
-        # Obtener detalles de TMDB para cada película
+        # Tarjetas desde el catálogo local (una sola consulta)
+        movie_cards = await MovieCatalogService.get_cards(db, movie_ids)
+
         rankings_with_details = []
         for ranking in users_ranking['rankings']:
             try:
-                # Obtener detalles de TMDB
-                movie_details = await TMDBService.get_movie_details(
-                    ranking['movie_tmdb_id']
-                )
+                movie_details = movie_cards.get(ranking['movie_tmdb_id']) \
+                    or MovieCatalogService.degraded_card(ranking['movie_tmdb_id'])
 
                 rankings_with_details.append({
                     'rank': ranking['rank'],
@@ -124,7 +126,7 @@ class RankingService:
                     'backdrop_path': movie_details.get('backdrop_path'),
                     'release_date': movie_details.get('release_date'),
                     'overview': movie_details.get('overview'),
-                    'genres': movie_details.get('genres', []),
+                    'genres': GenreService.describe(movie_details.get('genre_ids', [])),
                     'tmdb_rating': round(movie_details.get('vote_average', 0) / 2, 1),
                     'tmdb_votes': movie_details.get('vote_count', 0),
                     'users_average': ranking['users_average'],
@@ -3,6 +3,8 @@ from sqlalchemy import func
 from fastapi import HTTPException, status
 from app.models.rating import Rating
 from app.schemas.rating import RatingCreate, RatingUpdate, MovieRatingStats
+from app.services.movie_catalog_service import MovieCatalogService
+from app.services.activity_service import ActivityService
 
 
 class RatingService:
@@ -28,6 +30,7 @@ class RatingService:
             # Actualizar rating existente
             existing_rating.rating = rating_data.rating
             db.commit()
+            ActivityService.touch()
             db.refresh(existing_rating)
             return existing_rating
         else:
@@ -38,7 +41,14 @@ class RatingService:
                 rating=rating_data.rating
             )
             db.add(new_rating)
+            db.flush()
+            db.refresh(new_rating, ["created_at"])
+            ActivityService.record(
+                db, user_id, "rating", new_rating.id, new_rating.created_at, rating_data.movie_tmdb_id
+            )
+            MovieCatalogService.register_movie(db, rating_data.movie_tmdb_id)
             db.commit()
+            ActivityService.touch()
             db.refresh(new_rating)
             return new_rating
 
@@ -64,8 +74,10 @@ class RatingService:
                 detail="Calificación no encontrada"
             )
 
+        ActivityService.remove(db, "rating", rating.id)
         db.delete(rating)
         db.commit()
+        ActivityService.touch()
         return True
 
     @staticmethod
@@ -4,6 +4,8 @@ from fastapi import HTTPException, status
 from typing import List, Optional
 from app.models.review import Review
 from app.schemas.review import ReviewCreate, ReviewUpdate, MovieReviewsStats
+from app.services.movie_catalog_service import MovieCatalogService
+from app.services.activity_service import ActivityService
 
 
 class ReviewService:
@@ -34,7 +36,14 @@ class ReviewService:
         )
 
         db.add(new_review)
+        db.flush()
+        db.refresh(new_review, ["created_at"])
+        ActivityService.record(
+            db, user_id, "review", new_review.id, new_review.created_at, review_data.movie_tmdb_id
+        )
+        MovieCatalogService.register_movie(db, review_data.movie_tmdb_id)
         db.commit()
+        ActivityService.touch()
         db.refresh(new_review)
         return new_review
 
@@ -114,6 +123,7 @@ class ReviewService:
             review.contains_spoilers = review_data.contains_spoilers
 
         db.commit()
+        ActivityService.touch()
         db.refresh(review)
         return review
 
@@ -132,8 +142,10 @@ class ReviewService:
                 detail="Reseña no encontrada o no tienes permiso para eliminarla"
             )
 
+        ActivityService.remove(db, "review", review.id)
         db.delete(review)
         db.commit()
+        ActivityService.touch()
         return True
 
     @staticmethod
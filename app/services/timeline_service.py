@@ -0,0 +1,274 @@
+import struct
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy import desc, func, or_
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.database import SessionLocal
+from app.models.activity import Activity
+from app.models.follow import Follow, HomeTimeline
+from app.services.data_loader import DataLoader
+from app.services.notification_service import NotificationService
+from app.utils.pagination import encode_id_cursor, decode_id_cursor
+
+
+class TimelineService:
+    """
+    Timeline "home" (actividad de los usuarios seguidos) con fan-out híbrido.
+
+    - Push: al escribir, el id de la actividad se agrega al timeline guardado de
+      cada seguidor (lista acotada de ids, las más nuevas primero).
+    - Pull: las cuentas con más de FEED_FANOUT_MAX_FOLLOWERS seguidores no se
+      reparten (serían miles de escrituras por actividad); sus actividades se
+      leen por índice al pedir el timeline y se mezclan con las guardadas.
+    """
+
+    FANOUT_BATCH = 500  # Timelines actualizados por transacción
+    FANOUT_RETRIES = 3  # Intentos por lote ante deadlocks o conflictos
+
+    # ==================== FORMATO ====================
+
+    @staticmethod
+    def _unpack(data: Optional[bytes]) -> List[int]:
+        if not data:
+            return []
+        return list(struct.unpack(f">{len(data) // 4}I", data))
+
+    @staticmethod
+    def _pack(ids: List[int]) -> bytes:
+        return struct.pack(f">{len(ids)}I", *ids)
+
+    @staticmethod
+    def _merge(current: List[int], new_ids: Iterable[int]) -> List[int]:
+        """Unir ids sin repetir, de mayor a menor, cortando en el largo máximo"""
+        merged = sorted(set(current).union(new_ids), reverse=True)
+        return merged[:settings.FEED_TIMELINE_MAX_LENGTH]
+
+    # ==================== ESCRITURA ====================
+
+    @staticmethod
+    def _ensure_rows(db: Session, user_ids: List[int]) -> None:
+        """
+        Crear vacíos los timelines que no existen (sin leer antes). Con un
+        INSERT que ignora los existentes, dos fan-outs a la vez no chocan al
+        crear la misma fila, y después SELECT ... FOR UPDATE sí la bloquea.
+        """
+        rows = [{"user_id": user_id, "activity_ids": b""} for user_id in user_ids]
+
+        dialect = db.get_bind().dialect.name
+        if dialect == "mysql":
+            db.execute(mysql_insert(HomeTimeline).values(rows).prefix_with("IGNORE"))
+        elif dialect == "sqlite":
+            db.execute(sqlite_insert(HomeTimeline).values(rows).on_conflict_do_nothing())
+        else:
+            existing = {
+                row[0] for row in db.query(HomeTimeline.user_id).filter(HomeTimeline.user_id.in_(user_ids)).all()
+            }
+            db.add_all(HomeTimeline(**row) for row in rows if row["user_id"] not in existing)
+            db.flush()
+
+    @staticmethod
+    def push(db: Session, user_ids: List[int], activity_ids: List[int]) -> None:
+        """Agregar actividades al timeline de varios usuarios (sin commit)"""
+        if not user_ids or not activity_ids:
+            return
+
+        TimelineService._ensure_rows(db, user_ids)
+
+        timelines = db.query(HomeTimeline) \
+            .filter(HomeTimeline.user_id.in_(user_ids)) \
+            .with_for_update() \
+            .populate_existing() \
+            .all()
+
+        for timeline in timelines:
+            merged = TimelineService._merge(TimelineService._unpack(timeline.activity_ids), activity_ids)
+            timeline.activity_ids = TimelineService._pack(merged)
+
+    @staticmethod
+    def _push_batch(db: Session, user_ids: List[int], activity_ids: List[int]) -> bool:
+        """push + commit de un lote, reintentando ante deadlocks o conflictos"""
+        for attempt in range(1, TimelineService.FANOUT_RETRIES + 1):
+            try:
+                TimelineService.push(db, user_ids, activity_ids)
+                db.commit()
+                return True
+            except (IntegrityError, OperationalError) as e:
+                db.rollback()
+                if attempt == TimelineService.FANOUT_RETRIES:
+                    print(f"Error pushing activities {activity_ids} to {len(user_ids)} timelines: {e}")
+        return False
+
+    @staticmethod
+    def drop_author(db: Session, user_id: int, author_id: int) -> None:
+        """Quitar del timeline de un usuario las actividades de un autor (sin commit)"""
+        timeline = db.query(HomeTimeline).filter(HomeTimeline.user_id == user_id).with_for_update().first()
+        if timeline is None:
+            return
+
+        ids = TimelineService._unpack(timeline.activity_ids)
+        authored = {
+            row[0] for row in db.query(Activity.id).filter(
+                Activity.id.in_(ids),
+                Activity.user_id == author_id
+            ).all()
+        } if ids else set()
+        timeline.activity_ids = TimelineService._pack([i for i in ids if i not in authored])
+
+    @staticmethod
+    def fan_out(activity_type: str, target_id: int) -> int:
+        """
+        Repartir una actividad recién creada a los timelines de los seguidores
+        del autor (se ejecuta como tarea en segundo plano). Retorna a cuántos.
+        """
+        db = SessionLocal()
+        try:
+            activity = db.query(Activity).filter(
+                Activity.activity_type == activity_type,
+                Activity.target_id == target_id
+            ).first()
+            if activity is None:
+                return 0
+
+            # Ya repartida (p. ej. al editar un rating)
+            own = db.query(HomeTimeline).filter(HomeTimeline.user_id == activity.user_id).first()
+            own_ids = TimelineService._unpack(own.activity_ids if own else None)
+            if activity.id in own_ids or (
+                    len(own_ids) >= settings.FEED_TIMELINE_MAX_LENGTH and activity.id < own_ids[-1]):
+                return 0
+
+            # El autor ve su propia actividad siempre
+            if not TimelineService._push_batch(db, [activity.user_id], [activity.id]):
+                return 0
+
+            TimelineService.publish_update(db, activity)
+
+            if TimelineService.is_pulled(db, activity.user_id):
+                return 0
+
+            follower_ids = [
+                row[0] for row in db.query(Follow.follower_id).filter(Follow.followed_id == activity.user_id).all()
+            ]
+            # Un lote que falla no impide repartir los demás
+            pushed = 0
+            for i in range(0, len(follower_ids), TimelineService.FANOUT_BATCH):
+                batch = follower_ids[i:i + TimelineService.FANOUT_BATCH]
+                if TimelineService._push_batch(db, batch, [activity.id]):
+                    pushed += len(batch)
+
+            return pushed
+        except Exception as e:
+            print(f"Error fanning out activity {activity_type} {target_id}: {e}")
+            db.rollback()
+            return 0
+        finally:
+            db.close()
+
+    @staticmethod
+    def publish_update(db: Session, activity: Activity) -> None:
+        """
+        Avisar por SSE a los clientes conectados que hay actividad nueva, así
+        piden solo lo nuevo en vez de recargar el feed. `home` indica si entra
+        en su timeline (autor o seguidor).
+        """
+        connected = NotificationService.connected_user_ids()
+        if not connected:
+            return
+
+        home = {activity.user_id} | {
+            row[0] for row in db.query(Follow.follower_id).filter(
+                Follow.followed_id == activity.user_id,
+                Follow.follower_id.in_(connected)
+            ).all()
+        }
+
+        event = {
+            "event": "feed_update",
+            "activity_id": activity.id,
+            "activity_type": activity.activity_type,
+            "user_id": activity.user_id,
+            "latest_cursor": encode_id_cursor(activity.id)
+        }
+        for user_id in connected:
+            NotificationService.publish(user_id, {**event, "home": user_id in home})
+
+    @staticmethod
+    def is_pulled(db: Session, user_id: int) -> bool:
+        """Si las actividades del usuario se leen al pedir el timeline en vez de repartirse"""
+        followers = db.query(func.count(Follow.id)).filter(Follow.followed_id == user_id).scalar()
+        return followers > settings.FEED_FANOUT_MAX_FOLLOWERS
+
+    # ==================== LECTURA ====================
+
+    @staticmethod
+    def _pulled_authors(db: Session, user_id: int) -> List[int]:
+        """Cuentas seguidas por el usuario que no se reparten"""
+        following = db.query(Follow.followed_id).filter(Follow.follower_id == user_id)
+        return [
+            row[0] for row in db.query(Follow.followed_id)
+            .filter(Follow.followed_id.in_(following))
+            .group_by(Follow.followed_id)
+            .having(func.count(Follow.id) > settings.FEED_FANOUT_MAX_FOLLOWERS)
+            .all()
+        ]
+
+    @staticmethod
+    async def get_home_feed(
+            db: Session,
+            user_id: int,
+            limit: int = 20,
+            cursor: Optional[str] = None,
+            loader: Optional[DataLoader] = None
+    ) -> Dict:
+        """
+        Página del timeline home en orden de id descendente: ids guardados
+        (push) mezclados con los de las cuentas grandes seguidas (pull).
+        """
+        # Import diferido: FeedService arma los items
+        from app.services.feed_service import FeedService
+
+        loader = loader or DataLoader(db, user_id)
+        before = decode_id_cursor(cursor)
+
+        timeline = db.query(HomeTimeline).filter(HomeTimeline.user_id == user_id).first()
+        pushed = TimelineService._unpack(timeline.activity_ids if timeline else None)
+        if before is not None:
+            pushed = [i for i in pushed if i < before]
+
+        pulled = []
+        authors = TimelineService._pulled_authors(db, user_id)
+        if authors:
+            query = db.query(Activity.id).filter(Activity.user_id.in_(authors))
+            if before is not None:
+                query = query.filter(Activity.id < before)
+            pulled = [row[0] for row in query.order_by(desc(Activity.id)).limit(limit + 1).all()]
+
+        candidates = sorted(set(pushed[:limit + 1]).union(pulled), reverse=True)
+        window = candidates[:limit]
+
+        # Descarta actividades borradas y de cuentas que ya no se siguen
+        following = db.query(Follow.followed_id).filter(Follow.follower_id == user_id)
+        activities = db.query(Activity).filter(
+            Activity.id.in_(window),
+            or_(Activity.user_id == user_id, Activity.user_id.in_(following))
+        ).order_by(desc(Activity.id)).all() if window else []
+
+        return {
+            "items": await FeedService._build_items(db, activities, loader),
+            "page": 1,
+            "total_pages": None,
+            "total_items": None,
+            "next_cursor": encode_id_cursor(window[-1]) if len(candidates) > limit else None,
+            "latest_cursor": encode_id_cursor(window[0]) if window and before is None else None
+        }
+
+    @staticmethod
+    def count_new(db: Session, user_id: int, since: Optional[str]) -> Dict:
+        """Actividades nuevas del timeline home después de `since`"""
+        from app.services.feed_service import FeedService
+
+        following = db.query(Follow.followed_id).filter(Follow.follower_id == user_id)
+        query = db.query(Activity).filter(or_(Activity.user_id == user_id, Activity.user_id.in_(following)))
+        return FeedService.count_new(db, since, query)
@@ -1,113 +1,717 @@
 import httpx
-from typing import Optional, List, Dict
+import asyncio
+import hashlib
+import importlib.util
+import json
+import time
+from typing import Optional, List, Dict, Callable, Tuple
 from app.config import settings
+from app.utils.cache import TTLCache, FRESH, STALE
+from app.utils.singleflight import SingleFlight
+from app.utils.resilience import TokenBucket, CircuitBreaker, backoff_delay, parse_retry_after
+from app.utils.disk_cache import DiskCache
+from app.utils.locale import get_language, get_region
+
+
+class TMDBUnavailableError(Exception):
+    """TMDB no responde (circuito abierto o reintentos agotados)"""
+    pass
+
+
+class CachedResponse:
+    """
+    Respuesta de TMDB tal como se guarda en caché: el cuerpo JSON crudo y su
+    versión parseada. Cada forma se materializa solo cuando se pide, así los
+    endpoints que reenvían los bytes tal cual nunca parsean ni re-serializan.
+    """
+    __slots__ = ("_body", "_data", "_etag", "status_code", "stored_at")
+
+    def __init__(self, body: Optional[bytes] = None, data: Optional[Dict] = None,
+                 status_code: int = 200, stored_at: Optional[float] = None):
+        self._body = body
+        self._data = data
+        self._etag = None
+        self.status_code = status_code
+        self.stored_at = stored_at or time.time()
+
+    @classmethod
+    def from_data(cls, data: Dict) -> "CachedResponse":
+        return cls(data=data)
+
+    @property
+    def body(self) -> bytes:
+        if self._body is None:
+            self._body = json.dumps(self._data, ensure_ascii=False, separators=(",", ":")).encode()
+        return self._body
+
+    @property
+    def data(self) -> Dict:
+        """JSON parseado (compartido: no modificar)"""
+        if self._data is None:
+            self._data = json.loads(self._body)
+        return self._data
+
+    @property
+    def etag(self) -> str:
+        if self._etag is None:
+            self._etag = f'"{hashlib.blake2b(self.body, digest_size=16).hexdigest()}"'
+        return self._etag
+
+    @property
+    def is_success(self) -> bool:
+        return 200 <= self.status_code < 300
 
 
 class TMDBService:
-    BASE_URL = "https://api.themoviedb.org/3"
+    BASE_URL = settings.TMDB_BASE_URL.rstrip("/")
     IMAGE_BASE_URL = "https://image.tmdb.org/t/p"
 
+    # Cliente HTTP compartido por worker (se crea en el startup de la app)
+    _client: Optional[httpx.AsyncClient] = None
+
+    # Caché en memoria de respuestas (por worker)
+    _cache = TTLCache(max_bytes=settings.TMDB_CACHE_MAX_BYTES)
+    _refresh_tasks: Dict[str, asyncio.Task] = {}
+
+    # Segundo nivel de caché en disco, compartido por los workers del host
+    _disk_cache: Optional[DiskCache] = None
+    _disk_writes: set = set()
+
+    # Peticiones en vuelo: llamadas concurrentes idénticas comparten una sola
+    _inflight = SingleFlight()
+
+    # Protección del cupo de TMDB
+    _rate_limiter = TokenBucket(
+        rate=settings.TMDB_RATE_LIMIT_PER_SECOND,
+        capacity=settings.TMDB_RATE_LIMIT_BURST
+    )
+    _circuit = CircuitBreaker(
+        failure_threshold=settings.TMDB_CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout=settings.TMDB_CIRCUIT_RESET_TIMEOUT
+    )
+
+    # TTL (segundos) por tipo de endpoint
+    CACHE_TTLS = {
+        "details": settings.TMDB_CACHE_TTL_DETAILS,
+        "similar": settings.TMDB_CACHE_TTL_DETAILS,
+        "search": settings.TMDB_CACHE_TTL_SEARCH,
+        "trending": settings.TMDB_CACHE_TTL_LISTS,
+        "lists": settings.TMDB_CACHE_TTL_LISTS,
+    }
+
+    # Perfiles de detalle de película: cada uno pide solo lo que necesita
+    #   card    -> campos de tarjeta (feed, rankings, catálogo)
+    #   detail  -> ficha completa con créditos, videos y similares
+    #   similar -> solo películas similares
+    MOVIE_PROFILES = ("card", "detail", "similar")
+    CARD_FIELDS = (
+        "id", "title", "original_title", "overview", "poster_path", "backdrop_path",
+        "vote_average", "vote_count", "release_date", "genres", "genre_ids",
+        "runtime", "popularity"
+    )
+
+    # ==================== CLIENTE HTTP ====================
+
     @staticmethod
-    async def search_movies(query: str, page: int = 1) -> Dict:
-        """Buscar películas por nombre"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{TMDBService.BASE_URL}/search/movie",
-                params={
-                    "api_key": settings.TMDB_API_KEY,
-                    "query": query,
-                    "page": page,
-                    "language": "es-MX"
-                }
-            )
-            return response.json()
-
-    @staticmethod
-    async def get_movie_details(movie_id: int) -> Dict:
-        """Obtener detalles de una película"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{TMDBService.BASE_URL}/movie/{movie_id}",
-                params={
-                    "api_key": settings.TMDB_API_KEY,
-                    "language": "es-MX",
-                    "append_to_response": "credits,videos,similar"
-                }
+    def _build_client() -> httpx.AsyncClient:
+        """Crear cliente con pool de conexiones keep-alive"""
+        # HTTP/2 requiere el paquete 'h2'; si no está instalado usamos HTTP/1.1
+        http2 = settings.TMDB_HTTP2 and importlib.util.find_spec("h2") is not None
+
+        return httpx.AsyncClient(
+            http2=http2,
+            timeout=httpx.Timeout(
+                settings.TMDB_TIMEOUT,
+                connect=settings.TMDB_CONNECT_TIMEOUT
+            ),
+            limits=httpx.Limits(
+                max_connections=settings.TMDB_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.TMDB_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.TMDB_KEEPALIVE_EXPIRY
             )
-            return response.json()
+        )
+
+    @staticmethod
+    async def startup() -> None:
+        """Abrir el cliente compartido (llamar al iniciar la app)"""
+        if TMDBService._client is None or TMDBService._client.is_closed:
+            TMDBService._client = TMDBService._build_client()
+
+        if settings.TMDB_DISK_CACHE_PATH and TMDBService._disk_cache is None:
+            try:
+                TMDBService._disk_cache = DiskCache(
+                    settings.TMDB_DISK_CACHE_PATH,
+                    settings.TMDB_DISK_CACHE_MAX_BYTES
+                )
+            except Exception as e:
+                print(f"⚠️ Caché en disco de TMDB deshabilitada: {e}")
+
+    @staticmethod
+    async def shutdown() -> None:
+        """Cerrar el cliente compartido y sus conexiones"""
+        if TMDBService._client is not None:
+            await TMDBService._client.aclose()
+            TMDBService._client = None
+
+        if TMDBService._disk_writes:
+            await asyncio.gather(*TMDBService._disk_writes, return_exceptions=True)
+        if TMDBService._disk_cache is not None:
+            TMDBService._disk_cache.close()
+            TMDBService._disk_cache = None
+
+    @staticmethod
+    def get_client() -> httpx.AsyncClient:
+        """Cliente compartido; se crea bajo demanda si la app no lo inició (scripts)"""
+        if TMDBService._client is None or TMDBService._client.is_closed:
+            TMDBService._client = TMDBService._build_client()
+        return TMDBService._client
+
+    @staticmethod
+    async def _request(path: str, params: Dict, timeout: Optional[float] = None) -> httpx.Response:
+        """
+        GET a TMDB reutilizando las conexiones del pool.
+
+        Respeta el token bucket, reintenta errores de red, 429 y 5xx con backoff
+        exponencial + jitter (honrando Retry-After) y corta de inmediato con
+        TMDBUnavailableError mientras el circuito está abierto.
+        """
+        request_params = {"api_key": settings.TMDB_API_KEY, **params}
+        kwargs = {}
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+
+        last_error = "sin respuesta"
+        for attempt in range(settings.TMDB_MAX_RETRIES + 1):
+            if not TMDBService._circuit.allow():
+                raise TMDBUnavailableError(f"TMDB no disponible (circuito abierto): {path}")
+
+            await TMDBService._rate_limiter.acquire()
+
+            retry_after = None
+            try:
+                response = await TMDBService.get_client().get(
+                    f"{TMDBService.BASE_URL}{path}",
+                    params=request_params,
+                    **kwargs
+                )
+            except httpx.TransportError as e:
+                last_error = f"{type(e).__name__}: {e}"
+            else:
+                if response.status_code != 429 and response.status_code < 500:
+                    TMDBService._circuit.record_success()
+                    return response
+
+                last_error = f"HTTP {response.status_code}"
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+            TMDBService._circuit.record_failure()
+
+            # Sin más intentos, o TMDB pide esperar más de lo que toleramos
+            if attempt == settings.TMDB_MAX_RETRIES or (
+                    retry_after is not None and retry_after > settings.TMDB_RETRY_MAX_DELAY
+            ):
+                break
+
+            await asyncio.sleep(backoff_delay(
+                attempt,
+                settings.TMDB_RETRY_BASE_DELAY,
+                settings.TMDB_RETRY_MAX_DELAY,
+                retry_after
+            ))
+
+        raise TMDBUnavailableError(f"TMDB no disponible ({last_error}): {path}")
+
+    # ==================== CACHÉ ====================
+
+    @staticmethod
+    def _cache_key(path: str, params: Dict) -> str:
+        """Firma de la petición (sin api_key)"""
+        query = "&".join(f"{k}={params[k]}" for k in sorted(params))
+        return f"{path}?{query}"
+
+    @staticmethod
+    async def _fetch_and_store(endpoint: str, key: str, path: str, params: Dict,
+                               timeout: Optional[float] = None,
+                               project: Optional[Callable[[Dict], Dict]] = None,
+                               use_disk: bool = True) -> CachedResponse:
+        """
+        Resolver un fallo de la caché en memoria: primero la caché en disco,
+        luego TMDB. Solo se guardan las respuestas exitosas.
+        `project` reduce la respuesta antes de guardarla (p. ej. a campos de tarjeta).
+        """
+        disk = TMDBService._disk_cache
+        disk_entry = None
+
+        if use_disk and disk is not None:
+            try:
+                disk_entry = await disk.aget(key)
+            except Exception as e:
+                print(f"Error reading TMDB disk cache {key}: {e}")
+
+            if disk_entry is not None and disk_entry.is_usable:
+                cached = CachedResponse(disk_entry.body, stored_at=disk_entry.stored_at)
+                now = time.time()
+                TMDBService._cache.set(
+                    key,
+                    cached,
+                    ttl=disk_entry.expires_at - now,
+                    stale_ttl=disk_entry.stale_until - disk_entry.expires_at,
+                    size=len(disk_entry.body)
+                )
+                if not disk_entry.is_fresh:
+                    TMDBService._schedule_refresh(endpoint, key, path, params, project)
+                return cached
+
+        try:
+            response = await TMDBService._request(path, params, timeout)
+        except TMDBUnavailableError:
+            # Una copia vencida en disco es mejor que nada
+            if disk_entry is not None:
+                return CachedResponse(disk_entry.body, stored_at=disk_entry.stored_at)
+            raise
+
+        if not response.is_success:
+            return CachedResponse(response.content, status_code=response.status_code)
+
+        # Sin proyección ni traducciones el cuerpo se guarda tal cual, sin parsearlo
+        with_translations = "translations" in params.get("append_to_response", "")
+        if project is not None or with_translations:
+            data = response.json()
+            if with_translations:
+                TMDBService._split_translations(path, data)
+            cached = CachedResponse.from_data(project(data) if project else data)
+        else:
+            cached = CachedResponse(response.content)
+
+        TMDBService._store(key, cached, TMDBService.CACHE_TTLS[endpoint])
+
+        return cached
+
+    @staticmethod
+    def _store(key: str, cached: CachedResponse, ttl: float) -> None:
+        """Guardar una respuesta en memoria y (en segundo plano) en disco"""
+        TMDBService._cache.set(
+            key,
+            cached,
+            ttl=ttl,
+            stale_ttl=settings.TMDB_CACHE_STALE_TTL,
+            size=len(cached.body)
+        )
+        TMDBService._store_on_disk(key, cached.body, ttl)
+
+    @staticmethod
+    def _store_on_disk(key: str, body: bytes, ttl: float) -> None:
+        """Escribir en la caché en disco sin bloquear la respuesta"""
+        disk = TMDBService._disk_cache
+        if disk is None:
+            return
+
+        async def write():
+            try:
+                await disk.aset(key, body, ttl, settings.TMDB_CACHE_STALE_TTL)
+            except Exception as e:
+                print(f"Error writing TMDB disk cache {key}: {e}")
+
+        task = asyncio.create_task(write())
+        TMDBService._disk_writes.add(task)
+        task.add_done_callback(TMDBService._disk_writes.discard)
+
+    @staticmethod
+    async def _fetch_shared(endpoint: str, key: str, path: str, params: Dict,
+                            timeout: Optional[float] = None,
+                            project: Optional[Callable[[Dict], Dict]] = None,
+                            use_disk: bool = True) -> CachedResponse:
+        """Pedir a TMDB coalesciendo llamadas concurrentes con la misma firma"""
+        # Los refrescos van aparte: no deben unirse a una lectura que devuelva datos vencidos
+        flight_key = key if use_disk else f"{key}#refresh"
+        return await TMDBService._inflight.do(
+            flight_key,
+            lambda: TMDBService._fetch_and_store(endpoint, key, path, params, timeout, project, use_disk)
+        )
+
+    @staticmethod
+    def _schedule_refresh(endpoint: str, key: str, path: str, params: Dict,
+                          project: Optional[Callable[[Dict], Dict]] = None) -> None:
+        """Refrescar una entrada vencida en segundo plano (una sola vez por clave)"""
+        if key in TMDBService._refresh_tasks:
+            return
+
+        async def refresh():
+            try:
+                await TMDBService._fetch_shared(endpoint, key, path, params, project=project, use_disk=False)
+            except Exception as e:
+                print(f"Error refreshing TMDB cache {key}: {e}")
+            finally:
+                TMDBService._refresh_tasks.pop(key, None)
+
+        TMDBService._refresh_tasks[key] = asyncio.create_task(refresh())
+
+    @staticmethod
+    def _get_cached(endpoint: str, path: str, params: Dict,
+                    project: Optional[Callable[[Dict], Dict]] = None) -> Optional[CachedResponse]:
+        """Respuesta en caché o None (si está vencida se programa su refresco)"""
+        key = TMDBService._cache_key(path, params)
+        cached, state = TMDBService._cache.get(key)
+
+        if state == STALE:
+            TMDBService._schedule_refresh(endpoint, key, path, params, project)
+
+        return cached
+
+    @staticmethod
+    def _get_expired(path: str, params: Dict) -> Optional[CachedResponse]:
+        """Última respuesta conocida aunque haya vencido (modo degradado)"""
+        entry = TMDBService._cache.peek(TMDBService._cache_key(path, params))
+        return entry.value if entry is not None else None
 
     @staticmethod
-    async def get_popular_movies(page: int = 1) -> Dict:
+    async def _get_response(endpoint: str, path: str, params: Dict,
+                            timeout: Optional[float] = None,
+                            project: Optional[Callable[[Dict], Dict]] = None) -> CachedResponse:
+        """
+        GET con caché stale-while-revalidate.
+        Si TMDB no responde se usa la última respuesta conocida, aunque esté vencida.
+        """
+        cached = TMDBService._get_cached(endpoint, path, params, project)
+        if cached is not None:
+            return cached
+
+        key = TMDBService._cache_key(path, params)
+        try:
+            return await TMDBService._fetch_shared(endpoint, key, path, params, timeout, project)
+        except TMDBUnavailableError:
+            cached = TMDBService._get_expired(path, params)
+            if cached is None:
+                raise
+            return cached
+
+    @staticmethod
+    def cache_stats() -> Dict:
+        """Contadores de la caché (hits, misses, evictions, memoria)"""
+        return {
+            **TMDBService._cache.stats(),
+            "refreshing": len(TMDBService._refresh_tasks),
+            "single_flight": TMDBService._inflight.stats(),
+            "circuit": TMDBService._circuit.stats(),
+            "rate_limited": TMDBService._rate_limiter.throttled,
+            "disk": TMDBService._disk_cache.stats() if TMDBService._disk_cache else None
+        }
+
+    # ==================== LISTADOS Y BÚSQUEDA ====================
+
+    @staticmethod
+    def _endpoint_request(name: str, page: int = 1, query: str = None,
+                          time_window: str = "week") -> Tuple[str, str, Dict]:
+        """(endpoint, path, params) de cada listado de TMDB en el idioma de la petición"""
+        language = get_language()
+        if name == "search":
+            return "search", "/search/movie", {"query": query, "page": page, "language": language}
+        if name == "popular":
+            return "lists", "/movie/popular", {"page": page, "language": language}
+        if name == "trending":
+            return "trending", f"/trending/movie/{time_window}", {"language": language}
+        if name == "top_rated":
+            return "lists", "/movie/top_rated", {"page": page, "language": language}
+        if name == "now_playing":
+            return "lists", "/movie/now_playing", {"page": page, "language": language, "region": get_region()}
+        if name == "genres":
+            return "details", "/genre/movie/list", {"language": language}
+
+        raise ValueError(f"Endpoint de TMDB desconocido: {name}")
+
+    @staticmethod
+    async def get_response(name: str, timeout: Optional[float] = None, **kwargs) -> CachedResponse:
+        """
+        Respuesta cruda (bytes + ETag) de un listado o búsqueda:
+        'search', 'popular', 'trending', 'top_rated', 'now_playing' o 'genres'
+        """
+        endpoint, path, params = TMDBService._endpoint_request(name, **kwargs)
+        return await TMDBService._get_response(endpoint, path, params, timeout)
+
+    @staticmethod
+    async def refresh_response(name: str, timeout: Optional[float] = None, **kwargs) -> CachedResponse:
+        """
+        Volver a pedir un listado a TMDB aunque esté en caché y reemplazar la
+        copia en memoria y en disco (lo usa el precalentador de caché)
+        """
+        endpoint, path, params = TMDBService._endpoint_request(name, **kwargs)
+        key = TMDBService._cache_key(path, params)
+        return await TMDBService._fetch_shared(endpoint, key, path, params, timeout, use_disk=False)
+
+    @staticmethod
+    async def search_movies(query: str, page: int = 1, timeout: Optional[float] = None) -> Dict:
+        """Buscar películas por nombre"""
+        return (await TMDBService.get_response("search", timeout, query=query, page=page)).data
+
+    @staticmethod
+    async def get_popular_movies(page: int = 1, timeout: Optional[float] = None) -> Dict:
         """Obtener películas populares"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{TMDBService.BASE_URL}/movie/popular",
-                params={
-                    "api_key": settings.TMDB_API_KEY,
-                    "page": page,
-                    "language": "es-MX"
-                }
-            )
-            return response.json()
+        return (await TMDBService.get_response("popular", timeout, page=page)).data
 
     @staticmethod
-    async def get_trending_movies(time_window: str = "week") -> Dict:
+    async def get_trending_movies(time_window: str = "week", timeout: Optional[float] = None) -> Dict:
         """Obtener películas en tendencia"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{TMDBService.BASE_URL}/trending/movie/{time_window}",
-                params={
-                    "api_key": settings.TMDB_API_KEY,
-                    "language": "es-MX"
-                }
-            )
-            return response.json()
+        return (await TMDBService.get_response("trending", timeout, time_window=time_window)).data
 
     @staticmethod
-    async def get_top_rated_movies(page: int = 1) -> Dict:
+    async def get_top_rated_movies(page: int = 1, timeout: Optional[float] = None) -> Dict:
         """Obtener películas mejor calificadas"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{TMDBService.BASE_URL}/movie/top_rated",
-                params={
-                    "api_key": settings.TMDB_API_KEY,
-                    "page": page,
-                    "language": "es-MX"
-                }
-            )
-            return response.json()
+        return (await TMDBService.get_response("top_rated", timeout, page=page)).data
 
     @staticmethod
-    async def get_now_playing(page: int = 1) -> Dict:
+    async def get_now_playing(page: int = 1, timeout: Optional[float] = None) -> Dict:
         """Obtener películas en cartelera"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{TMDBService.BASE_URL}/movie/now_playing",
-                params={
-                    "api_key": settings.TMDB_API_KEY,
-                    "page": page,
-                    "language": "es-MX",
-                    "region": "MX"
-                }
+        return (await TMDBService.get_response("now_playing", timeout, page=page)).data
+
+    # ==================== PERFILES DE PELÍCULA ====================
+
+    @staticmethod
+    def _profile_request(movie_id: int, profile: str) -> Tuple[str, str, Dict]:
+        """
+        (endpoint, path, params) que necesita cada perfil.
+        Ficha y tarjeta se piden una sola vez en el idioma por defecto; el idioma
+        de la petición se aplica al leerlas. La ficha trae sus traducciones; la
+        tarjeta no (serían todos los idiomas de TMDB en cada tarjeta): se piden
+        aparte solo si hace falta otro idioma.
+        """
+        if profile == "detail":
+            return "details", f"/movie/{movie_id}", {
+                "language": settings.TMDB_DEFAULT_LANGUAGE,
+                "append_to_response": "credits,videos,similar,translations"
+            }
+        if profile == "card":
+            return "details", f"/movie/{movie_id}", {"language": settings.TMDB_DEFAULT_LANGUAGE}
+        if profile == "similar":
+            return "similar", f"/movie/{movie_id}/similar", {"language": get_language()}
+
+        raise ValueError(f"Perfil de película desconocido: {profile}")
+
+    @staticmethod
+    def _project(data: Dict, profile: str) -> Dict:
+        """Derivar un perfil más barato a partir de la ficha completa"""
+        if profile == "card":
+            return {field: data[field] for field in TMDBService.CARD_FIELDS if field in data}
+        if profile == "similar":
+            return data.get("similar") or {"page": 1, "results": [], "total_pages": 0, "total_results": 0}
+        return data
+
+    @staticmethod
+    def _projection(profile: str) -> Optional[Callable[[Dict], Dict]]:
+        if profile == "card":
+            return lambda data: TMDBService._project(data, "card")
+        return None
+
+    @staticmethod
+    def _derive(detail: Optional[CachedResponse], profile: str) -> Optional[CachedResponse]:
+        if detail is None or not detail.is_success or "id" not in detail.data:
+            return None
+        return CachedResponse(data=TMDBService._project(detail.data, profile), stored_at=detail.stored_at)
+
+    # ==================== TRADUCCIONES ====================
+
+    # Campos que cambian con el idioma; el resto (ids, votos, imágenes, duración) es común
+    TRANSLATED_FIELDS = ("title", "overview", "tagline")
+
+    @staticmethod
+    def _compact_translations(data: Dict) -> Dict:
+        """
+        Reducir el bloque 'translations' de TMDB a los campos traducidos de los
+        idiomas soportados: {"translations": {"en-US": {"title": ..., ...}}}
+        """
+        supported = set(settings.TMDB_LANGUAGES)
+        compact = {}
+        for translation in data.get("translations", []):
+            language = f"{translation.get('iso_639_1')}-{translation.get('iso_3166_1')}"
+            if language in supported:
+                texts = translation.get("data") or {}
+                compact[language] = {field: texts.get(field) for field in TMDBService.TRANSLATED_FIELDS}
+        return {"translations": compact}
+
+    @staticmethod
+    def _translations_request(movie_id: int) -> Tuple[str, str, Dict]:
+        return "details", f"/movie/{movie_id}/translations", {}
+
+    @staticmethod
+    def _split_translations(path: str, data: Dict) -> None:
+        """Separar las traducciones que vienen con la ficha y guardarlas en su propia entrada"""
+        block = data.pop("translations", None)
+        if block is None:
+            return
+        if isinstance(block, list):
+            block = {"translations": block}
+
+        endpoint, translations_path, params = TMDBService._translations_request(data.get("id"))
+        TMDBService._store(
+            TMDBService._cache_key(translations_path, params),
+            CachedResponse.from_data(TMDBService._compact_translations(block)),
+            TMDBService.CACHE_TTLS[endpoint]
+        )
+
+    @staticmethod
+    async def _get_translations(movie_id: int, timeout: Optional[float] = None) -> Dict:
+        """{idioma: {campo: texto}} de una película (normalmente ya en caché junto con la ficha)"""
+        endpoint, path, params = TMDBService._translations_request(movie_id)
+        cached = await TMDBService._get_response(endpoint, path, params, timeout, TMDBService._compact_translations)
+        return cached.data.get("translations", {}) if cached.is_success else {}
+
+    @staticmethod
+    async def _localize(cached: CachedResponse, movie_id: int,
+                        timeout: Optional[float] = None) -> CachedResponse:
+        """Aplicar el idioma de la petición sobre la ficha/tarjeta en el idioma por defecto"""
+        language = get_language()
+        if language == settings.TMDB_DEFAULT_LANGUAGE or not cached.is_success:
+            return cached
+
+        # Sin traducciones se responde en el idioma por defecto
+        try:
+            translations = await TMDBService._get_translations(movie_id, timeout)
+        except TMDBUnavailableError:
+            return cached
+        except Exception as e:
+            print(f"Error localizing movie {movie_id}: {e}")
+            return cached
+
+        base = language.split("-")[0]
+        texts = translations.get(language) or next(
+            (texts for code, texts in translations.items() if code.split("-")[0] == base), {}
+        )
+        # TMDB deja vacíos los campos sin traducir: se conserva el idioma por defecto
+        fields = {field: text for field, text in texts.items() if text and field in cached.data}
+        if not fields:
+            return cached
+
+        return CachedResponse(data={**cached.data, **fields}, stored_at=cached.stored_at)
+
+    @staticmethod
+    def _get_cached_profile(movie_id: int, profile: str) -> Optional[CachedResponse]:
+        """Perfil desde la caché propia o derivado de una ficha completa en caché"""
+        endpoint, path, params = TMDBService._profile_request(movie_id, profile)
+        cached = TMDBService._get_cached(endpoint, path, params, TMDBService._projection(profile))
+        if cached is not None or profile == "detail":
+            return cached
+
+        # Las similares de la ficha vienen en el idioma por defecto
+        if profile == "similar" and get_language() != settings.TMDB_DEFAULT_LANGUAGE:
+            return None
+
+        endpoint, path, params = TMDBService._profile_request(movie_id, "detail")
+        return TMDBService._derive(TMDBService._get_cached(endpoint, path, params), profile)
+
+    @staticmethod
+    async def get_movie_response(movie_id: int, profile: str = "detail",
+                                 timeout: Optional[float] = None) -> CachedResponse:
+        """Respuesta cruda (bytes + ETag) del perfil de una película en el idioma de la petición"""
+        cached = await TMDBService._get_movie_profile(movie_id, profile, timeout)
+        if profile == "similar":
+            return cached
+        return await TMDBService._localize(cached, movie_id, timeout)
+
+    @staticmethod
+    async def _get_movie_profile(movie_id: int, profile: str,
+                                 timeout: Optional[float] = None) -> CachedResponse:
+        """Perfil tal como está en caché (ficha y tarjeta en el idioma por defecto)"""
+        cached = TMDBService._get_cached_profile(movie_id, profile)
+        if cached is not None:
+            return cached
+
+        endpoint, path, params = TMDBService._profile_request(movie_id, profile)
+        try:
+            return await TMDBService._fetch_shared(
+                endpoint,
+                TMDBService._cache_key(path, params),
+                path,
+                params,
+                timeout,
+                TMDBService._projection(profile)
             )
-            return response.json()
+        except TMDBUnavailableError:
+            # Modo degradado: última versión conocida del perfil o de la ficha completa
+            cached = TMDBService._get_expired(path, params)
+            if cached is None and profile != "detail":
+                _, detail_path, detail_params = TMDBService._profile_request(movie_id, "detail")
+                cached = TMDBService._derive(TMDBService._get_expired(detail_path, detail_params), profile)
+            if cached is None:
+                raise
+            return cached
+
+    @staticmethod
+    async def get_movie_details(movie_id: int, profile: str = "detail",
+                                timeout: Optional[float] = None) -> Dict:
+        """
+        Obtener detalles de una película según el perfil:
+        'card' (tarjeta), 'detail' (ficha completa) o 'similar'
+        """
+        return (await TMDBService.get_movie_response(movie_id, profile, timeout)).data
 
     @staticmethod
-    async def get_similar_movies(movie_id: int) -> Dict:
+    async def get_movies_details_bulk(
+            movie_ids: List[int],
+            profile: str = "card",
+            concurrency: Optional[int] = None,
+            timeout: Optional[float] = None,
+            deadline: Optional[float] = None
+    ) -> Dict[int, Dict]:
+        """
+        Obtener detalles de varias películas (por defecto el perfil 'card').
+
+        Elimina IDs duplicados, responde desde caché lo que puede y pide el resto
+        en paralelo con a lo sumo `concurrency` peticiones simultáneas.
+        Retorna {movie_id: datos}; si una película falla su valor es {"error": "..."}
+        en lugar de lanzar excepción.
+
+        Con `deadline` (segundos) no se espera más que eso en total: las que no
+        llegaron quedan como error y siguen descargándose en segundo plano, así
+        quedan en caché para la próxima vez.
+        """
+        results: Dict[int, Dict] = {}
+        pending = []
+        # En otro idioma hay que aplicar traducciones: todo pasa por get_movie_details
+        from_cache = get_language() == settings.TMDB_DEFAULT_LANGUAGE
+
+        for movie_id in dict.fromkeys(movie_ids):
+            cached = TMDBService._get_cached_profile(movie_id, profile) if from_cache else None
+            if cached is not None:
+                results[movie_id] = cached.data
+            else:
+                pending.append(movie_id)
+
+        if not pending:
+            return results
+
+        semaphore = asyncio.Semaphore(concurrency or settings.TMDB_BULK_CONCURRENCY)
+
+        async def fetch(movie_id: int):
+            async with semaphore:
+                try:
+                    data = await TMDBService.get_movie_details(movie_id, profile, timeout)
+                except Exception as e:
+                    return movie_id, {"error": str(e) or type(e).__name__}
+
+            if not data or "id" not in data:
+                return movie_id, {"error": data.get("status_message", "Película no encontrada") if data else "Respuesta vacía"}
+            return movie_id, data
+
+        tasks = [asyncio.create_task(fetch(m)) for m in pending]
+        done, not_done = await asyncio.wait(tasks, timeout=deadline)
+
+        for task in done:
+            movie_id, data = task.result()
+            results[movie_id] = data
+
+        for movie_id, task in zip(pending, tasks):
+            if task in not_done:
+                results[movie_id] = {"error": f"Sin respuesta en {deadline}s"}
+
+        return results
+
+    @staticmethod
+    async def get_similar_movies(movie_id: int, timeout: Optional[float] = None) -> Dict:
         """Obtener películas similares a una película específica"""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{TMDBService.BASE_URL}/movie/{movie_id}/similar",
-                params={
-                    "api_key": settings.TMDB_API_KEY,
-                    "language": "es-MX"
-                }
-            )
-            return response.json()
+        return await TMDBService.get_movie_details(movie_id, "similar", timeout)
 
     @staticmethod
     def get_image_url(path: str, size: str = "w500") -> str:
         """Construir URL de imagen"""
         if not path:
             return ""
-        return f"{TMDBService.IMAGE_BASE_URL}/{size}{path}"
\ No newline at end of file
+        return f"{TMDBService.IMAGE_BASE_URL}/{size}{path}"
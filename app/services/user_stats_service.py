@@ -2,11 +2,14 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func, desc, text
 from typing import Dict, Optional
 from datetime import datetime, timedelta
+import numpy as np
 from app.models.user import User
 from app.models.rating import Rating
 from app.models.review import Review
 from app.models.list import List as MovieList
-from app.services.tmdb_service import TMDBService
+from app.models.movie import Movie
+from app.services.movie_catalog_service import MovieCatalogService
+from app.services.genre_service import GenreService
 
 
 class UserStatsService:
@@ -55,26 +58,26 @@ class UserStatsService:
     def _get_favorite_genre(db: Session, user_id: int) -> Optional[str]:
         """Obtener el género favorito basado en las películas mejor calificadas"""
         try:
-            # Obtener las películas mejor calificadas del usuario (4.0+)
-            high_rated = db.query(Rating.movie_tmdb_id, Rating.rating) \
+            # Películas mejor calificadas del usuario (4.0+) con su máscara de géneros
+            high_rated = db.query(Rating.rating, Movie.genre_mask) \
+                .join(Movie, Movie.tmdb_id == Rating.movie_tmdb_id) \
                 .filter(Rating.user_id == user_id) \
                 .filter(Rating.rating >= 4.0) \
+                .filter(Movie.genre_mask != 0) \
                 .all()
 
             if not high_rated:
                 return None
 
-            # Contador de géneros
-            genre_count = {}
+            # Suma de calificaciones por género (operación de bits vectorizada)
+            ratings = np.array([rating for rating, _ in high_rated], dtype=np.float64)
+            masks = np.array([mask for _, mask in high_rated], dtype=np.uint64)
+            genre_totals = GenreService.genre_weights(masks, ratings)
 
-            for movie_id, rating in high_rated:
-                # Aquí podrías guardar los géneros en caché o en la BD
-                # Por simplicidad, asumimos que ya los tienes
-                # En producción, considera guardar géneros en tu BD
-                pass
+            if not genre_totals:
+                return None
 
-            # Por ahora retornamos None, pero puedes implementar la lógica completa
-            return None
+            return GenreService.name(max(genre_totals, key=genre_totals.get))
 
         except Exception as e:
             print(f"Error getting favorite genre: {e}")
@@ -94,16 +97,31 @@ class UserStatsService:
         """Obtener actividad reciente del usuario"""
         activities = []
 
-        # Obtener ratings recientes
-        ratings = db.query(Rating) \
+        # Obtener ratings y reviews recientes con la película del catálogo
+        ratings = db.query(Rating, Movie) \
+            .outerjoin(Movie, Movie.tmdb_id == Rating.movie_tmdb_id) \
             .filter(Rating.user_id == user_id) \
             .order_by(desc(Rating.created_at)) \
             .limit(limit) \
             .all()
 
-        for rating in ratings:
+        reviews = db.query(Review, Movie) \
+            .outerjoin(Movie, Movie.tmdb_id == Review.movie_tmdb_id) \
+            .filter(Review.user_id == user_id) \
+            .order_by(desc(Review.created_at)) \
+            .limit(limit) \
+            .all()
+
+        movie_cards = await MovieCatalogService.get_cards(
+            db,
+            [r.movie_tmdb_id for r, _ in ratings] + [r.movie_tmdb_id for r, _ in reviews],
+            movies=[m for _, m in ratings + reviews if m is not None]
+        )
+
+        for rating, _ in ratings:
             try:
-                movie_data = await TMDBService.get_movie_details(rating.movie_tmdb_id)
+                movie_data = movie_cards.get(rating.movie_tmdb_id) \
+                    or MovieCatalogService.degraded_card(rating.movie_tmdb_id)
                 activities.append({
                     "id": rating.id,
                     "activity_type": "rating",
@@ -116,16 +134,10 @@ class UserStatsService:
             except:
                 continue
 
-        # Obtener reviews recientes
-        reviews = db.query(Review) \
-            .filter(Review.user_id == user_id) \
-            .order_by(desc(Review.created_at)) \
-            .limit(limit) \
-            .all()
-
-        for review in reviews:
+        for review, _ in reviews:
             try:
-                movie_data = await TMDBService.get_movie_details(review.movie_tmdb_id)
+                movie_data = movie_cards.get(review.movie_tmdb_id) \
+                    or MovieCatalogService.degraded_card(review.movie_tmdb_id)
                 activities.append({
                     "id": review.id,
                     "activity_type": "review",
@@ -0,0 +1,120 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+# Estados posibles de una lectura
+FRESH = "fresh"
+STALE = "stale"
+MISS = "miss"
+
+
+class CacheEntry:
+    __slots__ = ("value", "size", "expires_at", "stale_until", "stored_at")
+
+    def __init__(self, value: Any, size: int, expires_at: float, stale_until: float):
+        self.value = value
+        self.size = size
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+        self.stored_at = time.time()
+
+
+class TTLCache:
+    """
+    Caché LRU en memoria con TTL por entrada y límite de memoria.
+
+    Cada entrada declara su tamaño aproximado en bytes (p. ej. el largo del
+    JSON recibido). Cuando se supera `max_bytes` se expulsan las entradas
+    menos usadas. Una entrada vencida sigue disponible como "stale" hasta
+    `stale_until` para poder servirla mientras se refresca en segundo plano.
+    Pasado ese punto `get` la reporta como MISS, pero se conserva (hasta que
+    la expulse el LRU) para que `peek` pueda usarla si el origen no responde.
+    """
+
+    def __init__(self, max_bytes: int, max_entries: Optional[int] = None):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._data: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+
+        # Contadores
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Tuple[Any, str]:
+        """Retorna (valor, estado) donde estado es FRESH, STALE o MISS"""
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return None, MISS
+
+        now = time.monotonic()
+        if now >= entry.stale_until:
+            self.misses += 1
+            return None, MISS
+
+        self._data.move_to_end(key)
+
+        if now < entry.expires_at:
+            self.hits += 1
+            return entry.value, FRESH
+
+        self.stale_hits += 1
+        return entry.value, STALE
+
+    def peek(self, key: Hashable) -> Optional[CacheEntry]:
+        """Entrada sin tocar contadores ni orden LRU (incluye vencidas)"""
+        return self._data.get(key)
+
+    def set(self, key: Hashable, value: Any, ttl: float, stale_ttl: float = 0, size: int = 1) -> None:
+        """Guardar valor; `size` se usa para la contabilidad de memoria"""
+        if size > self.max_bytes:
+            return
+
+        if key in self._data:
+            self._remove(key)
+
+        now = time.monotonic()
+        self._data[key] = CacheEntry(value, size, now + ttl, now + ttl + stale_ttl)
+        self._bytes += size
+
+        while self._bytes > self.max_bytes or (
+                self.max_entries is not None and len(self._data) > self.max_entries
+        ):
+            oldest_key = next(iter(self._data))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        if key in self._data:
+            self._remove(key)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._bytes = 0
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._data.pop(key)
+        self._bytes -= entry.size
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def stats(self) -> Dict:
+        """Contadores y uso de memoria"""
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "entries": len(self._data),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round((self.hits + self.stale_hits) / lookups, 3) if lookups else 0.0
+        }
@@ -0,0 +1,171 @@
+import asyncio
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Optional
+
+
+class DiskCacheEntry:
+    __slots__ = ("body", "stored_at", "expires_at", "stale_until")
+
+    def __init__(self, body: bytes, stored_at: float, expires_at: float, stale_until: float):
+        self.body = body
+        self.stored_at = stored_at
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    @property
+    def is_usable(self) -> bool:
+        """Fresca o dentro de la ventana stale"""
+        return time.time() < self.stale_until
+
+
+class DiskCache:
+    """
+    Caché persistente en disco compartida por todos los workers del host.
+
+    Usa SQLite en modo WAL (lectores concurrentes sin bloquear al escritor)
+    con los cuerpos comprimidos con zlib. Cuando el archivo supera
+    `max_bytes` se expulsan las entradas menos usadas. Los tiempos son de
+    reloj de pared para que sirvan entre procesos y reinicios.
+    Los métodos síncronos bloquean: desde async usar las variantes `a*`.
+    """
+
+    # Actualizar accessed_at como mucho cada tanto para no escribir en cada lectura
+    TOUCH_INTERVAL = 60
+    EVICT_EVERY = 100
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        conn = self._conn()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                stored_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                stale_until REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed_at)")
+
+    def _conn(self) -> sqlite3.Connection:
+        """Una conexión por hilo (sqlite3 no comparte conexiones entre hilos)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[DiskCacheEntry]:
+        row = self._conn().execute(
+            "SELECT body, stored_at, expires_at, stale_until, accessed_at FROM entries WHERE key = ?",
+            (key,)
+        ).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        body, stored_at, expires_at, stale_until, accessed_at = row
+        now = time.time()
+        if now - accessed_at > self.TOUCH_INTERVAL:
+            try:
+                self._conn().execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            except sqlite3.OperationalError:
+                pass  # Otro worker está escribiendo; no es crítico
+
+        self.hits += 1
+        return DiskCacheEntry(zlib.decompress(body), stored_at, expires_at, stale_until)
+
+    def set(self, key: str, body: bytes, ttl: float, stale_ttl: float = 0) -> None:
+        compressed = zlib.compress(body, 6)
+        if len(compressed) > self.max_bytes:
+            return
+
+        now = time.time()
+        self._conn().execute(
+            """
+            INSERT OR REPLACE INTO entries (key, body, size, stored_at, expires_at, stale_until, accessed_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (key, compressed, len(compressed), now, now + ttl, now + ttl + stale_ttl, now)
+        )
+
+        self._writes += 1
+        if self._writes % self.EVICT_EVERY == 0:
+            self.evict()
+
+    def evict(self) -> int:
+        """Expulsar las entradas menos usadas hasta quedar bajo `max_bytes`"""
+        conn = self._conn()
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        removed = 0
+
+        while total > self.max_bytes:
+            rows = conn.execute(
+                "SELECT key, size FROM entries ORDER BY accessed_at LIMIT 200"
+            ).fetchall()
+            if not rows:
+                break
+
+            conn.executemany("DELETE FROM entries WHERE key = ?", [(k,) for k, _ in rows])
+            total -= sum(size for _, size in rows)
+            removed += len(rows)
+
+        self.evictions += removed
+        return removed
+
+    def delete(self, key: str) -> None:
+        self._conn().execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    # ==================== ASYNC ====================
+
+    async def aget(self, key: str) -> Optional[DiskCacheEntry]:
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, body: bytes, ttl: float, stale_ttl: float = 0) -> None:
+        await asyncio.to_thread(self.set, key, body, ttl, stale_ttl)
+
+    def stats(self) -> Dict:
+        try:
+            entries, total = self._conn().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        except sqlite3.Error:
+            entries, total = None, None
+
+        return {
+            "path": self.path,
+            "entries": entries,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions
+        }
@@ -0,0 +1,88 @@
+import hashlib
+import json
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, Dict, Optional
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+
+def make_etag(*parts: Any) -> str:
+    """ETag fuerte a partir de bytes o de valores que lo identifican"""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode())
+        digest.update(b"\0")
+    return f'"{digest.hexdigest()}"'
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Comparación débil de If-None-Match (admite listas, W/ y *)"""
+    if header.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == bare for tag in header.split(","))
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[float] = None) -> bool:
+    """¿El cliente ya tiene esta versión? If-None-Match tiene prioridad sobre If-Modified-Since"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            return int(last_modified) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+
+    return False
+
+
+def _cache_headers(etag: str, cache_control: str, last_modified: Optional[float]) -> Dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if last_modified is not None:
+        headers["Last-Modified"] = formatdate(last_modified, usegmt=True)
+    return headers
+
+
+def not_modified_response(etag: str, cache_control: str, last_modified: Optional[float] = None) -> Response:
+    """304 sin cuerpo"""
+    return Response(status_code=304, headers=_cache_headers(etag, cache_control, last_modified))
+
+
+def conditional_response(
+        request: Request,
+        content: bytes,
+        cache_control: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[float] = None,
+        status_code: int = 200
+) -> Response:
+    """
+    Respuesta JSON con ETag/Last-Modified/Cache-Control.
+    Si el cliente ya tiene la misma versión responde 304 sin cuerpo.
+    """
+    if not 200 <= status_code < 300:
+        return Response(content=content, status_code=status_code, media_type="application/json")
+
+    etag = etag or make_etag(content)
+    if is_not_modified(request, etag, last_modified):
+        return not_modified_response(etag, cache_control, last_modified)
+
+    return Response(
+        content=content,
+        status_code=status_code,
+        media_type="application/json",
+        headers=_cache_headers(etag, cache_control, last_modified)
+    )
+
+
+def json_response(request: Request, data: Any, cache_control: str,
+                  etag: Optional[str] = None, last_modified: Optional[float] = None) -> Response:
+    """
+    Serializar `data` y responder con caché condicional.
+    Sin `etag` se calcula a partir del cuerpo (ahorra bytes, no el trabajo de armarlo).
+    """
+    content = json.dumps(jsonable_encoder(data), ensure_ascii=False, separators=(",", ":")).encode()
+    return conditional_response(request, content, cache_control, etag=etag, last_modified=last_modified)
@@ -0,0 +1,123 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+from urllib.parse import unquote
+from app.config import settings
+
+# Idioma de TMDB de la petición actual ('es-MX', 'en-US'...); lo fija el middleware
+_language: ContextVar[Optional[str]] = ContextVar("tmdb_language", default=None)
+
+
+def get_language() -> str:
+    return _language.get() or settings.TMDB_DEFAULT_LANGUAGE
+
+
+def get_region() -> str:
+    """Región ISO 3166-1 del idioma actual (p. ej. 'MX' para 'es-MX')"""
+    language = get_language()
+    return language.split("-")[1] if "-" in language else settings.TMDB_DEFAULT_LANGUAGE.split("-")[1]
+
+
+def set_language(language: Optional[str]):
+    """Fijar el idioma para el contexto actual; retorna el token para restaurarlo"""
+    return _language.set(language)
+
+
+def reset_language(token) -> None:
+    _language.reset(token)
+
+
+@contextmanager
+def use_language(language: Optional[str]):
+    """Ejecutar un bloque en otro idioma (None = idioma por defecto)"""
+    token = _language.set(language)
+    try:
+        yield
+    finally:
+        _language.reset(token)
+
+
+def _parse_accept_language(header: str) -> List[Tuple[str, float]]:
+    """'es-AR,es;q=0.9,en;q=0.8' -> [('es-AR', 1.0), ('es', 0.9), ('en', 0.8)] ordenado por q"""
+    ranges = []
+    for part in header.split(","):
+        tag, _, params = part.strip().partition(";")
+        if not tag:
+            continue
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        if q > 0:
+            ranges.append((tag.strip(), q))
+    return sorted(ranges, key=lambda item: -item[1])
+
+
+def negotiate_language(requested: Optional[str]) -> str:
+    """
+    Elegir uno de los idiomas soportados (TMDB_LANGUAGES) a partir de un
+    Accept-Language o un código suelto: primero coincidencia exacta, luego
+    por idioma base ('es-AR' -> 'es-MX'). Si no hay, el idioma por defecto.
+    """
+    if not requested:
+        return settings.TMDB_DEFAULT_LANGUAGE
+
+    supported = {language.lower(): language for language in settings.TMDB_LANGUAGES}
+    by_base = {}
+    for language in settings.TMDB_LANGUAGES:
+        by_base.setdefault(language.split("-")[0].lower(), language)
+    # El idioma por defecto gana entre variantes de su mismo idioma base
+    by_base[settings.TMDB_DEFAULT_LANGUAGE.split("-")[0].lower()] = settings.TMDB_DEFAULT_LANGUAGE
+
+    for tag, _ in _parse_accept_language(requested):
+        tag = tag.replace("_", "-").lower()
+        if tag in supported:
+            return supported[tag]
+        if tag.split("-")[0] in by_base:
+            return by_base[tag.split("-")[0]]
+
+    return settings.TMDB_DEFAULT_LANGUAGE
+
+
+class LocaleMiddleware:
+    """
+    Middleware ASGI que fija el idioma de TMDB de cada petición a partir de
+    ?language= o Accept-Language, y lo informa en Content-Language/Vary.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        requested = None
+        for param in scope.get("query_string", b"").decode("latin-1").split("&"):
+            if param.startswith("language="):
+                requested = unquote(param[len("language="):])
+                break
+        if requested is None:
+            for name, value in scope.get("headers", []):
+                if name == b"accept-language":
+                    requested = value.decode("latin-1")
+                    break
+
+        language = negotiate_language(requested)
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"content-language", language.encode()))
+                headers.append((b"vary", b"Accept-Language"))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        token = _language.set(language)
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            _language.reset(token)
@@ -0,0 +1,75 @@
+import base64
+from datetime import datetime
+from typing import Optional, Tuple
+from fastapi import HTTPException, status
+
+
+def _encode(key: str, item_id: int) -> str:
+    raw = f"{key}|{item_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _decode(cursor: str) -> Tuple[str, int]:
+    raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    key, item_id = raw.rsplit("|", 1)
+    return key, int(item_id)
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail="Cursor inválido"
+    )
+
+
+def encode_cursor(created_at: datetime, item_id: int) -> str:
+    """Cursor opaco para paginar por (created_at, id)"""
+    return _encode(created_at.isoformat(), item_id)
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, int]]:
+    """(created_at, id) del cursor; 400 si no es válido"""
+    if not cursor:
+        return None
+
+    try:
+        created_at, item_id = _decode(cursor)
+        return datetime.fromisoformat(created_at), item_id
+    except (ValueError, UnicodeDecodeError):
+        raise _invalid_cursor()
+
+
+def encode_score_cursor(score: float, item_id: int) -> str:
+    """Cursor opaco para paginar por (puntaje, id)"""
+    return _encode(repr(score), item_id)
+
+
+def decode_score_cursor(cursor: Optional[str]) -> Optional[Tuple[float, int]]:
+    """(puntaje, id) del cursor; 400 si no es válido"""
+    if not cursor:
+        return None
+
+    try:
+        score, item_id = _decode(cursor)
+        return float(score), item_id
+    except (ValueError, UnicodeDecodeError):
+        raise _invalid_cursor()
+
+
+def encode_id_cursor(item_id: int) -> str:
+    """Cursor opaco para paginar solo por id"""
+    return _encode("id", item_id)
+
+
+def decode_id_cursor(cursor: Optional[str]) -> Optional[int]:
+    """id del cursor; 400 si no es válido"""
+    if not cursor:
+        return None
+
+    try:
+        key, item_id = _decode(cursor)
+        if key != "id":
+            raise ValueError(key)
+        return item_id
+    except (ValueError, UnicodeDecodeError):
+        raise _invalid_cursor()
@@ -0,0 +1,127 @@
+import asyncio
+import random
+import time
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """
+    Limitador de tasa (token bucket) para llamadas salientes.
+
+    `rate` tokens por segundo con ráfagas de hasta `capacity`. Cada llamada
+    reserva un token; si no hay disponibles espera lo necesario. La reserva
+    es atómica porque todo ocurre en el mismo event loop.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self.throttled = 0
+
+    def _reserve(self) -> float:
+        """Reservar un token y retornar cuántos segundos hay que esperar"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+
+        if self._tokens >= 0:
+            return 0.0
+        return -self._tokens / self.rate
+
+    async def acquire(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            self.throttled += 1
+            await asyncio.sleep(delay)
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker simple: tras `failure_threshold` fallos consecutivos se
+    abre y rechaza llamadas durante `reset_timeout` segundos. Luego deja pasar
+    una llamada de prueba (half-open): si funciona se cierra, si no se reabre.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started_at: Optional[float] = None
+        self.rejected = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._probe_started_at = None
+        return self._state
+
+    def allow(self) -> bool:
+        """¿Se puede hacer la llamada ahora?"""
+        state = self.state
+
+        if state == self.CLOSED:
+            return True
+
+        if state == self.HALF_OPEN:
+            now = time.monotonic()
+            # Una sola llamada de prueba a la vez (con tope por si nunca termina)
+            if self._probe_started_at is None or now - self._probe_started_at >= self.reset_timeout:
+                self._probe_started_at = now
+                return True
+
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        self._failures = 0
+        self._state = self.CLOSED
+        self._probe_started_at = None
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+            if self._state != self.OPEN:
+                self.times_opened += 1
+            self._state = self.OPEN
+            self._opened_at = time.monotonic()
+            self._probe_started_at = None
+
+    def stats(self) -> Dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "times_opened": self.times_opened,
+            "rejected": self.rejected
+        }
+
+
+def backoff_delay(attempt: int, base: float, cap: float, retry_after: Optional[float] = None) -> float:
+    """
+    Espera antes del reintento `attempt` (0, 1, 2...): backoff exponencial con
+    jitter. Si el servidor envió Retry-After se respeta como mínimo.
+    """
+    delay = random.uniform(0, min(cap, base * (2 ** attempt)))
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return min(delay, cap)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After en segundos (se ignora el formato de fecha HTTP)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
@@ -0,0 +1,188 @@
+import heapq
+import math
+import re
+import unicodedata
+from bisect import bisect_left, insort
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Minúsculas, sin acentos y separado por todo lo que no sea letra o número"""
+    if not text:
+        return []
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(char for char in text if not unicodedata.combining(char))
+    return _TOKEN_RE.findall(text.lower())
+
+
+class SearchIndex:
+    """
+    Índice invertido en memoria con ranking BM25 y autocompletado por prefijo.
+
+    Cada documento es un conjunto de textos (p. ej. título, título original,
+    año) y un payload que se devuelve tal cual. El último término de la
+    consulta se trata como prefijo: se expande sobre el vocabulario ordenado
+    (búsqueda binaria) a los términos más frecuentes que empiezan igual.
+    Todos los términos de la consulta deben aparecer en el documento.
+
+    Se actualiza documento a documento (`add` reemplaza si ya existía).
+    No es thread-safe: usarlo desde el event loop.
+    """
+
+    K1 = 1.2
+    B = 0.75
+    # Los términos completados por prefijo puntúan algo menos que una coincidencia exacta
+    PREFIX_WEIGHT = 0.85
+    MAX_EXPANSIONS = 64
+    MAX_SCAN = 512
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[Hashable, int]] = {}
+        self._terms: List[str] = []  # Vocabulario ordenado para los prefijos
+        self._doc_terms: Dict[Hashable, Dict[str, int]] = {}
+        self._doc_len: Dict[Hashable, int] = {}
+        self._payloads: Dict[Hashable, Any] = {}
+        self._boosts: Dict[Hashable, float] = {}
+        self._total_len = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_len)
+
+    def __contains__(self, doc_id: Hashable) -> bool:
+        return doc_id in self._doc_len
+
+    def get(self, doc_id: Hashable) -> Any:
+        return self._payloads.get(doc_id)
+
+    # ==================== ESCRITURA ====================
+
+    def add(self, doc_id: Hashable, texts: Iterable[Optional[str]], payload: Any = None, boost: float = 0.0) -> None:
+        """
+        Indexar (o reindexar) un documento. Los textos repetidos (título igual
+        al título original) se indexan una sola vez. `boost` desempata documentos con el mismo puntaje (p. ej. popularidad).
+        """
+        if doc_id in self._doc_len:
+            self.remove(doc_id)
+
+        frequencies: Dict[str, int] = {}
+        seen_texts = set()
+        for text in texts:
+            if not text or text in seen_texts:
+                continue
+            seen_texts.add(text)
+            for term in tokenize(text):
+                frequencies[term] = frequencies.get(term, 0) + 1
+
+        length = sum(frequencies.values())
+        if not length:
+            return
+
+        for term, frequency in frequencies.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                insort(self._terms, term)
+            postings[doc_id] = frequency
+
+        self._doc_terms[doc_id] = frequencies
+        self._doc_len[doc_id] = length
+        self._payloads[doc_id] = payload
+        self._boosts[doc_id] = boost
+        self._total_len += length
+
+    def remove(self, doc_id: Hashable) -> None:
+        frequencies = self._doc_terms.pop(doc_id, None)
+        if frequencies is None:
+            return
+
+        for term in frequencies:
+            postings = self._postings[term]
+            postings.pop(doc_id, None)
+            if not postings:
+                del self._postings[term]
+                del self._terms[bisect_left(self._terms, term)]
+
+        self._total_len -= self._doc_len.pop(doc_id)
+        self._payloads.pop(doc_id, None)
+        self._boosts.pop(doc_id, None)
+
+    # ==================== BÚSQUEDA ====================
+
+    def _expand(self, prefix: str) -> List[Tuple[str, float]]:
+        """Términos del vocabulario que empiezan con `prefix` (los más frecuentes primero)"""
+        start = bisect_left(self._terms, prefix)
+        candidates = []
+        for term in self._terms[start:start + self.MAX_SCAN]:
+            if not term.startswith(prefix):
+                break
+            candidates.append(term)
+
+        if len(candidates) > self.MAX_EXPANSIONS:
+            candidates = heapq.nlargest(self.MAX_EXPANSIONS, candidates, key=lambda t: len(self._postings[t]))
+
+        return [(term, 1.0 if term == prefix else self.PREFIX_WEIGHT) for term in candidates]
+
+    def _score_terms(self, terms: List[Tuple[str, float]],
+                     candidates: Optional[Iterable[Hashable]] = None) -> Dict[Hashable, float]:
+        """
+        BM25 de cada documento para el mejor de los términos alternativos.
+        Con `candidates` solo se puntúan esos documentos (intersección barata).
+        """
+        docs = len(self._doc_len)
+        avg_len = self._total_len / docs
+        scores: Dict[Hashable, float] = {}
+
+        for term, weight in terms:
+            postings = self._postings[term]
+            idf = math.log(1 + (docs - len(postings) + 0.5) / (len(postings) + 0.5))
+            matches = postings.items() if candidates is None else (
+                (doc_id, postings[doc_id]) for doc_id in candidates if doc_id in postings
+            )
+            for doc_id, frequency in matches:
+                norm = frequency + self.K1 * (1 - self.B + self.B * self._doc_len[doc_id] / avg_len)
+                score = weight * idf * frequency * (self.K1 + 1) / norm
+                if score > scores.get(doc_id, 0.0):
+                    scores[doc_id] = score
+
+        return scores
+
+    def search(self, query: str, limit: int = 20, prefix: bool = True) -> List[Tuple[Hashable, float]]:
+        """[(doc_id, puntaje)] ordenado por relevancia; vacío si algún término no aparece"""
+        tokens = tokenize(query)
+        if not tokens or not self._doc_len:
+            return []
+
+        alternatives = []
+        for index, token in enumerate(tokens):
+            # El último término es un prefijo; los anteriores también si no existen completos
+            if token in self._postings and not (prefix and index == len(tokens) - 1):
+                terms = [(token, 1.0)]
+            elif prefix:
+                terms = self._expand(token)
+            else:
+                terms = []
+
+            if not terms:
+                return []
+            alternatives.append(terms)
+
+        # Primero el término más raro: los demás solo puntúan sus candidatos
+        alternatives.sort(key=lambda terms: sum(len(self._postings[term]) for term, _ in terms))
+
+        scores = self._score_terms(alternatives[0])
+        for terms in alternatives[1:]:
+            if not scores:
+                return []
+            token_scores = self._score_terms(terms, scores.keys())
+            scores = {doc_id: score + scores[doc_id] for doc_id, score in token_scores.items()}
+
+        return heapq.nlargest(limit, scores.items(), key=lambda item: (item[1], self._boosts[item[0]]))
+
+    def stats(self) -> Dict:
+        return {
+            "documents": len(self._doc_len),
+            "terms": len(self._terms),
+            "avg_length": round(self._total_len / len(self._doc_len), 2) if self._doc_len else 0
+        }
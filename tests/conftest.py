@@ -0,0 +1,40 @@
+import os
+import tempfile
+
+# Antes de importar la app: BD SQLite temporal, sin caché en disco ni precalentado
+_DB_PATH = os.path.join(tempfile.mkdtemp(prefix="cineminha-tests-"), "test.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_PATH}"
+os.environ["TMDB_DISK_CACHE_PATH"] = ""
+os.environ["TMDB_WARM_ENABLED"] = "false"
+
+import httpx
+import pytest
+from app.database import Base, SessionLocal, engine
+import app.models  # noqa: F401  (registra todas las tablas)
+from app.fake_tmdb import create_app
+from app.services.tmdb_service import TMDBService
+
+engine.echo = False
+
+
+@pytest.fixture
+def db():
+    """Sesión sobre tablas vacías"""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def fake_tmdb():
+    """TMDBService contra el TMDB falso (sin red) y con la caché vacía"""
+    fake = create_app()
+    TMDBService._cache.clear()
+    TMDBService._client = httpx.AsyncClient(transport=httpx.ASGITransport(fake), base_url="http://fake-tmdb/3")
+    yield fake
+    TMDBService._cache.clear()
+    TMDBService._client = None
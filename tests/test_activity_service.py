@@ -0,0 +1,52 @@
+import math
+from datetime import datetime, timedelta
+from app.config import settings
+from app.models.activity import Activity
+from app.models.rating import Rating
+from app.models.user import User
+from app.services.activity_service import ActivityService
+
+
+def _user(db) -> User:
+    user = User(username="author", email="author@example.com", password_hash="x")
+    db.add(user)
+    db.flush()
+    return user
+
+
+def test_record_uses_source_created_at(db):
+    user = _user(db)
+    rating = Rating(user_id=user.id, movie_tmdb_id=10, rating=4.0, created_at=datetime(2025, 3, 1, 12, 0))
+    db.add(rating)
+    db.flush()
+
+    activity = ActivityService.record(db, user.id, "rating", rating.id, rating.created_at, 10)
+    db.commit()
+
+    assert activity.created_at == rating.created_at
+    assert activity.hot_score == ActivityService.hot_score(rating.created_at)
+
+
+def test_hot_score_half_life_equals_doubling_engagement():
+    created = datetime(2025, 1, 1)
+    later = created + timedelta(seconds=settings.FEED_HOT_HALF_LIFE)
+
+    # Una vida media después, sin engagement, equivale a log(2) más
+    assert math.isclose(
+        ActivityService.hot_score(later) - ActivityService.hot_score(created), math.log(2)
+    )
+    assert ActivityService.hot_score(created, likes=3) > ActivityService.hot_score(created, likes=1)
+    assert ActivityService.hot_score(created, comments=1) > ActivityService.hot_score(created, likes=1)
+
+
+def test_backfill_runs_once(db):
+    user = _user(db)
+    db.add(Rating(user_id=user.id, movie_tmdb_id=11, rating=3.0))
+    db.commit()
+
+    assert ActivityService.backfill() == 1
+    assert ActivityService.backfill() == 0
+
+    db.expire_all()
+    activity = db.query(Activity).one()
+    assert activity.hot_score > 0
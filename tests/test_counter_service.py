@@ -0,0 +1,71 @@
+from app.models.comment import Comment
+from app.models.interaction_counter import InteractionCounter
+from app.models.like import Like
+from app.models.user import User
+from app.services.counter_service import CounterService
+from app.services.interaction_service import InteractionService
+
+
+def _users(db, count: int):
+    users = [User(username=f"u{i}", email=f"u{i}@example.com", password_hash="x") for i in range(count)]
+    db.add_all(users)
+    db.commit()
+    return [user.id for user in users]
+
+
+def test_increment_creates_then_accumulates(db):
+    assert CounterService.get_counts(db, "review", 1) == (0, 0)
+
+    CounterService.increment(db, "review", 1, likes=1)
+    CounterService.increment(db, "review", 1, likes=2, comments=1)
+    CounterService.increment(db, "review", 1, likes=-1)
+    db.commit()
+
+    assert CounterService.get_counts(db, "review", 1) == (2, 1)
+
+
+def test_first_decrement_does_not_go_negative(db):
+    CounterService.increment(db, "rating", 5, likes=-1)
+    db.commit()
+
+    assert CounterService.get_counts(db, "rating", 5) == (0, 0)
+
+
+def test_get_counts_bulk(db):
+    CounterService.increment(db, "rating", 1, likes=3)
+    CounterService.increment(db, "list", 1, comments=2)
+    db.commit()
+
+    counts = CounterService.get_counts_bulk(db, {"rating": [1, 2], "list": [1]})
+
+    assert counts == {("rating", 1): (3, 0), ("list", 1): (0, 2)}
+
+
+def test_toggle_like_keeps_counter_in_sync(db):
+    a, b = _users(db, 2)
+
+    InteractionService.toggle_like(db, a, "rating", 9)
+    InteractionService.toggle_like(db, b, "rating", 9)
+    InteractionService.toggle_like(db, a, "rating", 9)
+
+    assert InteractionService.get_likes_count(db, "rating", 9) == 1
+
+
+def test_reconcile_repairs_drift(db):
+    a, b = _users(db, 2)
+    db.add_all([
+        Like(user_id=a, target_type="review", target_id=1),
+        Like(user_id=b, target_type="review", target_id=1),
+        Comment(user_id=a, target_type="review", target_id=1, content="x")
+    ])
+    # Contadores desviados: uno de menos y otro de un objeto sin likes
+    db.add(InteractionCounter(target_type="review", target_id=1, likes_count=1, comments_count=1))
+    db.add(InteractionCounter(target_type="list", target_id=4, likes_count=3, comments_count=0))
+    db.commit()
+
+    assert CounterService.reconcile() == 2
+
+    db.expire_all()
+    assert CounterService.get_counts(db, "review", 1) == (2, 1)
+    assert CounterService.get_counts(db, "list", 4) == (0, 0)
+    assert CounterService.reconcile() == 0
@@ -0,0 +1,71 @@
+import asyncio
+import pytest
+from app.models.user import User
+from app.schemas.list import ListCreate, ListUpdate
+from app.schemas.rating import RatingCreate
+from app.services.feed_service import FeedService
+from app.services.interaction_service import InteractionService
+from app.services.list_service import ListService
+from app.services.rating_service import RatingService
+
+
+@pytest.fixture
+def author(db, fake_tmdb):
+    FeedService._page_cache.clear()
+    user = User(username="author", email="author@example.com", password_hash="x")
+    db.add(user)
+    db.commit()
+    yield user.id
+    FeedService._page_cache.clear()
+
+
+def _feed(db, user_id):
+    return asyncio.run(FeedService.get_global_feed(db, current_user_id=user_id))["items"]
+
+
+def test_cached_page_is_reused(db, author):
+    ListService.create_list(db, author, ListCreate(name="a"))
+    _feed(db, author)
+    hits = FeedService.cache_stats()["hits"]
+
+    _feed(db, author)
+
+    assert FeedService.cache_stats()["hits"] == hits + 1
+
+
+def test_list_rename_invalidates_cached_page(db, author):
+    lst = ListService.create_list(db, author, ListCreate(name="a"))
+    assert _feed(db, author)[0]["list_name"] == "a"
+
+    ListService.update_list(db, lst.id, author, ListUpdate(name="RENAMED"))
+
+    assert _feed(db, author)[0]["list_name"] == "RENAMED"
+
+
+def test_rating_edit_invalidates_cached_page(db, author):
+    RatingService.create_or_update_rating(db, author, RatingCreate(movie_tmdb_id=700, rating=3.0))
+    assert _feed(db, author)[0]["rating"] == 3.0
+
+    RatingService.create_or_update_rating(db, author, RatingCreate(movie_tmdb_id=700, rating=4.5))
+
+    assert _feed(db, author)[0]["rating"] == 4.5
+
+
+def test_delete_invalidates_cached_page(db, author):
+    lst = ListService.create_list(db, author, ListCreate(name="a"))
+    assert len(_feed(db, author)) == 1
+
+    ListService.delete_list(db, lst.id, author)
+
+    assert _feed(db, author) == []
+
+
+def test_stats_overlaid_on_cached_page(db, author):
+    lst = ListService.create_list(db, author, ListCreate(name="a"))
+    assert _feed(db, author)[0]["likes_count"] == 0
+
+    InteractionService.toggle_like(db, author, "list", lst.id)
+    item = _feed(db, author)[0]
+
+    assert item["likes_count"] == 1
+    assert item["user_has_liked"] is True
@@ -0,0 +1,26 @@
+import asyncio
+from app.database import SessionLocal
+from app.models.movie import Movie
+from app.models.user import User
+from app.services.movie_catalog_service import MovieCatalogService
+
+
+def test_get_cards_fetches_and_stores_missing_movies(db, fake_tmdb):
+    cards = asyncio.run(MovieCatalogService.get_cards(db, [600, 601]))
+
+    assert set(cards) == {600, 601}
+    other = SessionLocal()
+    try:
+        assert other.get(Movie, 600).synced_at is not None
+    finally:
+        other.close()
+
+
+def test_catalog_write_does_not_commit_caller_session(db, fake_tmdb):
+    db.add(User(username="pending", email="pending@example.com", password_hash="x"))
+
+    asyncio.run(MovieCatalogService.get_cards(db, [602]))
+    db.rollback()
+
+    assert db.query(User).filter(User.username == "pending").first() is None
+    assert db.get(Movie, 602) is not None
@@ -0,0 +1,43 @@
+from datetime import datetime
+import pytest
+from fastapi import HTTPException
+from app.utils.pagination import (
+    encode_cursor, decode_cursor, encode_score_cursor, decode_score_cursor, encode_id_cursor, decode_id_cursor
+)
+
+
+def test_datetime_cursor_roundtrip():
+    created_at = datetime(2025, 5, 17, 10, 30, 15, 123456)
+    cursor = encode_cursor(created_at, 42)
+
+    assert "=" not in cursor  # Apto para query string sin escapar
+    assert decode_cursor(cursor) == (created_at, 42)
+
+
+def test_score_cursor_roundtrip_keeps_full_precision():
+    score = 1416.6551234567891
+    assert decode_score_cursor(encode_score_cursor(score, 7)) == (score, 7)
+
+
+def test_id_cursor_roundtrip():
+    assert decode_id_cursor(encode_id_cursor(123)) == 123
+
+
+@pytest.mark.parametrize("decode", [decode_cursor, decode_score_cursor, decode_id_cursor])
+def test_empty_cursor_is_none(decode):
+    assert decode(None) is None
+    assert decode("") is None
+
+
+@pytest.mark.parametrize("decode", [decode_cursor, decode_score_cursor, decode_id_cursor])
+def test_invalid_cursor_is_400(decode):
+    with pytest.raises(HTTPException) as error:
+        decode("not-a-cursor")
+    assert error.value.status_code == 400
+
+
+def test_cursor_kinds_are_not_interchangeable():
+    with pytest.raises(HTTPException):
+        decode_id_cursor(encode_cursor(datetime(2025, 1, 1), 5))
+    with pytest.raises(HTTPException):
+        decode_cursor(encode_score_cursor(1.5, 5))
@@ -0,0 +1,110 @@
+from datetime import datetime
+from sqlalchemy.exc import OperationalError
+from app.config import settings
+from app.models.follow import Follow, HomeTimeline
+from app.models.user import User
+from app.services.activity_service import ActivityService
+from app.services.timeline_service import TimelineService
+
+
+def _users(db, count: int):
+    users = [User(username=f"u{i}", email=f"u{i}@example.com", password_hash="x") for i in range(count)]
+    db.add_all(users)
+    db.commit()
+    return [user.id for user in users]
+
+
+def _timeline(db, user_id: int):
+    db.expire_all()
+    timeline = db.get(HomeTimeline, user_id)
+    return TimelineService._unpack(timeline.activity_ids) if timeline else None
+
+
+def test_pack_roundtrip():
+    ids = [4_000_000_000, 70_000, 3, 1]
+    assert TimelineService._unpack(TimelineService._pack(ids)) == ids
+    assert TimelineService._unpack(None) == []
+
+
+def test_merge_dedupes_orders_and_truncates(monkeypatch):
+    assert TimelineService._merge([9, 5, 2], [7, 5, 11]) == [11, 9, 7, 5, 2]
+
+    monkeypatch.setattr(settings, "FEED_TIMELINE_MAX_LENGTH", 3)
+    assert TimelineService._merge([9, 5, 2], [7, 11]) == [11, 9, 7]
+
+
+def test_push_creates_and_merges_rows(db):
+    a, b = _users(db, 2)
+    TimelineService.push(db, [a], [3, 1])
+    db.commit()
+
+    TimelineService.push(db, [a, b], [2, 3])
+    db.commit()
+
+    assert _timeline(db, a) == [3, 2, 1]
+    assert _timeline(db, b) == [3, 2]
+
+
+def test_push_tolerates_row_created_concurrently(db):
+    (a,) = _users(db, 1)
+    # Otra transacción creó la fila entre medio: el INSERT no debe fallar
+    db.add(HomeTimeline(user_id=a, activity_ids=TimelineService._pack([5])))
+    db.commit()
+
+    TimelineService.push(db, [a], [6])
+    db.commit()
+
+    assert _timeline(db, a) == [6, 5]
+
+
+def test_push_batch_retries_after_deadlock(db, monkeypatch):
+    (a,) = _users(db, 1)
+    original = TimelineService.push
+    calls = []
+
+    def flaky(session, user_ids, activity_ids):
+        calls.append(user_ids)
+        if len(calls) == 1:
+            raise OperationalError("UPDATE", {}, Exception("Deadlock found"))
+        original(session, user_ids, activity_ids)
+
+    monkeypatch.setattr(TimelineService, "push", flaky)
+
+    assert TimelineService._push_batch(db, [a], [1])
+    assert len(calls) == 2
+    assert _timeline(db, a) == [1]
+
+
+def test_fan_out_skips_failed_batch_and_continues(db, monkeypatch):
+    author, *followers = _users(db, 4)
+    db.add_all(Follow(follower_id=f, followed_id=author) for f in followers)
+    activity = ActivityService.record(db, author, "list_created", 1, datetime(2025, 1, 1))
+    db.commit()
+
+    original = TimelineService.push
+
+    def failing_for_first_follower(session, user_ids, activity_ids):
+        if followers[0] in user_ids:
+            raise OperationalError("UPDATE", {}, Exception("Lock wait timeout"))
+        original(session, user_ids, activity_ids)
+
+    monkeypatch.setattr(TimelineService, "FANOUT_BATCH", 1)
+    monkeypatch.setattr(TimelineService, "push", failing_for_first_follower)
+
+    assert TimelineService.fan_out("list_created", 1) == 2
+    assert _timeline(db, author) == [activity.id]
+    assert _timeline(db, followers[0]) is None
+    assert _timeline(db, followers[1]) == [activity.id]
+    assert _timeline(db, followers[2]) == [activity.id]
+
+
+def test_fan_out_skips_pulled_accounts(db, monkeypatch):
+    author, follower = _users(db, 2)
+    db.add(Follow(follower_id=follower, followed_id=author))
+    activity = ActivityService.record(db, author, "list_created", 1, datetime(2025, 1, 1))
+    db.commit()
+    monkeypatch.setattr(settings, "FEED_FANOUT_MAX_FOLLOWERS", 0)
+
+    assert TimelineService.fan_out("list_created", 1) == 0
+    assert _timeline(db, author) == [activity.id]
+    assert _timeline(db, follower) is None
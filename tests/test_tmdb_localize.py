@@ -0,0 +1,69 @@
+import asyncio
+from app.services.tmdb_service import TMDBService, CachedResponse
+from app.utils.locale import use_language
+
+
+def _translations_key(movie_id: int) -> str:
+    _, path, params = TMDBService._translations_request(movie_id)
+    return TMDBService._cache_key(path, params)
+
+
+def test_translations_fetched_cold(fake_tmdb):
+    translations = asyncio.run(TMDBService._get_translations(550))
+
+    assert translations["en-US"]["title"] == "Movie 550"
+    assert "fr-FR" not in translations  # Solo los idiomas soportados
+
+
+def test_card_does_not_append_translations(fake_tmdb):
+    _, _, params = TMDBService._profile_request(551, "card")
+    assert "append_to_response" not in params
+
+    asyncio.run(TMDBService.get_movie_details(551, "card"))
+    assert _translations_key(551) not in TMDBService._cache
+
+
+def test_card_localized_after_translations_evicted(fake_tmdb):
+    async def scenario():
+        card = await TMDBService.get_movie_details(551, "card")
+        with use_language("en-US"):
+            await TMDBService.get_movie_details(551, "card")
+        TMDBService._cache.delete(_translations_key(551))
+        with use_language("en-US"):
+            localized = await TMDBService.get_movie_details(551, "card")
+        return card, localized
+
+    card, localized = asyncio.run(scenario())
+
+    assert localized["title"] == "Movie 551"
+    assert localized["id"] == card["id"] == 551
+
+
+def test_detail_splits_translations_into_own_entry(fake_tmdb):
+    detail = asyncio.run(TMDBService.get_movie_details(552, "detail"))
+
+    assert "translations" not in detail
+    assert _translations_key(552) in TMDBService._cache
+
+
+def test_localize_falls_back_on_any_error(fake_tmdb, monkeypatch):
+    async def broken(movie_id, timeout=None):
+        raise AttributeError("boom")
+
+    monkeypatch.setattr(TMDBService, "_get_translations", broken)
+    cached = CachedResponse.from_data({"id": 1, "title": "Película 1"})
+
+    with use_language("en-US"):
+        result = asyncio.run(TMDBService._localize(cached, 1))
+
+    assert result is cached
+
+
+def test_localize_keeps_default_language_for_empty_fields(fake_tmdb):
+    cached = CachedResponse.from_data({"id": 553, "title": "Película 553", "tagline": "Original"})
+
+    with use_language("en-US"):
+        result = asyncio.run(TMDBService._localize(cached, 553))
+
+    assert result.data["title"] == "Movie 553"
+    assert result.data["tagline"] == "Original"  # TMDB lo deja vacío en la traducción